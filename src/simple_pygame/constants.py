@@ -8,6 +8,9 @@ TransformModule = "TransformModule"
 TerminalModule = "TerminalModule"
 
 AudioClass = "AudioClass"
+MixerClass = "MixerClass"
+SoundClass = "SoundClass"
+PlaylistClass = "PlaylistClass"
 
 SInt8 = "SInt8"
 SInt16 = "SInt16"
@@ -22,4 +25,7 @@ AudioType = "AudioType"
 AudioIsLoading = "AudioIsLoading"
 AudioEnded = "AudioEnded"
 
-__all__ = ["__version__", "MixerModule", "TransformModule", "TerminalModule", "AudioClass", "SInt8", "SInt16", "SInt24", "SInt32", "UInt8", "VideoAndAudioType", "VideoType", "AudioType", "AudioIsLoading", "AudioEnded"]
+LinearInterpolation = "LinearInterpolation"
+SincInterpolation = "SincInterpolation"
+
+__all__ = ["__version__", "MixerModule", "TransformModule", "TerminalModule", "AudioClass", "MixerClass", "SoundClass", "PlaylistClass", "SInt8", "SInt16", "SInt24", "SInt32", "UInt8", "VideoAndAudioType", "VideoType", "AudioType", "AudioIsLoading", "AudioEnded", "LinearInterpolation", "SincInterpolation"]
@@ -4,7 +4,7 @@ A module for working with audio.
 import gc as _gc
 from typing import Iterable as _Iterable, Tuple as _Tuple
 
-from ..constants import AudioClass
+from ..constants import AudioClass, MixerClass, SoundClass, PlaylistClass
 
 def init(classes: _Iterable = []) -> _Tuple[str, ...]:
     """
@@ -31,6 +31,30 @@ def init(classes: _Iterable = []) -> _Tuple[str, ...]:
         except ImportError:
             pass
 
+    if classes_len == 0 or MixerClass in classes:
+        try:
+            global Mixer
+            from .mixer import Mixer
+            successfully_initialized.append(MixerClass)
+        except ImportError:
+            pass
+
+    if classes_len == 0 or SoundClass in classes:
+        try:
+            global Sound
+            from .sound import Sound
+            successfully_initialized.append(SoundClass)
+        except ImportError:
+            pass
+
+    if classes_len == 0 or PlaylistClass in classes:
+        try:
+            global Playlist
+            from .playlist import Playlist
+            successfully_initialized.append(PlaylistClass)
+        except ImportError:
+            pass
+
     return (*successfully_initialized,)
 
 def quit(classes: _Iterable = []) -> _Tuple[str, ...]:
@@ -58,5 +82,29 @@ def quit(classes: _Iterable = []) -> _Tuple[str, ...]:
         except NameError:
             pass
 
+    if classes_len == 0 or MixerClass in classes:
+        try:
+            global Mixer
+            del Mixer
+            successfully_uninitialized.append(MixerClass)
+        except NameError:
+            pass
+
+    if classes_len == 0 or SoundClass in classes:
+        try:
+            global Sound
+            del Sound
+            successfully_uninitialized.append(SoundClass)
+        except NameError:
+            pass
+
+    if classes_len == 0 or PlaylistClass in classes:
+        try:
+            global Playlist
+            del Playlist
+            successfully_uninitialized.append(PlaylistClass)
+        except NameError:
+            pass
+
     _gc.collect()
     return (*successfully_uninitialized,)
@@ -10,23 +10,38 @@ Requirements
 
 - FFprobe (optional).
 """
-import pyaudio as _pyaudio, subprocess as _subprocess, threading as _threading, time as _time, re as _re, os as _os
+import pyaudio as _pyaudio, subprocess as _subprocess, threading as _threading, asyncio as _asyncio, queue as _queue, time as _time, re as _re, os as _os
 from json import loads as _loads
+from locale import getpreferredencoding as _getpreferredencoding
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor, as_completed as _as_completed
 from sys import byteorder as _byteorder
-from typing import Optional as _Optional, Union as _Union, BinaryIO as _BinaryIO, Iterable as _Iterable, Tuple as _Tuple, List as _List, Dict as _Dict, Any as _Any
+from typing import Optional as _Optional, Union as _Union, BinaryIO as _BinaryIO, Iterable as _Iterable, Iterator as _Iterator, AsyncIterator as _AsyncIterator, Tuple as _Tuple, List as _List, Dict as _Dict, Any as _Any
 
 from ..constants import SInt8, SInt16, SInt24, SInt32, UInt8, VideoAndAudioType, VideoType, AudioType, AudioIsLoading, AudioEnded
 from ..exceptions import BytesDecodeError, NoOutputError, NoAudioError, FFmpegError, FFprobeError
+from .cache import PCMCache as _PCMCache, InformationCache as _InformationCache
+from .buffer import RingBuffer as _RingBuffer, ReadAhead as _ReadAhead
+from .output import default_context as _default_context
+from .probe import probe as _probe
+from .pcm import PCMReader as _PCMReader
 
 try:
-    from audioop import mul as _mul
+    from audioop import mul as _audioop_mul
+
+    def _mul(fragment: memoryview, width: int, factor: _Union[int, float], out: memoryview) -> memoryview:
+        out[:] = _audioop_mul(fragment, width, factor)
+        return out
 except ImportError:
     from .pyaudioop import mul as _mul
 
 class Audio:
-    def __init__(self, path: _Optional[_Union[str, _os.PathLike]] = None, stream: int = 0, chunk: int = 4096, frames_per_buffer: _Union[int, _Any] = _pyaudio.paFramesPerBufferUnspecified, data_format: _Any = SInt16, encoding: _Optional[str] = None, use_ffmpeg: bool = False, loglevel: str = "quiet", ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe") -> None:
+    information_cache = _InformationCache()
+    native_probe = True
+    pyaudio_context = _default_context
+
+    def __init__(self, path: _Optional[_Union[str, _os.PathLike]] = None, stream: int = 0, chunk: int = 4096, frames_per_buffer: _Union[int, _Any] = _pyaudio.paFramesPerBufferUnspecified, data_format: _Any = SInt16, encoding: _Optional[str] = None, use_ffmpeg: bool = False, loglevel: str = "quiet", ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe", cache: _Optional[_PCMCache] = None, look_ahead: _Union[int, float] = 0, use_callback: bool = False) -> None:
         """
-        An audio object that allows you to play streamed audio in a controllable way. The audio is decoded as it's being played and it never actually loaded all at once.
+        An audio object that allows you to play streamed audio in a controllable way. The audio is decoded as it's being played and it never actually loaded all at once. Uncompressed WAV files whose samples are stored in the output data format are memory-mapped and played without `ffmpeg`.
 
         Requirements
         ------------
@@ -59,6 +74,12 @@ class Audio:
         ffmpeg_path (optional): Path to `ffmpeg`.
 
         ffprobe_path (optional): Path to `ffprobe`.
+
+        cache (optional): A `simple_pygame.mixer.cache.PCMCache` object that stores the decoded audio, so later plays, loops and seeks don't need `ffmpeg`. Decoded audio isn't cached if the given cache is `None`.
+
+        look_ahead (optional): How much decoded audio in milliseconds a separate thread reads ahead, so a slow `ffmpeg` doesn't cause buffer underflows. Audio isn't read ahead if the given look-ahead is `0`.
+
+        use_callback (optional): Specifies whether to open the output stream in callback mode. PyAudio then pulls the read-ahead audio for every hardware buffer, so pausing, resuming and changing the volume take effect on the next hardware buffer. At least 4 chunks are read ahead in this mode.
         """
         if path != None:
             try:
@@ -97,6 +118,17 @@ class Audio:
         if not isinstance(ffprobe_path, str):
             raise TypeError("FFprobe path must be a string.")
 
+        if cache != None and not isinstance(cache, _PCMCache):
+            raise TypeError("Cache must be None/a PCMCache object.")
+
+        if not isinstance(look_ahead, (int, float)):
+            raise TypeError("Look-ahead must be an integer/a float.")
+        elif look_ahead < 0:
+            raise ValueError("Look-ahead must be non-negative.")
+
+        if not isinstance(use_callback, bool):
+            raise TypeError("Use callback must be a boolean.")
+
         self.path = path
         self.stream = stream
         self.chunk = chunk
@@ -107,8 +139,14 @@ class Audio:
         self.loglevel = loglevel
         self.ffmpeg_path = ffmpeg_path
         self.ffprobe_path = ffprobe_path
+        self.cache = cache
+        self.look_ahead = look_ahead
+        self.use_callback = use_callback
         self.input_options = ["-accurate_seek"]
         self.output_options = []
+        self.seek_window = 0.03
+        self.scrub_window = 2
+        self.native_reader = True
         self.is_paused = False
         self.exception = None
         self.returncode = None
@@ -117,9 +155,18 @@ class Audio:
         self.stream_information = None
         self._output_device_index = None
         self._audio_thread = None
+        self._read_ahead = None
         self._start = None
         self._reposition = False
+        self._scrubbing = False
+        self._scrub_buffer = None
         self._terminate = False
+        self._event = _threading.Event()
+        self._commands = _queue.SimpleQueue()
+        self._listeners = []
+        self._listeners_lock = _threading.Lock()
+        self._started = False
+        self._ended = True
 
         self._position = 0
         self._pause_offset = None
@@ -128,7 +175,9 @@ class Audio:
         self._chunk_length = None
         self._volume = 1.0
 
-        self._pa = _pyaudio.PyAudio()
+        # PortAudio is initialized once and shared by every audio object.
+        self._pyaudio_context = self.pyaudio_context
+        self._pa = self._pyaudio_context.acquire()
 
     @property
     def data_format(self) -> _Any:
@@ -163,6 +212,13 @@ class Audio:
     def is_paused(self, value: _Any) -> None:
         self._is_paused = value
 
+    @property
+    def is_scrubbing(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the audio is currently in scrub mode, otherwise `False`.
+        """
+        return self._scrubbing if self.is_busy else False
+
     @property
     def position(self) -> _Any:
         """
@@ -184,6 +240,8 @@ class Audio:
         if self.is_busy:
             self._position = 0 if position < 0 else position
             self._reposition = True
+            self._scrubbing = False
+            self.send_command("seek", self._position)
         else:
             self.play(start = position)
 
@@ -204,6 +262,14 @@ class Audio:
 
         self._volume = volume
 
+    @property
+    def buffer_fill(self) -> float:
+        """
+        A read-only attribute whose value is the fill level of the read-ahead buffer from `0` (empty) to `1` (full). It's `0` if the audio isn't playing or the look-ahead is `0`.
+        """
+        read_ahead = self._read_ahead
+        return read_ahead.buffer.fill if read_ahead and self.is_busy else 0
+
     @property
     def is_busy(self) -> bool:
         """
@@ -214,7 +280,7 @@ class Audio:
     @classmethod
     def get_information(self, path: _Union[str, _os.PathLike], encoding: _Optional[str] = None, use_ffmpeg: bool = False, executable_path: str = "ffprobe") -> _Dict[str, _Any]:
         """
-        Return a dict contains the file's information.
+        Return a dict contains the file's information. The information is cached in `Audio.information_cache` (a `simple_pygame.mixer.cache.InformationCache` object, or `None` to disable caching), so an unchanged file is only probed once. Use `invalidate_information()` to probe it again. WAV, FLAC and Ogg (Vorbis/Opus) files are read from their headers if `Audio.native_probe` is `True`, so `ffmpeg`/`ffprobe` is only run for other files.
 
         Parameters
         ----------
@@ -241,6 +307,174 @@ class Audio:
         if not isinstance(executable_path, str):
             raise TypeError("FFmpeg/FFprobe path must be a string.")
 
+        information_cache = self.information_cache
+        key = information_cache.get_key(path, encoding, bool(use_ffmpeg), executable_path) if information_cache != None else None
+        if key != None:
+            information = information_cache.get(key)
+            if information != None:
+                return information
+
+        information = self.probe_information(path, encoding, use_ffmpeg, executable_path)
+        if key != None:
+            information_cache.put(key, information)
+
+        return information
+
+    @classmethod
+    def get_information_many(self, paths: _Iterable[_Union[str, _os.PathLike]], encoding: _Optional[str] = None, use_ffmpeg: bool = False, executable_path: str = "ffprobe", max_workers: _Optional[int] = None) -> _Iterator[_Tuple[_Union[str, _os.PathLike], _Union[_Dict[str, _Any], Exception]]]:
+        """
+        Get the information of many files concurrently and return an iterator of `(path, information)` tuples in the order the files finish. If a file can't be probed, its information is the exception instead, so one bad file doesn't stop the others. The information is cached like `get_information()`, so only the files that aren't cached are probed.
+
+        Parameters
+        ----------
+
+        paths: Paths to the files to get information.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the files' information.
+
+        executable_path (optional): Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+
+        max_workers (optional): Maximum number of files that are probed at the same time. Use the number of CPUs if the given max workers is `None`.
+        """
+        try:
+            paths = list(paths)
+        except TypeError:
+            raise TypeError("Paths is not iterable.") from None
+
+        if max_workers != None and not isinstance(max_workers, int):
+            raise TypeError("Max workers must be None/an integer.")
+        elif max_workers != None and max_workers <= 0:
+            raise ValueError("Max workers must be greater than 0.")
+
+        return self.probe_many(paths, encoding, use_ffmpeg, executable_path, max_workers or _os.cpu_count() or 1)
+
+    @classmethod
+    def probe_many(self, paths: _List[_Union[str, _os.PathLike]], encoding: _Optional[str], use_ffmpeg: bool, executable_path: str, max_workers: int) -> _Iterator[_Tuple[_Union[str, _os.PathLike], _Union[_Dict[str, _Any], Exception]]]:
+        """
+        Yield the information of many files as the probes finish. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        paths: Paths to the files to get information.
+
+        encoding: Encoding for decoding.
+
+        use_ffmpeg: Specifies whether to use `ffmpeg` or `ffprobe` to get the files' information.
+
+        executable_path: Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+
+        max_workers: Maximum number of files that are probed at the same time.
+        """
+        # Each worker only waits for its ffmpeg/ffprobe, so the probes run in parallel.
+        executor = _ThreadPoolExecutor(min(max_workers, len(paths)) or 1)
+        futures = {}
+        try:
+            futures = {executor.submit(self.get_information, path, encoding, use_ffmpeg, executable_path): path for path in paths}
+
+            for future in _as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as exception:
+                    yield futures[future], exception
+        finally:
+            # Don't start the remaining probes if the iterator is closed early.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(False)
+
+            # The cache stores the whole batch at once.
+            if self.information_cache != None:
+                self.information_cache.flush()
+
+    @classmethod
+    async def aget_information(self, path: _Union[str, _os.PathLike], encoding: _Optional[str] = None, use_ffmpeg: bool = False, executable_path: str = "ffprobe") -> _Dict[str, _Any]:
+        """
+        Return a dict contains the file's information like `get_information()`, but `ffmpeg`/`ffprobe` is run with `asyncio`, so the event loop isn't blocked while the file is probed. It shares the cache of `get_information()`.
+
+        Parameters
+        ----------
+
+        path: Path to the file to get information.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        executable_path (optional): Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+        """
+        try:
+            path = _os.fspath(path)
+        except TypeError:
+            pass
+
+        if not isinstance(path, str):
+            raise TypeError("Path must be a string/a path-like object.")
+
+        if encoding != None and not isinstance(encoding, str):
+            raise TypeError("Encoding must be None/a string.")
+
+        if not isinstance(executable_path, str):
+            raise TypeError("FFmpeg/FFprobe path must be a string.")
+
+        information_cache = self.information_cache
+        key = information_cache.get_key(path, encoding, bool(use_ffmpeg), executable_path) if information_cache != None else None
+        if key != None:
+            information = information_cache.get(key)
+            if information != None:
+                return information
+
+        information = await self.aprobe_information(path, encoding, use_ffmpeg, executable_path)
+        if key != None:
+            information_cache.put(key, information)
+
+        return information
+
+    @classmethod
+    def invalidate_information(self, path: _Optional[_Union[str, _os.PathLike]] = None) -> None:
+        """
+        Forget the cached information of a file, so the next `get_information()` probes it again.
+
+        Parameters
+        ----------
+
+        path (optional): Path to the file. Forget every file if the given path is `None`.
+        """
+        if path != None:
+            try:
+                path = _os.fspath(path)
+            except TypeError:
+                pass
+
+            if not isinstance(path, str):
+                raise TypeError("Path must be None/a string/a path-like object.")
+
+        if self.information_cache != None:
+            self.information_cache.invalidate(path)
+
+    @classmethod
+    def probe_information(self, path: str, encoding: _Optional[str] = None, use_ffmpeg: bool = False, executable_path: str = "ffprobe") -> _Dict[str, _Any]:
+        """
+        Return a dict contains the file's information from its headers or `ffmpeg`/`ffprobe` without using the cache. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        path: Path to the file to get information.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        executable_path (optional): Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+        """
+        if self.native_probe:
+            information = _probe(path)
+            if information != None:
+                return information
+
         try:
             startupinfo = _subprocess.STARTUPINFO(dwFlags = _subprocess.CREATE_NO_WINDOW)
             creationflags = _subprocess.CREATE_NO_WINDOW
@@ -250,7 +484,7 @@ class Audio:
 
         if use_ffmpeg:
             try:
-                result = _subprocess.run((executable_path, "-i", path), stderr = _subprocess.PIPE, startupinfo = startupinfo, creationflags = creationflags, encoding = encoding, text = True)
+                result = _subprocess.run(self.get_probe_arguments(path, use_ffmpeg, executable_path), stderr = _subprocess.PIPE, startupinfo = startupinfo, creationflags = creationflags, encoding = encoding, text = True)
             except FileNotFoundError:
                 raise FFmpegError("No ffmpeg found on your system. Make sure you've it installed and you can try specifying the ffmpeg path.") from None
             except LookupError:
@@ -258,14 +492,10 @@ class Audio:
             except UnicodeError:
                 raise BytesDecodeError(f"""{'Default encoding' if encoding == None else f'Encoding "{encoding}"'} cannot decode the file's information (as bytes) returned by ffmpeg. You can try using other encodings.""") from None
 
-            raw_data = result.stderr.split("\n")[:-1]
-            if raw_data[-1] != "At least one output file must be specified":
-                raise FFmpegError(raw_data[-1])
-
-            return self.extract_information(raw_data)
+            return self.parse_ffmpeg_information(result.stderr)
         else:
             try:
-                return _loads(_subprocess.run((executable_path, "-print_format", "json", "-show_format", "-show_programs", "-show_streams", "-show_chapters", "-i", path), stdout = _subprocess.PIPE, stderr = _subprocess.DEVNULL, startupinfo = startupinfo, creationflags = creationflags, check = True, encoding = encoding, text = True).stdout)
+                return _loads(_subprocess.run(self.get_probe_arguments(path, use_ffmpeg, executable_path), stdout = _subprocess.PIPE, stderr = _subprocess.DEVNULL, startupinfo = startupinfo, creationflags = creationflags, check = True, encoding = encoding, text = True).stdout)
             except FileNotFoundError:
                 raise FFprobeError("No ffprobe found on your system. Make sure you've it installed and you can try specifying the ffprobe path.") from None
             except _subprocess.CalledProcessError:
@@ -275,6 +505,90 @@ class Audio:
             except UnicodeError:
                 raise BytesDecodeError(f"""{'Default encoding' if encoding == None else f'Encoding "{encoding}"'} cannot decode the file's information (as bytes) returned by ffprobe. You can try using other encodings.""") from None
 
+    @classmethod
+    async def aprobe_information(self, path: str, encoding: _Optional[str] = None, use_ffmpeg: bool = False, executable_path: str = "ffprobe") -> _Dict[str, _Any]:
+        """
+        Return a dict contains the file's information from its headers or `ffmpeg`/`ffprobe` run with `asyncio`, without using the cache. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        path: Path to the file to get information.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        executable_path (optional): Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+        """
+        if self.native_probe:
+            # Reading the headers blocks on the disk, so it runs in an executor.
+            information = await _asyncio.get_running_loop().run_in_executor(None, _probe, path)
+            if information != None:
+                return information
+
+        try:
+            startupinfo = _subprocess.STARTUPINFO(dwFlags = _subprocess.CREATE_NO_WINDOW)
+            creationflags = _subprocess.CREATE_NO_WINDOW
+        except AttributeError:
+            startupinfo = None
+            creationflags = 0
+
+        try:
+            process = await _asyncio.create_subprocess_exec(*self.get_probe_arguments(path, use_ffmpeg, executable_path), stdin = _subprocess.DEVNULL, stdout = _subprocess.DEVNULL if use_ffmpeg else _subprocess.PIPE, stderr = _subprocess.PIPE if use_ffmpeg else _subprocess.DEVNULL, startupinfo = startupinfo, creationflags = creationflags)
+        except FileNotFoundError:
+            if use_ffmpeg:
+                raise FFmpegError("No ffmpeg found on your system. Make sure you've it installed and you can try specifying the ffmpeg path.") from None
+            raise FFprobeError("No ffprobe found on your system. Make sure you've it installed and you can try specifying the ffprobe path.") from None
+
+        stdout, stderr = await process.communicate()
+        if not use_ffmpeg and process.returncode != 0:
+            raise FFprobeError("Invalid ffprobe path or path or data.")
+
+        try:
+            # Decode like a subprocess in text mode, which uses the locale's encoding by default and translates newlines.
+            output = (stderr if use_ffmpeg else stdout).decode(_getpreferredencoding(False) if encoding == None else encoding).replace("\r\n", "\n")
+        except LookupError:
+            raise ValueError("Invalid encoding.") from None
+        except UnicodeError:
+            raise BytesDecodeError(f"""{'Default encoding' if encoding == None else f'Encoding "{encoding}"'} cannot decode the file's information (as bytes) returned by {'ffmpeg' if use_ffmpeg else 'ffprobe'}. You can try using other encodings.""") from None
+
+        return self.parse_ffmpeg_information(output) if use_ffmpeg else _loads(output)
+
+    @staticmethod
+    def get_probe_arguments(path: str, use_ffmpeg: bool, executable_path: str) -> _Tuple[str, ...]:
+        """
+        Return the arguments to run `ffmpeg`/`ffprobe` with to get the file's information. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        path: Path to the file to get information.
+
+        use_ffmpeg: Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        executable_path: Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+        """
+        if use_ffmpeg:
+            return executable_path, "-i", path
+        return executable_path, "-print_format", "json", "-show_format", "-show_programs", "-show_streams", "-show_chapters", "-i", path
+
+    @classmethod
+    def parse_ffmpeg_information(self, output: str) -> _Dict[str, _Any]:
+        """
+        Return a dict contains the file's information from the stderr of `ffmpeg`. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        output: The stderr of `ffmpeg`.
+        """
+        raw_data = output.split("\n")[:-1]
+        if raw_data[-1] != "At least one output file must be specified":
+            raise FFmpegError(raw_data[-1])
+
+        return self.extract_information(raw_data)
+
     @staticmethod
     def extract_information(raw_data: _Iterable[str]) -> _Dict[str, _Any]:
         """
@@ -597,7 +911,41 @@ class Audio:
         except FileNotFoundError:
             raise FFmpegError("No ffmpeg found on your system. Make sure you've it installed and you can try specifying the ffmpeg path.") from None
 
-    def change_attributes(self, path: _Optional[_Union[str, _os.PathLike]] = None, stream: int = 0, chunk: int = 4096, frames_per_buffer: _Union[int, _Any] = _pyaudio.paFramesPerBufferUnspecified, data_format: _Any = SInt16, encoding: _Optional[str] = None, use_ffmpeg: bool = False, loglevel: str = "quiet", ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe") -> None:
+    def open_native_reader(self, path: str, data_format: str, encoding: _Optional[str] = None, use_ffmpeg: bool = False, executable_path: str = "ffprobe") -> _Optional[_PCMReader]:
+        """
+        Return a `simple_pygame.mixer.pcm.PCMReader` object that reads the samples of a WAV file directly if they're stored in a data format, otherwise `None`. Reading and seeking it don't need `ffmpeg`. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        path: Path to the file.
+
+        data_format: Output data format for `ffmpeg`.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        executable_path (optional): Path to `ffmpeg`/`ffprobe` depends on the value of `use_ffmpeg`.
+        """
+        reader = _PCMReader.open_wav(path, data_format)
+        if not reader:
+            return None
+
+        try:
+            information = self.get_information(path, encoding, use_ffmpeg, executable_path)
+            audio_streams = self.get_specific_codec_type(information, AudioType)
+
+            if len(audio_streams) == 0:
+                raise NoAudioError("The file doesn't contain audio.")
+        except Exception:
+            reader.close()
+            raise
+
+        reader.information, reader.stream_information = information, audio_streams[0]
+        return reader
+
+    def change_attributes(self, path: _Optional[_Union[str, _os.PathLike]] = None, stream: int = 0, chunk: int = 4096, frames_per_buffer: _Union[int, _Any] = _pyaudio.paFramesPerBufferUnspecified, data_format: _Any = SInt16, encoding: _Optional[str] = None, use_ffmpeg: bool = False, loglevel: str = "quiet", ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe", cache: _Optional[_PCMCache] = None, look_ahead: _Union[int, float] = 0, use_callback: bool = False) -> None:
         """
         An easier way to change some attributes.
 
@@ -623,6 +971,12 @@ class Audio:
         ffmpeg_path (optional): Path to `ffmpeg`.
 
         ffprobe_path (optional): Path to `ffprobe`.
+
+        cache (optional): A `simple_pygame.mixer.cache.PCMCache` object that stores the decoded audio, so later plays, loops and seeks don't need `ffmpeg`. Decoded audio isn't cached if the given cache is `None`.
+
+        look_ahead (optional): How much decoded audio in milliseconds a separate thread reads ahead, so a slow `ffmpeg` doesn't cause buffer underflows. Audio isn't read ahead if the given look-ahead is `0`.
+
+        use_callback (optional): Specifies whether to open the output stream in callback mode. PyAudio then pulls the read-ahead audio for every hardware buffer, so pausing, resuming and changing the volume take effect on the next hardware buffer. At least 4 chunks are read ahead in this mode.
         """
         if path != None:
             try:
@@ -661,6 +1015,17 @@ class Audio:
         if not isinstance(ffprobe_path, str):
             raise TypeError("FFprobe path must be a string.")
 
+        if cache != None and not isinstance(cache, _PCMCache):
+            raise TypeError("Cache must be None/a PCMCache object.")
+
+        if not isinstance(look_ahead, (int, float)):
+            raise TypeError("Look-ahead must be an integer/a float.")
+        elif look_ahead < 0:
+            raise ValueError("Look-ahead must be non-negative.")
+
+        if not isinstance(use_callback, bool):
+            raise TypeError("Use callback must be a boolean.")
+
         self.path = path
         self.stream = stream
         self.chunk = chunk
@@ -671,6 +1036,9 @@ class Audio:
         self.loglevel = loglevel
         self.ffmpeg_path = ffmpeg_path
         self.ffprobe_path = ffprobe_path
+        self.cache = cache
+        self.look_ahead = look_ahead
+        self.use_callback = use_callback
 
     def set_format(self, data_format: _Any = SInt16) -> None:
         """
@@ -733,7 +1101,7 @@ class Audio:
 
         return self._pa.get_device_info_by_index(device_index)
 
-    def play(self, loop: int = 0, start: _Union[int, float] = 0, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None, exception_on_underflow: bool = False, information: _Optional[_Dict[str, _Any]] = None, stream_information: _Optional[_Dict[str, _Any]] = None) -> None:
+    def play(self, loop: int = 0, start: _Union[int, float] = 0, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None, exception_on_underflow: bool = False, information: _Optional[_Dict[str, _Any]] = None, stream_information: _Optional[_Dict[str, _Any]] = None, seamless_loop: bool = True) -> None:
         """
         Start the audio. If the audio is currently playing it will be restarted.
 
@@ -744,15 +1112,17 @@ class Audio:
 
         start (optional): Where the audio starts playing in seconds.
 
-        delay (optional): Interval between each check to determine if the audio has resumed when it's currently paused in seconds.
+        delay (optional): Interval between each check to determine if the audio has resumed when it's currently paused in seconds. In callback mode, it's the longest interval between each check of the audio thread.
 
         daemon (optional): Specifies whether the audio thread is a daemon thread.
 
-        exception_on_underflow (optional): Specifies whether an exception should be thrown (or silently ignored) on buffer underflow. Defaults to `False` for improved performance, especially on slower platforms.
+        exception_on_underflow (optional): Specifies whether an exception should be thrown (or silently ignored) on buffer underflow. Defaults to `False` for improved performance, especially on slower platforms. It's ignored in callback mode, buffer underflows are filled with silence.
 
         information (optional): The file's information. Use the information returned by `create_pipe()` if the given information is `None`.
 
         stream_information (optional): The stream's information. Use the stream information returned by `create_pipe()` if the given stream information is `None`.
+
+        seamless_loop (optional): Specifies whether `ffmpeg` (or the cache) repeats the audio by itself, so the loops play without a gap instead of restarting `ffmpeg` at the end of every loop.
         """
         self.stop()
 
@@ -781,6 +1151,9 @@ class Audio:
         if stream_information != None and not isinstance(stream_information, dict):
             raise TypeError("Stream information must be None/a dict.")
 
+        if not isinstance(seamless_loop, bool):
+            raise TypeError("Seamless loop must be a boolean.")
+
         self.is_paused = False
         self.exception = None
         self.returncode = None
@@ -789,7 +1162,10 @@ class Audio:
         self.stream_information = stream_information
         self._start = None
         self._reposition = False
+        self._scrubbing = False
         self._terminate = False
+        self._event.clear()
+        self._commands = _queue.SimpleQueue()
 
         self._position = 0 if start < 0 else start
         self._pause_offset = None
@@ -797,15 +1173,72 @@ class Audio:
         self._chunk_time = None
         self._chunk_length = None
 
-        self._audio_thread = _threading.Thread(target = self.audio, args = (self.path, loop, self.stream, delay, daemon, exception_on_underflow), daemon = daemon)
+        with self._listeners_lock:
+            self._started = False
+            self._ended = False
+
+        self._audio_thread = _threading.Thread(target = self.audio, args = (self.path, loop, self.stream, delay, daemon, exception_on_underflow, seamless_loop), daemon = daemon)
         self._audio_thread.start()
 
+    async def aplay(self, loop: int = 0, start: _Union[int, float] = 0, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None, exception_on_underflow: bool = False, information: _Optional[_Dict[str, _Any]] = None, stream_information: _Optional[_Dict[str, _Any]] = None, seamless_loop: bool = True) -> None:
+        """
+        Start the audio like `play()` without blocking the event loop and return once the audio starts playing. The file is probed with `aget_information()` first, so the audio thread finds its information in the cache. If the audio fails to start, raise the exception.
+
+        Parameters
+        ----------
+
+        loop (optional): How many times to repeat the audio. If the given loop is `-1` repeats indefinitely.
+
+        start (optional): Where the audio starts playing in seconds.
+
+        delay (optional): Interval between each check to determine if the audio has resumed when it's currently paused in seconds. In callback mode, it's the longest interval between each check of the audio thread.
+
+        daemon (optional): Specifies whether the audio thread is a daemon thread.
+
+        exception_on_underflow (optional): Specifies whether an exception should be thrown (or silently ignored) on buffer underflow.
+
+        information (optional): The file's information. Use the information returned by `create_pipe()` if the given information is `None`.
+
+        stream_information (optional): The stream's information. Use the stream information returned by `create_pipe()` if the given stream information is `None`.
+
+        seamless_loop (optional): Specifies whether `ffmpeg` (or the cache) repeats the audio by itself, so the loops play without a gap.
+        """
+        if self.path != None and information == None and self.information_cache != None:
+            await self.aget_information(self.path, self.encoding, self.use_ffmpeg, self.ffmpeg_path if self.use_ffmpeg else self.ffprobe_path)
+
+        # Stopping the previous audio waits for its thread.
+        event_loop = _asyncio.get_running_loop()
+        await event_loop.run_in_executor(None, lambda: self.play(loop, start, delay, daemon, exception_on_underflow, information, stream_information, seamless_loop))
+
+        queue = _asyncio.Queue()
+        listener = event_loop, queue
+
+        # The audio may have started before the listener is added.
+        with self._listeners_lock:
+            started, ended = self._started, self._ended
+            if not started and not ended:
+                self._listeners.append(listener)
+
+        try:
+            while not started and not ended:
+                event = await queue.get()
+                started, ended = event == "start", event == "end"
+        finally:
+            with self._listeners_lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        if not started:
+            self.get_exception()
+
     def pause(self) -> None:
         """
         Pause the audio if it's currently playing and not paused. It can be resumed with `resume()`.
         """
         if self.is_busy and not self.is_paused:
             self.is_paused = True
+            self.send_command("pause")
+            self.emit("pause")
 
     def resume(self) -> None:
         """
@@ -818,15 +1251,58 @@ class Audio:
         if self._pause_offset != None:
             self._start = _time.monotonic_ns() - self.seconds_to_nanoseconds(self._pause_offset)
         self._pause_offset = None
+        self.send_command("resume")
+        self.emit("resume")
+
+    def scrub(self, position: _Union[int, float], length: _Union[int, float] = 0.1) -> None:
+        """
+        Play a short preview of the audio at a position, e.g. while a seek bar is being dragged. The first call enters scrub mode, which stops the normal playback until `end_scrub()` or `set_position()` is called. The previews are read from the cache if the audio is cached, otherwise `scrub_window` seconds of audio around the position are decoded once and kept in memory, so `ffmpeg` only runs again when a preview is outside of them. Only the latest position is previewed if the previews are requested faster than they're played.
+
+        Parameters
+        ----------
+
+        position: Where to preview the audio in seconds.
+
+        length (optional): Length of the preview in seconds.
+        """
+        if not isinstance(position, (int, float)):
+            raise TypeError("Position must be an integer/a float.")
+
+        if not isinstance(length, (int, float)):
+            raise TypeError("Length must be an integer/a float.")
+        elif length <= 0:
+            raise ValueError("Length must be greater than 0.")
+
+        if not self.is_busy:
+            return
+
+        self._position = 0 if position < 0 else position
+        self._scrubbing = True
+        self.send_command("scrub", self._position, length)
+
+    def end_scrub(self, position: _Optional[_Union[int, float]] = None) -> None:
+        """
+        Leave scrub mode and continue playing the audio normally.
+
+        Parameters
+        ----------
+
+        position (optional): Where to continue playing the audio in seconds. Use the latest scrubbed position if the given position is `None`.
+        """
+        if position != None and not isinstance(position, (int, float)):
+            raise TypeError("Position must be None/an integer/a float.")
+
+        if self.is_scrubbing:
+            self.position = self._position if position == None else position
 
     def stop(self, delay: _Union[int, float] = 0.1) -> None:
         """
-        Stop the audio if it's currently playing.
+        Stop the audio if it's currently playing and wait for the audio thread to end.
 
         Parameters
         ----------
 
-        delay (optional): Interval between each check to determine if the audio is currently busy in seconds.
+        delay (optional): Kept for compatibility, the audio thread is woken up and joined instead of being checked at intervals.
         """
         if not isinstance(delay, (int, float)):
             raise TypeError("Delay must be an integer/a float.")
@@ -837,9 +1313,49 @@ class Audio:
             return
 
         self._terminate = True
-        while self.is_busy:
-            _time.sleep(delay)
-        self._audio_thread = None
+        self.send_command("stop")
+
+        # The audio thread can't join itself.
+        if self._audio_thread is not _threading.current_thread():
+            self._audio_thread.join()
+            self._audio_thread = None
+
+    def send_command(self, command: str, *arguments: _Any) -> None:
+        """
+        Queue a command for the audio thread and wake it up. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        command: The command's name, `"seek"`, `"scrub"`, `"pause"`, `"resume"` or `"stop"`.
+
+        arguments: The command's arguments.
+        """
+        self._commands.put((command, *arguments))
+        self._event.set()
+
+    def emit(self, event: str) -> None:
+        """
+        Send a playback event to every iterator returned by `events()`. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        event: The event's name.
+        """
+        with self._listeners_lock:
+            if event == "start":
+                self._started = True
+            elif event == "end":
+                self._ended = True
+            listeners = (*self._listeners,)
+
+        for loop, queue in listeners:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # The event loop is closed.
+                pass
 
     def join(self, timeout: _Optional[_Union[int, float]] = None, raise_exception: bool = True) -> None:
         """
@@ -862,6 +1378,51 @@ class Audio:
             return
         self.get_exception()
 
+    async def wait_finished(self, raise_exception: bool = True) -> None:
+        """
+        Wait until the audio stops without blocking the event loop.
+
+        Parameters
+        ----------
+
+        raise_exception (optional): Specifies whether an exception should be thrown (or silently ignored).
+        """
+        audio_thread = self._audio_thread
+
+        async for event in self.events():
+            pass
+
+        # The audio thread ends right after its last event, it's joined in an executor, so the event loop isn't blocked meanwhile.
+        if audio_thread:
+            await _asyncio.get_running_loop().run_in_executor(None, audio_thread.join)
+
+        if not raise_exception:
+            return
+        self.get_exception()
+
+    async def events(self) -> _AsyncIterator[str]:
+        """
+        Return an asynchronous iterator of the playback events of the current audio, which ends after the `"end"` event. The events are `"start"` when the audio starts playing, `"pause"`, `"resume"`, `"seek"` when a seek takes effect, `"loop"` when a loop starts and `"end"` when the audio stops. It ends right away if the audio isn't playing.
+        """
+        queue = _asyncio.Queue()
+        listener = _asyncio.get_running_loop(), queue
+
+        with self._listeners_lock:
+            if self._ended:
+                return
+            self._listeners.append(listener)
+
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+
+                if event == "end":
+                    break
+        finally:
+            with self._listeners_lock:
+                self._listeners.remove(listener)
+
     def get_pause(self) -> bool:
         """
         Return `True` if the audio is currently paused, otherwise `False`.
@@ -870,7 +1431,7 @@ class Audio:
 
     def set_position(self, position: _Union[int, float]) -> None:
         """
-        Set the audio's position where the audio will continue to play. This is equal to calling `play(start = position)` if the audio isn't playing.
+        Set the audio's position where the audio will continue to play. This is equal to calling `play(start = position)` if the audio isn't playing. Positions set within `seek_window` seconds of each other are coalesced, so only the latest one restarts the decoding.
 
         Parameters
         ----------
@@ -902,6 +1463,12 @@ class Audio:
         """
         return self.volume
 
+    def get_buffer_fill(self) -> float:
+        """
+        Return the fill level of the read-ahead buffer from `0` (empty) to `1` (full). Return `0` if the audio isn't playing or the look-ahead is `0`.
+        """
+        return self.buffer_fill
+
     def get_busy(self) -> bool:
         """
         Return `True` if the audio is currently playing or paused, otherwise `False`.
@@ -932,9 +1499,12 @@ class Audio:
         Clean up everything. Be sure to call this method for every instance of the `Audio` class.
         """
         self.stop()
-        self._pa.terminate()
 
-    def audio(self, path: _Union[str, _os.PathLike], loop: int = 0, stream: int = 0, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None, exception_on_underflow: bool = False) -> None:
+        if self._pa:
+            self._pyaudio_context.release()
+            self._pa = None
+
+    def audio(self, path: _Union[str, _os.PathLike], loop: int = 0, stream: int = 0, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None, exception_on_underflow: bool = False, seamless_loop: bool = True) -> None:
         """
         Start the audio. This function is meant for use by the class and not for general use.
 
@@ -952,8 +1522,10 @@ class Audio:
         daemon (optional): Specifies whether the read thread is a daemon thread.
 
         exception_on_underflow (optional): Specifies whether an exception should be thrown (or silently ignored) on buffer underflow. Defaults to `False` for improved performance, especially on slower platforms.
+
+        seamless_loop (optional): Specifies whether `ffmpeg` (or the cache) repeats the audio by itself, so the loops play without a gap.
         """
-        def create_pipe_wrapper(previous_pipe: _Optional[_subprocess.Popen] = None, read_thread: _Optional[_threading.Thread] = None, create_new_pipe: bool = True) -> _Optional[_Tuple[_subprocess.Popen, _threading.Thread]]:
+        def create_pipe_wrapper(previous_pipe: _Optional[_subprocess.Popen] = None, read_thread: _Optional[_threading.Thread] = None, create_new_pipe: bool = True, repeat: bool = False) -> _Optional[_Tuple[_subprocess.Popen, _threading.Thread]]:
             """
             A wrapper for `create_pipe()`. This function closes the previous pipe (if it's given) then it returns a pipe contains the output of `ffmpeg` with a `threading.Thread` object (if `create_new_pipe` is `True`).
 
@@ -965,7 +1537,11 @@ class Audio:
             read_thread (optional): The `threading.Thread` object returned by `create_pipe_wrapper()` in the previous call. If it's given, clean it up.
 
             create_new_pipe (optional): Specifies whether to create and return a new pipe.
+
+            repeat (optional): Specifies whether `ffmpeg` repeats the audio for the remaining loops with `-stream_loop`.
             """
+            nonlocal looping
+
             if previous_pipe:
                 previous_pipe.stdout.close()
                 previous_pipe.terminate()
@@ -981,7 +1557,11 @@ class Audio:
             if not create_new_pipe:
                 return
 
-            pipe, information, stream_information = self.create_pipe(path, position, stream, encoding, ffmpeg_format, use_ffmpeg, loglevel, ffmpeg_path, ffprobe_path, input_options, output_options)
+            # The loops after the first one start from the beginning of the file, even if the first one starts from a position.
+            looping = repeat and loop != 0
+            pipe_input_options = [*input_options, "-stream_loop", str(loop)] if looping else input_options
+
+            pipe, information, stream_information = self.create_pipe(path, position, stream, encoding, ffmpeg_format, use_ffmpeg, loglevel, ffmpeg_path, ffprobe_path, pipe_input_options, output_options)
             if self.information == None:
                 self.information = information
             if self.stream_information == None:
@@ -1003,80 +1583,428 @@ class Audio:
             """
             self.stderr = stderr.read()
 
+        def read_source(buffer: memoryview) -> int:
+            """
+            Read decoded audio from the cache or the pipe into a buffer, store it in the cache if it's being filled and return how many bytes were read.
+
+            Parameters
+            ----------
+
+            buffer: A writable `memoryview` object.
+            """
+            nonlocal reader_loop
+
+            if reader:
+                size = reader.readinto(buffer)
+                if not size and looping and reader_loop != 0:
+                    # Repeat the cached audio from memory, without stopping the read.
+                    reader_loop -= 1 if reader_loop > 0 else 0
+                    reader.seek(0)
+                    size = reader.readinto(buffer)
+            else:
+                size = pipe.stdout.readinto(buffer)
+
+            if size and writer:
+                writer.write(buffer[:size])
+
+            return size
+
+        def seek_reader(position: _Union[int, float]) -> None:
+            """
+            Move the cache reader to a position and let it repeat the audio for the remaining loops.
+
+            Parameters
+            ----------
+
+            position: The position in seconds.
+            """
+            nonlocal looping, reader_loop
+
+            reader.seek(get_offset(position))
+            looping, reader_loop = seamless_loop and loop != 0, loop
+
+        def wrap_position() -> None:
+            """
+            Move the position back to the start of the audio when it passes the end of a loop that the pipe or the cache reader repeats by itself.
+            """
+            nonlocal loop
+
+            while looping and loop != 0 and self._duration and self._chunk_time >= self._duration:
+                self._chunk_time -= self._duration
+                if loop > 0:
+                    loop -= 1
+                self.emit("loop")
+
+        def start_read_ahead() -> _Optional[_ReadAhead]:
+            """
+            Return a `ReadAhead` object that reads the decoded audio ahead, or `None` if the look-ahead is `0`.
+            """
+            self._read_ahead = _ReadAhead(read_source, look_ahead_size, chunk, daemon) if look_ahead_size else None
+            return self._read_ahead
+
+        def stop_read_ahead(read_ahead: _Optional[_ReadAhead]) -> None:
+            """
+            Stop a `ReadAhead` object returned by `start_read_ahead()` and wait for its thread.
+
+            Parameters
+            ----------
+
+            read_ahead: The `ReadAhead` object to stop. Do nothing if it's `None`.
+            """
+            if not read_ahead:
+                return
+            self._read_ahead = None
+
+            read_ahead.stop()
+            # The thread may be waiting for ffmpeg, stopping ffmpeg ends the read.
+            if pipe and not read_ahead.is_finished:
+                pipe.terminate()
+
+            read_ahead.join()
+
+        def callback(in_data: None, frame_count: int, time_info: _Dict[str, float], status: int) -> _Tuple[bytes, int]:
+            """
+            Fill the next hardware buffer with the read-ahead audio, or with silence if the audio is paused or the read-ahead buffer is empty. PyAudio calls this function in callback mode.
+
+            Parameters
+            ----------
+
+            in_data: Recorded data, it's `None` for an output stream.
+
+            frame_count: Number of frames in the hardware buffer.
+
+            time_info: Timing information of the hardware buffer.
+
+            status: PortAudio status flags.
+            """
+            data = bytearray(silence * (frame_count * frame_size))
+
+            try:
+                read_ahead = self._read_ahead
+                scrubbing = self._scrubbing
+                source = self._scrub_buffer if scrubbing else read_ahead.buffer if read_ahead else None
+
+                with position_lock:
+                    if self.is_paused and not scrubbing:
+                        if self._pause_offset == None:
+                            self._pause_offset = min(self.nanoseconds_to_seconds(max(_time.monotonic_ns() - self._start, 0)), self._chunk_length) if self._start != None else 0
+                        return bytes(data), _pyaudio.paContinue
+
+                    size = 0
+                    if source:
+                        # Only whole frames are moved, so a partial read from ffmpeg doesn't shift the next frames.
+                        available = source.size
+                        size = source.readinto(memoryview(data)[:min(len(data), available - available % frame_size)], False)
+
+                    if size:
+                        volume = self._volume
+                        if volume != 1:
+                            view = memoryview(data)[:size]
+                            _mul(view, audioop_format, volume, view)
+
+                        if self._start != None:
+                            self._chunk_time += self._chunk_length
+                            wrap_position()
+                        self._chunk_length = size / (frame_size * sample_rate)
+                        self._start = _time.monotonic_ns()
+
+                if not scrubbing and read_ahead and read_ahead.buffer.is_finished:
+                    self._event.set()
+                return bytes(data), _pyaudio.paContinue
+            except Exception as exception:
+                self.exception = exception
+                self._terminate = True
+                self._event.set()
+                return bytes(data), _pyaudio.paAbort
+
+        def get_offset(position: _Union[int, float]) -> int:
+            """
+            Return the offset in bytes of a position in the cached audio.
+
+            Parameters
+            ----------
+
+            position: The position in seconds.
+            """
+            return int(position * sample_rate) * audioop_format * channels
+
+        def get_preview(position: _Union[int, float], length: _Union[int, float]) -> bytearray:
+            """
+            Return the decoded audio at a position for scrub mode, read from the cache or from the decoded audio around a previous preview if possible.
+
+            Parameters
+            ----------
+
+            position: The position in seconds.
+
+            length: Length of the preview in seconds.
+            """
+            nonlocal scrub_start, scrub_window, scrub_data
+
+            data = bytearray(get_offset(length))
+            if reader:
+                reader.seek(get_offset(position))
+                return data[:reader.readinto(memoryview(data))]
+
+            window = max(self.scrub_window, length)
+            offset = get_offset(position) - get_offset(scrub_start)
+
+            # A window that is shorter than requested ends at the end of the audio.
+            if scrub_data == None or offset < 0 or offset + len(data) > len(scrub_data) and len(scrub_data) >= get_offset(scrub_window):
+                scrub_start = max(position - window / 2, 0)
+                scrub_window = window
+                preview_pipe = self.create_pipe(path, scrub_start, stream, encoding, ffmpeg_format, use_ffmpeg, loglevel, ffmpeg_path, ffprobe_path, input_options, [*output_options, "-t", str(window)])[0]
+                scrub_data = preview_pipe.communicate()[0]
+                offset = get_offset(position) - get_offset(scrub_start)
+
+            data = scrub_data[offset:offset + len(data)]
+            return bytearray(data[:len(data) - len(data) % frame_size])
+
         try:
-            chunk, frames_per_buffer, encoding, use_ffmpeg, ffmpeg_path, ffprobe_path, loglevel, input_options, output_options = self.chunk, self.frames_per_buffer, self.encoding, self.use_ffmpeg, self.ffmpeg_path, self.ffprobe_path, self.loglevel, self.input_options, self.output_options
+            chunk, frames_per_buffer, encoding, use_ffmpeg, ffmpeg_path, ffprobe_path, loglevel, input_options, output_options, cache, look_ahead, use_callback = self.chunk, self.frames_per_buffer, self.encoding, self.use_ffmpeg, self.ffmpeg_path, self.ffprobe_path, self.loglevel, self.input_options, self.output_options, self.cache, self.look_ahead, self.use_callback
             pyaudio_format, ffmpeg_format, audioop_format = self.pyaudio_format, self.ffmpeg_format, self.audioop_format
 
             position = 0 if self._position < 0 else self._position
-            pipe, read_thread = create_pipe_wrapper()
+            pipe, read_thread, reader, writer, read_ahead = None, None, None, None, None
+            looping, reader_loop = False, 0
+            scrub_start, scrub_window, scrub_data, scrubbed = 0, 0, None, False
+
+            cache_key = None
+            # The options can only be ignored if they don't change the samples.
+            if self.native_reader and not output_options and all((option == "-accurate_seek" for option in input_options)):
+                reader = self.open_native_reader(path, ffmpeg_format, encoding, use_ffmpeg, ffmpeg_path if use_ffmpeg else ffprobe_path)
+
+            if not reader:
+                cache_key = cache.get_key(path, stream, ffmpeg_format, input_options, output_options) if cache != None else None
+                if cache_key != None:
+                    reader = cache.open(cache_key)
+
+            if reader:
+                if self.information == None:
+                    self.information = reader.information
+                if self.stream_information == None:
+                    self.stream_information = reader.stream_information
+            else:
+                # Only a decode from the start can fill the cache, it isn't repeated by ffmpeg, so the cache only stores one loop.
+                fill_cache = cache_key != None and position == 0
+                pipe, read_thread = create_pipe_wrapper(repeat = seamless_loop and not fill_cache)
+
+                if fill_cache:
+                    writer = cache.create_writer(cache_key)
 
             sample_rate, channels = int(self.stream_information["sample_rate"]), int(self.stream_information["channels"])
-            stream_out = self._pa.open(sample_rate, channels, pyaudio_format, output = True, output_device_index = self._output_device_index, frames_per_buffer = frames_per_buffer)
+            if reader:
+                seek_reader(position)
+
+            frame_size = audioop_format * channels
+            look_ahead_size = max(-(-int(look_ahead * sample_rate) // 1000) * frame_size, chunk) if look_ahead > 0 else 0
+            if use_callback:
+                # The callback only reads the read-ahead buffer.
+                look_ahead_size = max(look_ahead_size, chunk * 4)
+            read_ahead = start_read_ahead()
+
+            if use_callback:
+                silence = b"\x80" if pyaudio_format == _pyaudio.paUInt8 else b"\x00"
+                position_lock = _threading.Lock()
+                stream_out = self._pyaudio_context.open(sample_rate, channels, pyaudio_format, self._output_device_index, frames_per_buffer, callback, False)
+            else:
+                stream_out = self._pyaudio_context.open(sample_rate, channels, pyaudio_format, self._output_device_index, frames_per_buffer)
 
             duration = self.stream_information.get("duration", None)
             if duration == None:
                 duration = self.information["format"].get("duration", None)
             self._duration = float(duration) if duration != None else duration
 
-            self._chunk_length = chunk / (audioop_format * channels * sample_rate)
+            self._chunk_length = 0 if use_callback else chunk / (audioop_format * channels * sample_rate)
             self._chunk_time = position if duration == None or position < self._duration else self._duration
+
+            if use_callback:
+                # Pre-fill the read-ahead buffer, so the first hardware buffers don't underflow.
+                while not self._terminate and not read_ahead.buffer.wait(look_ahead_size, delay):
+                    pass
+                stream_out.start_stream()
+
+            self.emit("start")
+            buffer = memoryview(bytearray(chunk))
             while not self._terminate:
-                if self._reposition:
-                    position = 0 if self._position < 0 else self._position
-                    pipe, read_thread = create_pipe_wrapper(pipe, read_thread)
+                # Only the latest seek and preview matter, the other commands just wake this thread up.
+                seek_position, preview, deadline = None, None, None
+                while True:
+                    try:
+                        command, *arguments = self._commands.get(timeout = max(deadline - _time.monotonic(), 0)) if deadline != None else self._commands.get_nowait()
+                    except _queue.Empty:
+                        break
+
+                    if command == "seek":
+                        seek_position = arguments[0]
+
+                        # Wait a little for later seeks, so a burst of seeks only restarts the decoding once.
+                        if deadline == None and self.seek_window > 0:
+                            deadline = _time.monotonic() + self.seek_window
+                    elif command == "scrub":
+                        preview = arguments
+                    elif command == "stop":
+                        break
+
+                if self._terminate:
+                    break
+
+                if seek_position != None:
+                    position = seek_position
+                    stop_read_ahead(read_ahead)
 
+                    if reader:
+                        seek_reader(position)
+                    else:
+                        pipe, read_thread = create_pipe_wrapper(pipe, read_thread, repeat = seamless_loop)
+
+                    if writer:
+                        writer.discard()
+                        writer = None
+
+                    read_ahead = start_read_ahead()
+                    self._scrub_buffer, scrubbed = None, False
                     self._reposition = False
-                    self._chunk_time = position if duration == None or position < self._duration else self._duration
-                    self._start = _time.monotonic_ns()
+                    self.emit("seek")
+
+                    if use_callback:
+                        with position_lock:
+                            self._chunk_time = position if duration == None or position < self._duration else self._duration
+                            self._chunk_length = 0
+                            self._start = _time.monotonic_ns()
+                    else:
+                        self._chunk_time = position if duration == None or position < self._duration else self._duration
+                        self._start = _time.monotonic_ns()
+
+                if self._scrubbing or scrubbed:
+                    # The normal playback stops until a seek ends the scrub mode.
+                    if not scrubbed:
+                        stop_read_ahead(read_ahead)
+                        read_ahead, scrubbed = None, True
+
+                    if preview and self._scrubbing:
+                        position = preview[0]
+                        data = get_preview(*preview)
+
+                        volume = self._volume
+                        if volume != 1:
+                            view = memoryview(data)
+                            _mul(view, audioop_format, volume, view)
+
+                        if use_callback:
+                            scrub_buffer = _RingBuffer(max(len(data), 1))
+                            scrub_buffer.write(data)
+                            scrub_buffer.finish()
+
+                            with position_lock:
+                                self._scrub_buffer = scrub_buffer
+                                self._chunk_time, self._chunk_length, self._pause_offset = position, 0, None
+                                self._start = _time.monotonic_ns()
+                        else:
+                            self._chunk_time, self._chunk_length, self._pause_offset = position, len(data) / (frame_size * sample_rate), None
+                            self._start = _time.monotonic_ns()
+                            stream_out.write(bytes(data), exception_on_underflow = exception_on_underflow)
+                        continue
+
+                    self._event.wait(delay)
+                    self._event.clear()
+                    continue
+
+                if use_callback:
+                    # The callback plays the audio, this thread only handles the controls and the end of the audio.
+                    if not read_ahead.buffer.is_finished:
+                        self._event.wait(delay)
+                        self._event.clear()
+                        continue
 
-                if self.is_paused:
+                    if read_ahead.exception:
+                        raise read_ahead.exception
+                elif self.is_paused:
                     if self._pause_offset == None:
                         self._pause_offset = min(self.nanoseconds_to_seconds(max(_time.monotonic_ns() - self._start, 0)), self._chunk_length) if self._start != None else 0
 
-                    _time.sleep(delay)
+                    self._event.wait(delay)
+                    self._event.clear()
                     continue
 
-                data = pipe.stdout.read(chunk)
-                if data:
-                    data = _mul(data, audioop_format, self._volume)
+                size = 0 if use_callback else read_ahead.readinto(buffer) if read_ahead else read_source(buffer)
+                if size:
+                    data = buffer if size == chunk else buffer[:size]
+
+                    volume = self._volume
+                    if volume != 1:
+                        _mul(data, audioop_format, volume, data)
 
                     if self._start == None:
                         self._start = _time.monotonic_ns()
 
-                    stream_out.write(data, exception_on_underflow = exception_on_underflow)
+                    stream_out.write(bytes(data), exception_on_underflow = exception_on_underflow)
 
                     self._chunk_time += self._chunk_length
+                    wrap_position()
                     self._start = _time.monotonic_ns()
                     continue
 
+                stop_read_ahead(read_ahead)
+                read_ahead = None
+
+                # The pipe or the cache reader already played every loop.
+                if looping:
+                    break
+
+                if writer:
+                    # Only cache the audio if ffmpeg decoded all of it.
+                    if pipe.wait() == 0:
+                        reader = writer.commit(self.information, self.stream_information)
+                    else:
+                        writer.discard()
+                    writer = None
+
+                    if reader:
+                        create_pipe_wrapper(pipe, read_thread, False)
+                        pipe, read_thread = None, None
+
                 if loop == 0:
                     break
                 elif loop != -1:
                     loop -= 1
 
                 position = 0
-                pipe, read_thread = create_pipe_wrapper(pipe, read_thread)
-
-                self._chunk_time = 0
-                self._start = _time.monotonic_ns()
+                if reader:
+                    seek_reader(0)
+                else:
+                    pipe, read_thread = create_pipe_wrapper(pipe, read_thread, repeat = seamless_loop)
+                read_ahead = start_read_ahead()
+                self.emit("loop")
+
+                if use_callback:
+                    with position_lock:
+                        self._chunk_time = 0
+                        self._chunk_length = 0
+                        self._start = _time.monotonic_ns()
+                else:
+                    self._chunk_time = 0
+                    self._start = _time.monotonic_ns()
         except Exception as exception:
             self.exception = exception
         finally:
             try:
+                stop_read_ahead(read_ahead)
                 create_pipe_wrapper(pipe, read_thread, False)
+
+                if reader:
+                    reader.close()
+                if writer:
+                    writer.discard()
             except NameError:
                 pass
             try:
-                if stream_out.is_active():
-                    stream_out.stop_stream()
-            except (NameError, OSError):
-                pass
-            try:
-                stream_out.close()
+                self._pyaudio_context.close(stream_out)
             except NameError:
                 pass
 
             self.is_paused = False
+            self.emit("end")
 
     @staticmethod
     def nanoseconds_to_seconds(time_in_nanoseconds: _Union[int, float]) -> _Union[int, float]:
@@ -0,0 +1,236 @@
+"""
+A module for buffering streamed PCM audio between threads.
+"""
+import threading as _threading
+from typing import Optional as _Optional, Callable as _Callable, Union as _Union
+
+class RingBuffer:
+    def __init__(self, capacity: int) -> None:
+        """
+        A bounded, thread-safe ring buffer of bytes. Writers block while it's full and readers block until enough bytes are available.
+
+        Parameters
+        ----------
+
+        capacity: Maximum number of bytes in the buffer.
+        """
+        if not isinstance(capacity, int):
+            raise TypeError("Capacity must be an integer.")
+        elif capacity <= 0:
+            raise ValueError("Capacity must be greater than 0.")
+
+        self.capacity = capacity
+
+        self._data = memoryview(bytearray(capacity))
+        self._start = 0
+        self._size = 0
+        self._is_finished = False
+        self._is_closed = False
+        self._condition = _threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """
+        A read-only attribute whose value is the number of bytes in the buffer.
+        """
+        return self._size
+
+    @property
+    def fill(self) -> float:
+        """
+        A read-only attribute whose value is the fill level of the buffer from `0` (empty) to `1` (full).
+        """
+        return self._size / self.capacity
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the end of the data was marked and every byte was read, otherwise `False`.
+        """
+        return self._is_finished and self._size == 0
+
+    def write(self, data: _Union[bytes, bytearray, memoryview]) -> bool:
+        """
+        Append bytes to the buffer, waiting for free space when it's full. Return `False` if the buffer was closed before all bytes were written, otherwise `True`.
+
+        Parameters
+        ----------
+
+        data: A bytes-like object.
+        """
+        data = memoryview(data).cast("B")
+
+        with self._condition:
+            while len(data) != 0:
+                while self._size == self.capacity and not self._is_closed:
+                    self._condition.wait()
+
+                if self._is_closed:
+                    return False
+
+                end = (self._start + self._size) % self.capacity
+                count = min(len(data), self.capacity - self._size, self.capacity - end)
+
+                self._data[end:end + count] = data[:count]
+                self._size += count
+                data = data[count:]
+
+                self._condition.notify_all()
+
+        return True
+
+    def readinto(self, buffer: _Union[bytearray, memoryview], block: bool = True) -> int:
+        """
+        Move bytes from the buffer into a writable bytes-like object and return how many bytes were moved. Wait until the object can be filled, unless the buffer is finished or closed.
+
+        Parameters
+        ----------
+
+        buffer: A writable bytes-like object.
+
+        block (optional): Specifies whether to wait. If it's `False`, only the bytes that are already in the buffer are moved.
+        """
+        buffer = memoryview(buffer).cast("B")
+
+        with self._condition:
+            while block and self._size < min(len(buffer), self.capacity) and not self._is_finished and not self._is_closed:
+                self._condition.wait()
+
+            count = min(len(buffer), self._size)
+            first_count = min(count, self.capacity - self._start)
+
+            buffer[:first_count] = self._data[self._start:self._start + first_count]
+            buffer[first_count:count] = self._data[:count - first_count]
+
+            self._start = (self._start + count) % self.capacity
+            self._size -= count
+
+            self._condition.notify_all()
+            return count
+
+    def wait(self, size: int, timeout: _Optional[_Union[int, float]] = None) -> bool:
+        """
+        Wait until the buffer holds at least `size` bytes (or is full), finished or closed. Return `False` if the timeout expired, otherwise `True`.
+
+        Parameters
+        ----------
+
+        size: Number of bytes to wait for.
+
+        timeout (optional): Specifies the timeout in seconds. Wait without a timeout if the given timeout is `None`.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._size >= min(size, self.capacity) or self._is_finished or self._is_closed, timeout)
+
+    def finish(self) -> None:
+        """
+        Mark the end of the data, so readers return the remaining bytes without waiting for more.
+        """
+        with self._condition:
+            self._is_finished = True
+            self._condition.notify_all()
+
+    def clear(self) -> None:
+        """
+        Discard every byte in the buffer and its end mark.
+        """
+        with self._condition:
+            self._start = 0
+            self._size = 0
+            self._is_finished = False
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Wake every waiting reader and writer. Later writes are discarded.
+        """
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+
+class ReadAhead:
+    def __init__(self, read: _Callable[[memoryview], int], capacity: int, chunk: int, daemon: _Optional[bool] = None) -> None:
+        """
+        A thread that reads a source ahead into a `RingBuffer`, so the reader of this object isn't slowed down by a slow source.
+
+        Parameters
+        ----------
+
+        read: A function that reads bytes from the source into a `memoryview` and returns how many bytes were read. It returns `0` at the end of the source.
+
+        capacity: Maximum number of bytes read ahead.
+
+        chunk: Maximum number of bytes per call to `read`.
+
+        daemon (optional): Specifies whether the thread is a daemon thread.
+        """
+        if not isinstance(chunk, int):
+            raise TypeError("Chunk must be an integer.")
+        elif chunk <= 0:
+            raise ValueError("Chunk must be greater than 0.")
+
+        self.buffer = RingBuffer(capacity)
+        self.is_finished = False
+        self.exception = None
+
+        self._thread = _threading.Thread(target = self.run, args = (read, chunk), daemon = daemon)
+        self._thread.start()
+
+    def run(self, read: _Callable[[memoryview], int], chunk: int) -> None:
+        """
+        Read the source until its end or until the buffer is closed. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        read: A function that reads bytes from the source into a `memoryview`.
+
+        chunk: Maximum number of bytes per call to `read`.
+        """
+        data = memoryview(bytearray(chunk))
+
+        try:
+            while True:
+                size = read(data)
+                if not size:
+                    self.is_finished = True
+                    break
+
+                if not self.buffer.write(data[:size]):
+                    break
+        except Exception as exception:
+            self.exception = exception
+        finally:
+            self.buffer.finish()
+
+    def readinto(self, buffer: _Union[bytearray, memoryview]) -> int:
+        """
+        Move read-ahead bytes into a writable bytes-like object and return how many bytes were moved. Return `0` at the end of the source. If reading the source failed, raise the exception once the read-ahead bytes are used up.
+
+        Parameters
+        ----------
+
+        buffer: A writable bytes-like object.
+        """
+        size = self.buffer.readinto(buffer)
+
+        if size == 0 and self.exception:
+            raise self.exception
+        return size
+
+    def stop(self) -> None:
+        """
+        Stop reading ahead. The source must stop blocking (e.g. by being closed) for the thread to end, use `join()` to wait for it.
+        """
+        self.buffer.close()
+
+    def join(self, timeout: _Optional[_Union[int, float]] = None) -> None:
+        """
+        Wait until the thread ends.
+
+        Parameters
+        ----------
+
+        timeout (optional): Specifies the timeout in seconds. Wait until the thread ends if the given timeout is `None`.
+        """
+        self._thread.join(timeout)
@@ -0,0 +1,568 @@
+"""
+A module for caching audio information and decoded audio.
+"""
+import os as _os, threading as _threading, hashlib as _hashlib, json as _json, tempfile as _tempfile, atexit as _atexit
+from collections import OrderedDict as _OrderedDict
+from copy import deepcopy as _deepcopy
+from typing import Optional as _Optional, Union as _Union, Iterable as _Iterable, Tuple as _Tuple, Dict as _Dict, Any as _Any
+
+from .pcm import PCMReader as _PCMReader
+
+class InformationCache:
+    def __init__(self, max_size: int = 256, path: _Optional[_Union[str, _os.PathLike]] = None, save_delay: _Union[int, float] = 1) -> None:
+        """
+        A least recently used cache of the files' information returned by `Audio.get_information()`, so a file that hasn't changed is only probed once. Entries are keyed by the file's path, modification time and size.
+
+        Parameters
+        ----------
+
+        max_size (optional): Maximum number of entries.
+
+        path (optional): Path to a JSON file that stores the entries between runs. The entries are only kept in memory if the given path is `None`.
+
+        save_delay (optional): How many seconds the JSON file is stored after the first change, so the changes in the meantime are stored at once. Use `flush()` to store them right away. The changes are also stored when the program exits.
+        """
+        if not isinstance(max_size, int):
+            raise TypeError("Max size must be an integer.")
+        elif max_size < 0:
+            raise ValueError("Max size must be non-negative.")
+
+        if path != None:
+            try:
+                path = _os.fspath(path)
+            except TypeError:
+                pass
+
+            if not isinstance(path, str):
+                raise TypeError("Path must be None/a string/a path-like object.")
+
+        if not isinstance(save_delay, (int, float)):
+            raise TypeError("Save delay must be an integer/a float.")
+        elif save_delay < 0:
+            raise ValueError("Save delay must be non-negative.")
+
+        self.max_size = max_size
+        self.path = path
+        self.save_delay = save_delay
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = _threading.Lock()
+        self._save_lock = _threading.Lock()
+        self._entries = _OrderedDict()
+        self._dirty = False
+        self._timer = None
+
+        if path != None:
+            self.load()
+            _atexit.register(self.flush)
+
+    def load(self) -> None:
+        """
+        Load the entries stored in the JSON file. This function is meant for use by the class and not for general use.
+        """
+        try:
+            with open(self.path, "r") as file:
+                entries = _json.load(file)
+        except (OSError, ValueError):
+            return
+
+        with self._lock:
+            for key, information in entries:
+                self._entries[tuple(key)] = information
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(False)
+
+    def save(self, entries: _Iterable[_Any]) -> None:
+        """
+        Store the entries in the JSON file. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        entries: A list of the entries' keys (as lists) and information.
+        """
+        temporary_path = f"{self.path}.{_os.getpid()}.{_threading.get_ident()}.tmp"
+        try:
+            with open(temporary_path, "w") as file:
+                _json.dump(entries, file)
+            _os.replace(temporary_path, self.path)
+        except (OSError, TypeError, ValueError):
+            try:
+                _os.remove(temporary_path)
+            except OSError:
+                pass
+
+    def schedule_save(self) -> None:
+        """
+        Mark the entries as changed and store them after `save_delay` seconds, unless a store is already scheduled. This function is meant for use by the class and not for general use.
+        """
+        if self.path == None:
+            return
+
+        with self._lock:
+            self._dirty = True
+            if self._timer != None or self.save_delay == 0:
+                timer = None
+            else:
+                timer = self._timer = _threading.Timer(self.save_delay, self.flush)
+                timer.daemon = True
+
+        if timer:
+            timer.start()
+        elif self.save_delay == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Store the changed entries in the JSON file right away instead of waiting for `save_delay`.
+        """
+        if self.path == None:
+            return
+
+        # Only one thread writes at a time, so an older copy of the entries never replaces a newer one.
+        with self._save_lock:
+            with self._lock:
+                timer, self._timer = self._timer, None
+                if not self._dirty:
+                    entries = None
+                else:
+                    self._dirty = False
+                    entries = [[list(key), information] for key, information in self._entries.items()]
+
+            if timer and timer is not _threading.current_thread():
+                timer.cancel()
+
+            if entries != None:
+                self.save(entries)
+
+    @staticmethod
+    def get_key(path: _Union[str, _os.PathLike], *options: _Any) -> _Optional[_Tuple[_Any, ...]]:
+        """
+        Return the key of a file's information, or `None` if the file can't be found. The key changes when the file is modified.
+
+        Parameters
+        ----------
+
+        path: Path to the file.
+
+        options: Other values that change the information, such as the encoding and the path to `ffmpeg`/`ffprobe`.
+        """
+        try:
+            path = _os.path.abspath(path)
+            stat = _os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+
+        return (path, stat.st_mtime_ns, stat.st_size, *options)
+
+    def get(self, key: _Tuple[_Any, ...]) -> _Optional[_Dict[str, _Any]]:
+        """
+        Return a copy of the cached information and count a hit, otherwise return `None` and count a miss.
+
+        Parameters
+        ----------
+
+        key: The entry's key returned by `get_key()`.
+        """
+        with self._lock:
+            information = self._entries.get(key, None)
+            if information == None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _deepcopy(information)
+
+    def put(self, key: _Tuple[_Any, ...], information: _Dict[str, _Any]) -> None:
+        """
+        Cache a copy of the information and evict the least recently used entries.
+
+        Parameters
+        ----------
+
+        key: The entry's key returned by `get_key()`.
+
+        information: The file's information.
+        """
+        with self._lock:
+            # Drop the outdated entries of the same file.
+            for old_key in [old_key for old_key in self._entries if old_key[0] == key[0] and old_key[1:3] != key[1:3]]:
+                del self._entries[old_key]
+
+            self._entries[key] = _deepcopy(information)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(False)
+
+        self.schedule_save()
+
+    def invalidate(self, path: _Optional[_Union[str, _os.PathLike]] = None) -> None:
+        """
+        Forget the information of a file, so it's probed again next time.
+
+        Parameters
+        ----------
+
+        path (optional): Path to the file. Forget every file if the given path is `None`.
+        """
+        with self._lock:
+            if path == None:
+                self._entries.clear()
+            else:
+                path = _os.path.abspath(path)
+                for key in [key for key in self._entries if key[0] == path]:
+                    del self._entries[key]
+
+        self.schedule_save()
+
+    def get_stats(self) -> _Dict[str, int]:
+        """
+        Return a dict contains the number of hits, misses and entries and the maximum number of entries.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "max_size": self.max_size}
+
+class PCMCache:
+    def __init__(self, directory: _Optional[_Union[str, _os.PathLike]] = None, max_size: int = 1 << 30) -> None:
+        """
+        An on-disk cache of decoded PCM audio. It's filled while a file is played from the start to the end, then later plays, loops and seeks of the same file read a memory-mapped copy without running `ffmpeg`. The least recently used entries are evicted when the cache grows bigger than `max_size`. A cache can be shared by many `Audio` objects and is kept between runs.
+
+        Parameters
+        ----------
+
+        directory (optional): Directory to store the cache in. Use `simple_pygame_pcm_cache` in the temporary directory if the given directory is `None`.
+
+        max_size (optional): Maximum total size of the cache in bytes.
+        """
+        if directory == None:
+            directory = _os.path.join(_tempfile.gettempdir(), "simple_pygame_pcm_cache")
+
+        try:
+            directory = _os.fspath(directory)
+        except TypeError:
+            pass
+
+        if not isinstance(directory, str):
+            raise TypeError("Directory must be None/a string/a path-like object.")
+
+        if not isinstance(max_size, int):
+            raise TypeError("Max size must be an integer.")
+        elif max_size < 0:
+            raise ValueError("Max size must be non-negative.")
+
+        _os.makedirs(directory, exist_ok = True)
+
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = _threading.Lock()
+        self._entries = _OrderedDict()
+        self._readers = {}
+        self._writing = set()
+
+        self.load()
+
+    def load(self) -> None:
+        """
+        Load the entries stored in the cache directory, least recently used first. This function is meant for use by the class and not for general use.
+        """
+        entries = []
+        for file_name in _os.listdir(self.directory):
+            key, extension = _os.path.splitext(file_name)
+            if extension != ".json":
+                continue
+
+            try:
+                entries.append((_os.stat(self.get_path(key, ".json")).st_mtime_ns, key, _os.path.getsize(self.get_path(key, ".pcm"))))
+            except OSError:
+                continue
+
+        with self._lock:
+            self._entries.clear()
+            for _, key, size in sorted(entries):
+                self._entries[key] = size
+
+    def get_path(self, key: str, extension: str) -> str:
+        """
+        Return the path to a file of an entry. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        key: The entry's key.
+
+        extension: `.pcm` for the decoded audio, `.json` for the information or `.part` for the audio being written.
+        """
+        return _os.path.join(self.directory, key + extension)
+
+    @staticmethod
+    def get_key(path: _Union[str, _os.PathLike], stream: int, data_format: str, input_options: _Iterable[str] = (), output_options: _Iterable[str] = ()) -> _Optional[str]:
+        """
+        Return the key of a decoded file, or `None` if the file can't be found. The key changes when the file is modified.
+
+        Parameters
+        ----------
+
+        path: Path to the file.
+
+        stream: Which audio stream is decoded.
+
+        data_format: Output data format of `ffmpeg`.
+
+        input_options (optional): Input options passed to `ffmpeg`.
+
+        output_options (optional): Output options passed to `ffmpeg`.
+        """
+        try:
+            path = _os.path.abspath(path)
+            stat = _os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+
+        identity = [path, stat.st_mtime_ns, stat.st_size, stream, data_format, list(input_options), list(output_options)]
+        return _hashlib.sha256(_json.dumps(identity).encode()).hexdigest()
+
+    def open(self, key: str, count: bool = True) -> _Optional["CacheReader"]:
+        """
+        Return a reader of a cached entry and count a hit, otherwise return `None` and count a miss.
+
+        Parameters
+        ----------
+
+        key: The entry's key returned by `get_key()`.
+
+        count (optional): Specifies whether to count the hit or miss.
+        """
+        with self._lock:
+            if key in self._entries:
+                try:
+                    reader = CacheReader(self, key)
+                except (OSError, ValueError):
+                    del self._entries[key]
+                else:
+                    self._entries.move_to_end(key)
+                    self._readers[key] = self._readers.get(key, 0) + 1
+                    self.hits += 1 if count else 0
+
+                    try:
+                        _os.utime(self.get_path(key, ".json"))
+                    except OSError:
+                        pass
+
+                    return reader
+
+            self.misses += 1 if count else 0
+            return None
+
+    def create_writer(self, key: str) -> _Optional["CacheWriter"]:
+        """
+        Return a writer that fills an entry, or `None` if the entry already exists or is being written.
+
+        Parameters
+        ----------
+
+        key: The entry's key returned by `get_key()`.
+        """
+        with self._lock:
+            if key in self._entries or key in self._writing:
+                return None
+
+            try:
+                writer = CacheWriter(self, key)
+            except OSError:
+                return None
+
+            self._writing.add(key)
+            return writer
+
+    def add(self, key: str, size: int) -> None:
+        """
+        Register a written entry and evict the least recently used entries until the cache fits in `max_size`. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        key: The entry's key.
+
+        size: Size of the entry's decoded audio in bytes.
+        """
+        with self._lock:
+            self._writing.discard(key)
+            self._entries[key] = size
+            self._entries.move_to_end(key)
+
+            total_size = sum(self._entries.values())
+            for old_key in list(self._entries):
+                if total_size <= self.max_size:
+                    break
+
+                # Entries that are being played can't be removed from every platform.
+                if self._readers.get(old_key, 0) > 0:
+                    continue
+
+                total_size -= self._entries.pop(old_key)
+                self.remove(old_key)
+                self.evictions += 1
+
+    def release(self, key: str, written: bool = False) -> None:
+        """
+        Release an entry after its reader was closed or its writer was discarded. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        key: The entry's key.
+
+        written (optional): Specifies whether the entry was being written instead of read.
+        """
+        with self._lock:
+            if written:
+                self._writing.discard(key)
+            elif self._readers.get(key, 0) > 1:
+                self._readers[key] -= 1
+            else:
+                self._readers.pop(key, None)
+
+    def remove(self, key: str) -> None:
+        """
+        Delete the files of an entry. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        key: The entry's key.
+        """
+        for extension in (".json", ".pcm"):
+            try:
+                _os.remove(self.get_path(key, extension))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Delete every entry that isn't being played and reset the statistics.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if self._readers.get(key, 0) == 0:
+                    del self._entries[key]
+                    self.remove(key)
+
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        """
+        A read-only attribute whose value is the total size of the cached audio in bytes.
+        """
+        with self._lock:
+            return sum(self._entries.values())
+
+    def get_stats(self) -> _Dict[str, int]:
+        """
+        Return a dict contains the number of hits, misses, evictions and entries, the cache's size and its maximum size.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self._entries), "size": sum(self._entries.values()), "max_size": self.max_size}
+
+class CacheReader(_PCMReader):
+    def __init__(self, cache: PCMCache, key: str) -> None:
+        """
+        A memory-mapped reader of a cached entry. Use `PCMCache.open()` instead of creating it directly.
+
+        Parameters
+        ----------
+
+        cache: The cache that holds the entry.
+
+        key: The entry's key.
+        """
+        with open(cache.get_path(key, ".json"), "r") as file:
+            information = _json.load(file)
+
+        self.cache = cache
+        self.key = key
+
+        super().__init__(cache.get_path(key, ".pcm"), information = information["information"], stream_information = information["stream_information"])
+
+    def close(self) -> None:
+        """
+        Unmap the entry and release it.
+        """
+        if self._buffer == None:
+            return
+
+        super().close()
+        self.cache.release(self.key)
+
+class CacheWriter:
+    def __init__(self, cache: PCMCache, key: str) -> None:
+        """
+        A writer that fills a cache entry. Use `PCMCache.create_writer()` instead of creating it directly.
+
+        Parameters
+        ----------
+
+        cache: The cache that holds the entry.
+
+        key: The entry's key.
+        """
+        self.cache = cache
+        self.key = key
+        self.size = 0
+        self._file = open(cache.get_path(key, ".part"), "wb")
+
+    def write(self, data: bytes) -> None:
+        """
+        Append decoded audio to the entry.
+
+        Parameters
+        ----------
+
+        data: A bytes-like object.
+        """
+        self.size += self._file.write(data)
+
+    def commit(self, information: _Dict[str, _Any], stream_information: _Dict[str, _Any]) -> _Optional[CacheReader]:
+        """
+        Finish the entry, add it to the cache and return a reader of it. Return `None` if it can't be added.
+
+        Parameters
+        ----------
+
+        information: The file's information.
+
+        stream_information: The stream's information.
+        """
+        try:
+            self._file.close()
+
+            _os.replace(self.cache.get_path(self.key, ".part"), self.cache.get_path(self.key, ".pcm"))
+            with open(self.cache.get_path(self.key, ".json"), "w") as file:
+                _json.dump({"information": information, "stream_information": stream_information}, file)
+        except (OSError, TypeError, ValueError):
+            self.discard()
+            self.cache.remove(self.key)
+            return None
+
+        self.cache.add(self.key, self.size)
+        return self.cache.open(self.key, False)
+
+    def discard(self) -> None:
+        """
+        Delete the unfinished entry.
+        """
+        self._file.close()
+
+        try:
+            _os.remove(self.cache.get_path(self.key, ".part"))
+        except OSError:
+            pass
+        self.cache.release(self.key, True)
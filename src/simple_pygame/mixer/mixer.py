@@ -0,0 +1,834 @@
+"""
+A module for mixing many audio sources into one output stream.
+"""
+import pyaudio as _pyaudio, subprocess as _subprocess, threading as _threading, select as _select, os as _os
+from typing import Optional as _Optional, Union as _Union, Tuple as _Tuple, Any as _Any
+
+from ..constants import SInt8, SInt16, UInt8, AudioEnded
+from .audio import Audio as _Audio
+from .buffer import RingBuffer as _RingBuffer
+from .pyaudioop import mix as _mix, bias as _bias
+
+class Source:
+    def __init__(self, mixer: "Mixer", path: str, stream: int, loop: int, volume: _Union[int, float], pan: _Union[int, float], buffered: bool = True) -> None:
+        """
+        A source that is played by a `Mixer` object. Use `Mixer.play()` to create one instead of creating it directly.
+
+        Parameters
+        ----------
+
+        mixer: The `Mixer` object that plays the source.
+
+        path: Path to the file contains audio.
+
+        stream: Which stream to use if the file has more than 1 audio streams.
+
+        loop: How many times to repeat the audio. If the given loop is `-1` repeats indefinitely.
+
+        volume: The source's volume.
+
+        pan: The source's pan from `-1` (left) to `1` (right).
+
+        buffered (optional): Specifies whether the source has a buffer that its `ffmpeg` pipe is decoded into. A source that reads its audio from memory doesn't need one.
+        """
+        self.mixer = mixer
+        self.path = path
+        self.stream = stream
+        self.loop = loop
+        self.volume = volume
+        self.pan = pan
+        self.returncode = None
+        self.stderr = None
+
+        self._is_paused = False
+        self._is_busy = True
+        self._pipe = None
+        self._buffer = _RingBuffer(mixer.chunk * mixer.buffer_chunks) if buffered else None
+        self._is_decoded = False
+        self._start_position = 0
+        self._frames = 0
+        self._duration = None
+        self._next = None
+        self._fade_in = 0
+        self._fade_out = 0
+        self._read_size = 0
+        self._lock = _threading.Lock()
+
+    @property
+    def volume(self) -> _Union[int, float]:
+        """
+        The source's volume.
+        """
+        return self._volume
+
+    @volume.setter
+    def volume(self, volume: _Union[int, float]) -> None:
+        if not isinstance(volume, (int, float)):
+            raise TypeError("Volume must be an integer/a float.")
+
+        if volume < 0:
+            raise ValueError("Volume must be non-negative.")
+
+        self._volume = volume
+
+    @property
+    def pan(self) -> _Union[int, float]:
+        """
+        The source's pan from `-1` (left) to `1` (right). It only has an effect on a stereo mixer.
+        """
+        return self._pan
+
+    @pan.setter
+    def pan(self, pan: _Union[int, float]) -> None:
+        if not isinstance(pan, (int, float)):
+            raise TypeError("Pan must be an integer/a float.")
+
+        if pan < -1 or pan > 1:
+            raise ValueError("Pan must be between -1 and 1.")
+
+        self._pan = pan
+
+    @property
+    def is_paused(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the source is currently paused, otherwise `False`.
+        """
+        return self._is_paused if self._is_busy else False
+
+    @property
+    def is_busy(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the source is currently playing or paused, otherwise `False`.
+        """
+        return self._is_busy
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if all audio of the source was mixed, otherwise `False`.
+        """
+        return self._buffer.is_finished
+
+    @property
+    def position(self) -> _Any:
+        """
+        The source's position in seconds. This attribute's value is an integer/a float if the source is currently playing or paused, otherwise `simple_pygame.AudioEnded`.
+        """
+        if not self._is_busy:
+            return AudioEnded
+
+        position = self._start_position + self._frames / self.mixer.sample_rate
+        return position % self._duration if self.loop != 0 and self._duration else position
+
+    @position.setter
+    def position(self, position: _Union[int, float]) -> None:
+        if not isinstance(position, (int, float)):
+            raise TypeError("Position must be an integer/a float.")
+
+        if not self._is_busy:
+            return
+
+        if self.loop != -1 and self._duration:
+            # Loops that were played before the seek are no longer repeated.
+            self.loop -= int((self._start_position + self._frames / self.mixer.sample_rate) // self._duration)
+
+        self.seek(0 if position < 0 else position)
+
+    def pause(self) -> None:
+        """
+        Pause the source if it's currently playing and not paused. It can be resumed with `resume()`.
+        """
+        if self._is_busy:
+            self._is_paused = True
+
+    def resume(self) -> None:
+        """
+        Resume the source after it has been paused.
+        """
+        self._is_paused = False
+        self.mixer._event.set()
+
+    def stop(self) -> None:
+        """
+        Stop the source if it's currently playing.
+        """
+        self.mixer.remove(self)
+
+    def get_pause(self) -> bool:
+        """
+        Return `True` if the source is currently paused, otherwise `False`.
+        """
+        return self.is_paused
+
+    def set_position(self, position: _Union[int, float]) -> None:
+        """
+        Set the source's position where the source will continue to play.
+
+        Parameters
+        ----------
+
+        position: Where to set the source's position in seconds.
+        """
+        self.position = position
+
+    def get_position(self) -> _Any:
+        """
+        Return the source's position in seconds if the source is currently playing or paused, otherwise `simple_pygame.AudioEnded`.
+        """
+        return self.position
+
+    def set_volume(self, volume: _Union[int, float]) -> None:
+        """
+        Set the source's volume.
+
+        Parameters
+        ----------
+
+        volume: The source's volume (`1` is the original volume).
+        """
+        self.volume = volume
+
+    def get_volume(self) -> _Union[int, float]:
+        """
+        Return the source's volume.
+        """
+        return self.volume
+
+    def set_pan(self, pan: _Union[int, float]) -> None:
+        """
+        Set the source's pan.
+
+        Parameters
+        ----------
+
+        pan: The source's pan from `-1` (left) to `1` (right).
+        """
+        self.pan = pan
+
+    def get_pan(self) -> _Union[int, float]:
+        """
+        Return the source's pan.
+        """
+        return self.pan
+
+    def get_busy(self) -> bool:
+        """
+        Return `True` if the source is currently playing or paused, otherwise `False`.
+        """
+        return self.is_busy
+
+    def get_returncode(self) -> _Optional[int]:
+        """
+        Return the returncode of the nearest finished `ffmpeg` of the source. If there are no finished `ffmpeg`, return `None` instead.
+        """
+        return self.returncode
+
+    def get_stderr(self) -> _Optional[bytes]:
+        """
+        Return the value read from stderr of the nearest finished `ffmpeg` of the source. If there are no finished `ffmpeg`, return `None` instead.
+        """
+        return self.stderr
+
+    def seek(self, position: _Union[int, float]) -> None:
+        """
+        Continue playing the source from a position. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        position: The position in seconds.
+        """
+        self.mixer.open_pipe(self, position)
+
+    def get_remaining(self) -> _Optional[float]:
+        """
+        Return how many seconds of the source are left to mix, or `None` if it's unknown or the source loops. This function is meant for use by the class and not for general use.
+        """
+        if self.loop != 0 or not self._duration:
+            return None
+
+        return max(self._duration - self._start_position - self._frames / self.mixer.sample_rate, 0)
+
+    def get_gain(self, channels: int) -> _Union[float, _Tuple[float, float]]:
+        """
+        Return the factor for every sample, or the factors for the left and right channels of a stereo mixer. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        channels: Number of channels of the mixer.
+        """
+        volume = self._volume * self.mixer._volume
+
+        # Crossfades change the gain once per chunk.
+        if self._fade_in > 0:
+            volume *= min(1, self._frames / self.mixer.sample_rate / self._fade_in)
+
+        if self._fade_out > 0:
+            remaining = self.get_remaining()
+            if remaining != None:
+                volume *= min(1, remaining / self._fade_out)
+
+        if channels != 2:
+            return volume
+
+        pan = self._pan
+        return volume * min(1, 1 - pan), volume * min(1, 1 + pan)
+
+    def is_ready(self, size: int) -> bool:
+        """
+        Return `True` if the next `size` bytes of decoded audio can be read without waiting, otherwise `False`. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        size: Number of bytes.
+        """
+        return self._buffer.wait(size, 0)
+
+    def read(self, size: int) -> _Optional[bytearray]:
+        """
+        Return the next `size` bytes of decoded audio, padded with silence at the end of the audio, or `None` if they aren't decoded yet. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        size: Number of bytes.
+        """
+        buffer = self._buffer
+        if not buffer.wait(size, 0):
+            return None
+
+        data = bytearray(size)
+        self._read_size = buffer.readinto(data, False)
+        self._frames += self._read_size // self.mixer.frame_size
+        return data
+
+class Mixer:
+    def __init__(self, sample_rate: int = 44100, channels: int = 2, chunk: int = 4096, frames_per_buffer: _Union[int, _Any] = _pyaudio.paFramesPerBufferUnspecified, data_format: _Any = SInt16, buffer_chunks: int = 4, encoding: _Optional[str] = None, use_ffmpeg: bool = False, loglevel: str = "quiet", ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe") -> None:
+        """
+        A software mixer that plays many sources through one output stream. Every source is decoded by `ffmpeg` to the mixer's sample rate and channels, then all sources are mixed with their own volume and pan by one output thread, while one decode thread reads every `ffmpeg` pipe.
+
+        Requirements
+        ------------
+
+        - Pyaudio library.
+
+        - FFmpeg.
+
+        - FFprobe (optional).
+
+        Parameters
+        ----------
+
+        sample_rate (optional): Sample rate of the output stream.
+
+        channels (optional): Number of channels of the output stream.
+
+        chunk (optional): Number of bytes per mixed chunk. It must be a multiple of the frame size.
+
+        frames_per_buffer (optional): Number of frames per buffer. Defaults to `pyaudio.paFramesPerBufferUnspecified`.
+
+        data_format (optional): Specifies what output data format to use. Defaults to `simple_pygame.SInt16`.
+
+        buffer_chunks (optional): Number of chunks decoded ahead for each source.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        loglevel (optional): Logging level and flags used by `ffmpeg`. The stderr of `ffmpeg` is only read when its pipe is closed, so a verbose logging level may stall it.
+
+        ffmpeg_path (optional): Path to `ffmpeg`.
+
+        ffprobe_path (optional): Path to `ffprobe`.
+        """
+        if not isinstance(sample_rate, int):
+            raise TypeError("Sample rate must be an integer.")
+        elif sample_rate <= 0:
+            raise ValueError("Sample rate must be greater than 0.")
+
+        if not isinstance(channels, int):
+            raise TypeError("Channels must be an integer.")
+        elif channels <= 0:
+            raise ValueError("Channels must be greater than 0.")
+
+        if not isinstance(chunk, int):
+            raise TypeError("Chunk must be an integer.")
+        elif chunk <= 0:
+            raise ValueError("Chunk must be greater than 0.")
+
+        if not isinstance(buffer_chunks, int):
+            raise TypeError("Buffer chunks must be an integer.")
+        elif buffer_chunks <= 0:
+            raise ValueError("Buffer chunks must be greater than 0.")
+
+        # The decoder validates the rest and shares the PyAudio context.
+        self._decoder = _Audio(frames_per_buffer = frames_per_buffer, data_format = SInt8 if data_format == UInt8 else data_format, encoding = encoding, use_ffmpeg = use_ffmpeg, loglevel = loglevel, ffmpeg_path = ffmpeg_path, ffprobe_path = ffprobe_path)
+
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.data_format = data_format
+        self.width = self._decoder.audioop_format
+        self.frame_size = self.width * channels
+
+        if chunk % self.frame_size != 0:
+            raise ValueError(f"Chunk (which is {chunk}) must be a multiple of the frame size (which is {self.frame_size}).")
+
+        self.chunk = chunk
+        self.buffer_chunks = buffer_chunks
+        self.exception = None
+
+        self._sources = []
+        self._output_thread = None
+        self._decode_thread = None
+        self._terminate = False
+        self._event = _threading.Event()
+        self._decode_event = _threading.Event()
+        self._lock = _threading.RLock()
+        self._use_select = _os.name != "nt"
+        self._volume = 1.0
+
+    @property
+    def volume(self) -> _Union[int, float]:
+        """
+        The mixer's volume, applied on top of every source's volume.
+        """
+        return self._volume
+
+    @volume.setter
+    def volume(self, volume: _Union[int, float]) -> None:
+        if not isinstance(volume, (int, float)):
+            raise TypeError("Volume must be an integer/a float.")
+
+        if volume < 0:
+            raise ValueError("Volume must be non-negative.")
+
+        self._volume = volume
+
+    @property
+    def sources(self) -> _Tuple[Source, ...]:
+        """
+        A read-only attribute whose value is a tuple of the sources that are currently playing or paused.
+        """
+        with self._lock:
+            return (*self._sources,)
+
+    @property
+    def is_busy(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if one of the mixer's threads is running, otherwise `False`.
+        """
+        return any(thread.is_alive() for thread in (self._output_thread, self._decode_thread) if thread)
+
+    def set_output_device_by_index(self, device_index: _Optional[int] = None) -> None:
+        """
+        Set output device by index. It takes effect the next time the mixer starts.
+
+        Parameters
+        ----------
+
+        device_index: Device's index. Set output device to the default output device if the given device index is `None`.
+        """
+        self._decoder.set_output_device_by_index(device_index)
+
+    def start(self, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None) -> None:
+        """
+        Start the output and decode threads if they aren't running. `play()` calls this function with the default arguments.
+
+        Parameters
+        ----------
+
+        delay (optional): Longest interval between each check of the threads when they're idle in seconds.
+
+        daemon (optional): Specifies whether the threads are daemon threads.
+        """
+        if not isinstance(delay, (int, float)):
+            raise TypeError("Delay must be an integer/a float.")
+        elif delay < 0:
+            raise ValueError("Delay must be non-negative.")
+
+        if self.is_busy and not self._terminate:
+            return
+
+        # Threads stopped by an exception are joined first, so two decode threads never read the same pipes.
+        for thread in (self._output_thread, self._decode_thread):
+            if thread:
+                thread.join()
+
+        self.exception = None
+        self._terminate = False
+        self._event.clear()
+        self._decode_event.clear()
+
+        self._output_thread = _threading.Thread(target = self.output, args = (delay,), daemon = daemon)
+        self._decode_thread = _threading.Thread(target = self.decode, args = (delay,), daemon = daemon)
+        self._output_thread.start()
+        self._decode_thread.start()
+
+    def play(self, path: _Union[str, _os.PathLike], stream: int = 0, loop: int = 0, start: _Union[int, float] = 0, volume: _Union[int, float] = 1, pan: _Union[int, float] = 0, paused: bool = False) -> Source:
+        """
+        Start playing a file and return its `Source` object, which controls it.
+
+        Parameters
+        ----------
+
+        path: Path to the file contains audio.
+
+        stream (optional): Which stream to use if the file has more than 1 audio streams. Use the default stream if the given stream is invalid.
+
+        loop (optional): How many times to repeat the audio. If the given loop is `-1` repeats indefinitely.
+
+        start (optional): Where the audio starts playing in seconds.
+
+        volume (optional): The source's volume.
+
+        pan (optional): The source's pan from `-1` (left) to `1` (right).
+
+        paused (optional): Specifies whether the source starts paused.
+        """
+        try:
+            path = _os.fspath(path)
+        except TypeError:
+            pass
+
+        if not isinstance(path, str):
+            raise TypeError("Path must be a string/a path-like object.")
+
+        if not isinstance(stream, int):
+            raise TypeError("Stream must be an integer.")
+
+        if not isinstance(loop, int):
+            raise TypeError("Loop must be an integer.")
+        elif loop < -1:
+            raise ValueError("Loop must be -1 or greater.")
+
+        if not isinstance(start, (int, float)):
+            raise TypeError("Start position must be an integer/a float.")
+
+        source = Source(self, path, stream, loop, volume, pan)
+        source._is_paused = paused
+        self.open_pipe(source, 0 if start < 0 else start)
+
+        return self.add(source)
+
+    def add(self, source: Source) -> Source:
+        """
+        Start playing a source that is ready to be read, e.g. a voice of a `simple_pygame.mixer.sound.Sound` object, and return it.
+
+        Parameters
+        ----------
+
+        source: The `Source` object.
+        """
+        with self._lock:
+            self._sources.append(source)
+
+        self.start()
+        self._decode_event.set()
+        self._event.set()
+        return source
+
+    def chain(self, source: Source, next_source: Source, crossfade: _Union[int, float] = 0) -> None:
+        """
+        Resume a paused source when another source ends, so the next source starts at the sample where the other one ends. Use it to play files one after another without a gap.
+
+        Parameters
+        ----------
+
+        source: The `Source` object that is played first.
+
+        next_source: The paused `Source` object that is played next. Its pipe is decoded while it waits, so it's ready when the other source ends. If it hasn't decoded a chunk by then, the other source is kept until it has.
+
+        crossfade (optional): How many seconds before the end of `source` to start `next_source`, fading `source` out and `next_source` in. It only has an effect if the length of `source` is known and it doesn't loop.
+        """
+        if not isinstance(source, Source) or not isinstance(next_source, Source):
+            raise TypeError("Source and next source must be Source objects.")
+
+        if not isinstance(crossfade, (int, float)):
+            raise TypeError("Crossfade must be an integer/a float.")
+        elif crossfade < 0:
+            raise ValueError("Crossfade must be non-negative.")
+
+        next_source._is_paused = True
+        next_source._fade_in = crossfade
+        source._fade_out = crossfade
+        source._next = next_source
+
+    def remove(self, source: Source) -> None:
+        """
+        Stop a source and remove it from the mixer.
+
+        Parameters
+        ----------
+
+        source: The `Source` object returned by `play()`.
+        """
+        with self._lock:
+            if source not in self._sources:
+                return
+            self._sources.remove(source)
+
+        self.close_source(source)
+
+    def stop(self) -> None:
+        """
+        Stop every source and the mixer's threads.
+        """
+        self._terminate = True
+        self._event.set()
+        self._decode_event.set()
+
+        with self._lock:
+            sources, self._sources = self._sources, []
+
+        for source in sources:
+            self.close_source(source)
+
+        for thread in (self._output_thread, self._decode_thread):
+            if thread:
+                thread.join()
+        self._output_thread, self._decode_thread = None, None
+
+    def get_sources(self) -> _Tuple[Source, ...]:
+        """
+        Return a tuple of the sources that are currently playing or paused.
+        """
+        return self.sources
+
+    def set_volume(self, volume: _Union[int, float]) -> None:
+        """
+        Set the mixer's volume.
+
+        Parameters
+        ----------
+
+        volume: The mixer's volume (`1` is the original volume).
+        """
+        self.volume = volume
+
+    def get_volume(self) -> _Union[int, float]:
+        """
+        Return the mixer's volume.
+        """
+        return self.volume
+
+    def get_busy(self) -> bool:
+        """
+        Return `True` if the mixer's threads are running, otherwise `False`.
+        """
+        return self.is_busy
+
+    def get_exception(self) -> None:
+        """
+        If an exception is found then raise it, otherwise do nothing.
+        """
+        if self.exception:
+            raise self.exception
+
+    def terminate(self) -> None:
+        """
+        Clean up everything. Be sure to call this method for every instance of the `Mixer` class.
+        """
+        self.stop()
+        self._decoder.terminate()
+
+    def open_pipe(self, source: Source, position: _Union[int, float]) -> None:
+        """
+        Start decoding a source from a position, replacing its previous pipe. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        source: The `Source` object.
+
+        position: Where to start decoding in seconds.
+        """
+        decoder = self._decoder
+        input_options = [*decoder.input_options, "-stream_loop", str(source.loop)] if source.loop != 0 else decoder.input_options
+        output_options = [*decoder.output_options, "-ar", str(self.sample_rate), "-ac", str(self.channels)]
+
+        pipe, information, stream_information = decoder.create_pipe(source.path, position, source.stream, decoder.encoding, decoder.ffmpeg_format, decoder.use_ffmpeg, decoder.loglevel, decoder.ffmpeg_path, decoder.ffprobe_path, input_options, output_options)
+
+        duration = stream_information.get("duration", None)
+        if duration == None:
+            duration = information["format"].get("duration", None)
+
+        with source._lock:
+            previous_pipe, source._pipe = source._pipe, pipe
+            source._buffer.clear()
+            source._is_decoded = False
+            source._start_position = position
+            source._frames = 0
+            source._duration = float(duration) if duration != None else None
+
+        if previous_pipe:
+            self.close_pipe(source, previous_pipe)
+        self._decode_event.set()
+
+    def close_pipe(self, source: Source, pipe: _subprocess.Popen) -> None:
+        """
+        Clean up a pipe of a source. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        source: The `Source` object.
+
+        pipe: The pipe to clean up.
+        """
+        pipe.stdout.close()
+        pipe.terminate()
+        source.returncode = pipe.wait()
+        source.stderr = pipe.stderr.read()
+        pipe.stderr.close()
+
+    def close_source(self, source: Source) -> None:
+        """
+        Mark a removed source as stopped and clean up its pipe. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        source: The `Source` object.
+        """
+        with source._lock:
+            pipe, source._pipe = source._pipe, None
+            source._is_busy = False
+            if source._buffer:
+                source._buffer.close()
+
+        if pipe:
+            self.close_pipe(source, pipe)
+
+    def output(self, delay: _Union[int, float]) -> None:
+        """
+        Mix every source and write the result to the output stream until the mixer stops. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        delay: Longest interval between each check when the mixer is idle in seconds.
+        """
+        decoder = self._decoder
+        chunk, width, channels = self.chunk, self.width, self.channels
+
+        try:
+            stream_out = decoder._pyaudio_context.open(self.sample_rate, channels, decoder.pyaudio_format if self.data_format != UInt8 else _pyaudio.paUInt8, decoder._output_device_index, decoder.frames_per_buffer)
+
+            while not self._terminate:
+                fragments, gains, finished_sources, started_sources = [], [], [], []
+
+                for source in self.sources:
+                    if source._is_paused or source in started_sources:
+                        continue
+
+                    data = source.read(chunk)
+                    if data != None:
+                        fragments.append(data)
+                        gains.append(source.get_gain(channels))
+
+                    next_source = source._next
+                    waiting = next_source != None and next_source._is_busy and next_source._is_paused
+                    if waiting:
+                        remaining = source.get_remaining()
+
+                        # Only switch once the next source decoded a chunk, otherwise its first chunk would be silence.
+                        if (source.is_finished or source._fade_out > 0 and remaining != None and remaining <= source._fade_out) and next_source.is_ready(chunk):
+                            waiting = False
+
+                            # A crossfade starts at the chunk's start, otherwise the next source starts right after the last sample of this one.
+                            offset = source._read_size if source.is_finished and data != None else 0
+                            next_source._is_paused = False
+                            started_sources.append(next_source)
+
+                            next_data = next_source.read(chunk - offset)
+                            if next_data != None:
+                                fragments.append(bytes(offset) + next_data if offset else next_data)
+                                gains.append(next_source.get_gain(channels))
+
+                    # A finished source is kept until the source chained to it starts.
+                    if source.is_finished and not waiting:
+                        finished_sources.append(source)
+
+                for source in finished_sources:
+                    self.remove(source)
+
+                if not fragments:
+                    # Wait for a source to be played, resumed or decoded.
+                    self._event.wait(delay)
+                    self._event.clear()
+                    continue
+                self._decode_event.set()
+
+                data = _mix(fragments, width, gains, channels)
+                if self.data_format == UInt8:
+                    data = _bias(data, 1, 128)
+
+                stream_out.write(data)
+        except Exception as exception:
+            self.exception = exception
+            self._terminate = True
+            self._decode_event.set()
+        finally:
+            try:
+                decoder._pyaudio_context.close(stream_out)
+            except NameError:
+                pass
+
+    def decode(self, delay: _Union[int, float]) -> None:
+        """
+        Read every source's pipe into its buffer until the mixer stops. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        delay: Longest interval between each check when the mixer is idle in seconds.
+        """
+        try:
+            while not self._terminate:
+                sources = [source for source in self.sources if source._pipe and not source._is_decoded and source._buffer.capacity - source._buffer.size >= self.chunk]
+                if not sources:
+                    self._decode_event.wait(delay)
+                    self._decode_event.clear()
+                    continue
+
+                # Pipes can only be selected on POSIX, otherwise they're read one after another.
+                ready = None
+                if self._use_select:
+                    try:
+                        ready = _select.select([source._pipe.stdout for source in sources], [], [], delay)[0]
+                    except (AttributeError, OSError, ValueError):
+                        # A pipe was closed by a seek or a stop.
+                        continue
+
+                for source in sources:
+                    with source._lock:
+                        if not source._pipe or source._is_decoded or (ready != None and source._pipe.stdout not in ready):
+                            continue
+
+                        # Read the file descriptor directly, so no data is left in a Python buffer that the next select doesn't see.
+                        data = _os.read(source._pipe.stdout.fileno(), source._buffer.capacity - source._buffer.size)
+                        if data:
+                            source._buffer.write(data)
+                        else:
+                            source._is_decoded = True
+                            source._buffer.finish()
+
+                self._event.set()
+        except Exception as exception:
+            self.exception = exception
+            self._terminate = True
+            self._event.set()
+
+    def __enter__(self) -> "Mixer":
+        """
+        Return this mixer.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Clean up everything.
+        """
+        self.terminate()
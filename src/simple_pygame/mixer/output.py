@@ -0,0 +1,164 @@
+"""
+A module for sharing PyAudio and its output streams between audio objects.
+"""
+import pyaudio as _pyaudio, threading as _threading
+from typing import Optional as _Optional, Callable as _Callable, Dict as _Dict, Union as _Union, Any as _Any
+
+class PyAudioContext:
+    def __init__(self, max_idle_streams: int = 8) -> None:
+        """
+        A reference-counted `pyaudio.PyAudio` object shared by audio objects, with a pool of open output streams that are reused between plays. PortAudio is initialized by the first `acquire()` and terminated when the last reference is released.
+
+        Parameters
+        ----------
+
+        max_idle_streams (optional): Maximum number of idle output streams kept open. Streams aren't pooled if the given maximum is `0`.
+        """
+        if not isinstance(max_idle_streams, int):
+            raise TypeError("Max idle streams must be an integer.")
+        elif max_idle_streams < 0:
+            raise ValueError("Max idle streams must be non-negative.")
+
+        self.max_idle_streams = max_idle_streams
+
+        self._pa = None
+        self._count = 0
+        self._idle = {}
+        self._keys = {}
+        self._lock = _threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def count(self) -> int:
+        """
+        A read-only attribute whose value is the number of references to the `pyaudio.PyAudio` object.
+        """
+        return self._count
+
+    @property
+    def idle_count(self) -> int:
+        """
+        A read-only attribute whose value is the number of idle output streams in the pool.
+        """
+        with self._lock:
+            return sum(len(streams) for streams in self._idle.values())
+
+    def acquire(self) -> _pyaudio.PyAudio:
+        """
+        Return the shared `pyaudio.PyAudio` object and add a reference to it. Call `release()` once for every call to this function.
+        """
+        with self._lock:
+            if self._pa == None:
+                self._pa = _pyaudio.PyAudio()
+
+            self._count += 1
+            return self._pa
+
+    def release(self) -> None:
+        """
+        Remove a reference to the shared `pyaudio.PyAudio` object. Close the idle output streams and terminate PortAudio when the last reference is removed.
+        """
+        with self._lock:
+            if self._count == 0:
+                return
+
+            self._count -= 1
+            if self._count != 0:
+                return
+
+            self.clear()
+            self._pa.terminate()
+            self._pa = None
+
+    def open(self, rate: int, channels: int, format: int, output_device_index: _Optional[int] = None, frames_per_buffer: _Union[int, _Any] = _pyaudio.paFramesPerBufferUnspecified, stream_callback: _Optional[_Callable] = None, start: bool = True) -> _Any:
+        """
+        Return an output stream, reusing an idle one with the same device, sample rate, channels, format and frames per buffer if there's one. Give the stream back with `close()` instead of closing it. Streams with a callback are always new, since their callback can't be changed.
+
+        Parameters
+        ----------
+
+        rate: Sample rate.
+
+        channels: Number of channels.
+
+        format: PyAudio sample format.
+
+        output_device_index (optional): Index of the output device. Use the default output device if the given index is `None`.
+
+        frames_per_buffer (optional): Number of frames per buffer.
+
+        stream_callback (optional): A PyAudio stream callback. The stream is opened in blocking mode if the given callback is `None`.
+
+        start (optional): Specifies whether to start the stream.
+        """
+        with self._lock:
+            if self._pa == None:
+                raise RuntimeError("The PyAudio context must be acquired before opening a stream.")
+
+            key = (output_device_index, rate, channels, format, frames_per_buffer)
+            streams = self._idle.get(key, None) if stream_callback == None else None
+
+            if streams:
+                stream = streams.pop()
+                if not streams:
+                    del self._idle[key]
+                self._hits += 1
+            else:
+                stream = self._pa.open(rate, channels, format, output = True, output_device_index = output_device_index, frames_per_buffer = frames_per_buffer, stream_callback = stream_callback, start = start)
+                if stream_callback == None:
+                    self._misses += 1
+                    self._keys[stream] = key
+                return stream
+
+        if start and stream.is_stopped():
+            stream.start_stream()
+        return stream
+
+    def close(self, stream: _Any) -> None:
+        """
+        Stop an output stream returned by `open()` and keep it in the pool if there's room, otherwise close it.
+
+        Parameters
+        ----------
+
+        stream: The output stream.
+        """
+        try:
+            if not stream.is_stopped():
+                stream.stop_stream()
+        except OSError:
+            pass
+
+        with self._lock:
+            key = self._keys.get(stream, None)
+
+            if key != None and self._pa != None and self.idle_count < self.max_idle_streams:
+                self._idle.setdefault(key, []).append(stream)
+                return
+
+            self._keys.pop(stream, None)
+
+        stream.close()
+
+    def clear(self) -> None:
+        """
+        Close every idle output stream in the pool.
+        """
+        with self._lock:
+            for streams in self._idle.values():
+                for stream in streams:
+                    self._keys.pop(stream, None)
+                    stream.close()
+
+            self._idle.clear()
+
+    def get_stats(self) -> _Dict[str, int]:
+        """
+        Return the pool statistics: reused streams (`hits`), newly opened streams (`misses`), idle streams and references.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "idle": self.idle_count, "references": self._count}
+
+default_context = PyAudioContext()
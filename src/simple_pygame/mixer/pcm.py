@@ -0,0 +1,120 @@
+"""
+A module for reading uncompressed audio files without `ffmpeg`.
+"""
+import mmap as _mmap, struct as _struct, os as _os
+from typing import Optional as _Optional, Union as _Union, Dict as _Dict, Any as _Any
+
+from .probe import parse_wav_header as _parse_wav_header
+
+class PCMReader:
+    def __init__(self, path: _Union[str, _os.PathLike], offset: int = 0, size: _Optional[int] = None, information: _Optional[_Dict[str, _Any]] = None, stream_information: _Optional[_Dict[str, _Any]] = None) -> None:
+        """
+        A memory-mapped reader of the samples of an uncompressed audio file, such as a WAV file, a raw PCM file or an entry of a `simple_pygame.mixer.cache.PCMCache` object. Reading only copies the mapped samples and seeking only moves the offset.
+
+        Parameters
+        ----------
+
+        path: Path to the file.
+
+        offset (optional): Offset in bytes of the first sample in the file.
+
+        size (optional): Size in bytes of the samples. Read until the end of the file if the given size is `None`.
+
+        information (optional): The file's information.
+
+        stream_information (optional): The stream's information.
+        """
+        if not isinstance(offset, int):
+            raise TypeError("Offset must be an integer.")
+        elif offset < 0:
+            raise ValueError("Offset must be non-negative.")
+
+        if size != None and not isinstance(size, int):
+            raise TypeError("Size must be None/an integer.")
+        elif size != None and size < 0:
+            raise ValueError("Size must be non-negative.")
+
+        self.information = information
+        self.stream_information = stream_information
+        self.offset = 0
+
+        with open(path, "rb") as file:
+            # An empty file can't be mapped.
+            self._mapping = _mmap.mmap(file.fileno(), 0, access = _mmap.ACCESS_READ) if _os.fstat(file.fileno()).st_size else b""
+
+        end = len(self._mapping) if size == None else min(offset + size, len(self._mapping))
+        self._buffer = memoryview(self._mapping)[min(offset, end):end]
+
+        self.size = len(self._buffer)
+
+    @classmethod
+    def open_wav(self, path: _Union[str, _os.PathLike], data_format: str, information: _Optional[_Dict[str, _Any]] = None, stream_information: _Optional[_Dict[str, _Any]] = None) -> _Optional["PCMReader"]:
+        """
+        Return a reader of the samples of a WAV file if they're stored in a data format, otherwise `None`.
+
+        Parameters
+        ----------
+
+        path: Path to the WAV file.
+
+        data_format: The data format used by `ffmpeg` (`u8`, `s16le`, `s24le` or `s32le`).
+
+        information (optional): The file's information.
+
+        stream_information (optional): The stream's information.
+        """
+        try:
+            with open(path, "rb") as file:
+                layout = _parse_wav_header(file)
+        except (OSError, ValueError, _struct.error):
+            return None
+
+        if layout == None or layout["format_tag"] != 1:
+            return None
+
+        # WAV files store 8-bit samples unsigned and wider samples signed, both in little-endian.
+        width = layout["bits_per_sample"] // 8
+        if layout["bits_per_sample"] % 8 != 0 or layout["block_align"] != width * layout["channels"] or data_format != ("u8" if width == 1 else f"s{width * 8}le"):
+            return None
+
+        return self(path, layout["data_offset"], layout["data_size"], information, stream_information)
+
+    def readinto(self, buffer: memoryview) -> int:
+        """
+        Copy the next bytes into a buffer and return how many bytes were copied.
+
+        Parameters
+        ----------
+
+        buffer: A writable bytes-like object.
+        """
+        size = min(len(buffer), self.size - self.offset)
+        buffer[:size] = self._buffer[self.offset:self.offset + size]
+
+        self.offset += size
+        return size
+
+    def seek(self, offset: int) -> None:
+        """
+        Set the offset in bytes of the next read.
+
+        Parameters
+        ----------
+
+        offset: The new offset, which is limited to the size of the samples.
+        """
+        self.offset = min(max(offset, 0), self.size)
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        if self._buffer == None:
+            return
+
+        self._buffer.release()
+        self._buffer = None
+
+        if isinstance(self._mapping, _mmap.mmap):
+            self._mapping.close()
+        self._mapping = None
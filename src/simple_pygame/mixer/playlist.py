@@ -0,0 +1,325 @@
+"""
+A module for playing files one after another without a gap.
+"""
+import threading as _threading, os as _os
+from typing import Optional as _Optional, Union as _Union, Iterable as _Iterable, Tuple as _Tuple
+
+from .mixer import Mixer as _Mixer, Source as _Source
+
+class Playlist:
+    def __init__(self, paths: _Iterable[_Union[str, _os.PathLike]] = (), mixer: _Optional[_Mixer] = None, preload: _Union[int, float] = 5, crossfade: _Union[int, float] = 0) -> None:
+        """
+        A queue of files that are played one after another through a `simple_pygame.mixer.mixer.Mixer` object. The next file is probed and its `ffmpeg` is started `preload` seconds before the current file ends, then the mixer switches to it at the sample where the current file ends, so there is no gap and no startup stall.
+
+        Requirements
+        ------------
+
+        - Pyaudio library.
+
+        - FFmpeg.
+
+        - FFprobe (optional).
+
+        Parameters
+        ----------
+
+        paths (optional): Paths to the files contain audio.
+
+        mixer (optional): The `Mixer` object that plays the files. Every file is decoded to its sample rate and channels, so one output stream plays them all. Create a mixer with the default arguments if the given mixer is `None`.
+
+        preload (optional): How many seconds before the current file ends to start decoding the next file. If the current file's length is unknown, the next file is preloaded right away.
+
+        crossfade (optional): How many seconds the current file fades out while the next file fades in.
+        """
+        if mixer != None and not isinstance(mixer, _Mixer):
+            raise TypeError("Mixer must be None/a Mixer object.")
+
+        if not isinstance(preload, (int, float)):
+            raise TypeError("Preload must be an integer/a float.")
+        elif preload < 0:
+            raise ValueError("Preload must be non-negative.")
+
+        if not isinstance(crossfade, (int, float)):
+            raise TypeError("Crossfade must be an integer/a float.")
+        elif crossfade < 0:
+            raise ValueError("Crossfade must be non-negative.")
+
+        self.mixer = mixer if mixer != None else _Mixer()
+        self.preload = preload
+        self.crossfade = crossfade
+        self.exception = None
+
+        self._own_mixer = mixer == None
+        self._queue = []
+        self._current = None
+        self._next = None
+        self._paused_sources = []
+        self._thread = None
+        self._terminate = False
+        self._event = _threading.Event()
+        self._lock = _threading.RLock()
+
+        for path in paths:
+            self.add(path)
+
+    @property
+    def current(self) -> _Optional[_Source]:
+        """
+        A read-only attribute whose value is the `Source` object of the file that is currently playing or paused, otherwise `None`.
+        """
+        return self._current
+
+    @property
+    def queue(self) -> _Tuple[_Tuple[str, int], ...]:
+        """
+        A read-only attribute whose value is a tuple of the paths and streams of the files that haven't started yet, including a preloaded file.
+        """
+        with self._lock:
+            queue = [(self._next.path, self._next.stream)] if self._next else []
+            return (*queue, *self._queue)
+
+    @property
+    def is_busy(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the playlist is currently playing or paused, otherwise `False`.
+        """
+        return self._thread.is_alive() if self._thread else False
+
+    @property
+    def is_paused(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the playlist is currently paused, otherwise `False`.
+        """
+        return bool(self._paused_sources)
+
+    def add(self, path: _Union[str, _os.PathLike], stream: int = 0) -> None:
+        """
+        Add a file to the end of the playlist.
+
+        Parameters
+        ----------
+
+        path: Path to the file contains audio.
+
+        stream (optional): Which stream to use if the file has more than 1 audio streams. Use the default stream if the given stream is invalid.
+        """
+        try:
+            path = _os.fspath(path)
+        except TypeError:
+            pass
+
+        if not isinstance(path, str):
+            raise TypeError("Path must be a string/a path-like object.")
+
+        if not isinstance(stream, int):
+            raise TypeError("Stream must be an integer.")
+
+        with self._lock:
+            self._queue.append((path, stream))
+        self._event.set()
+
+    def play(self, delay: _Union[int, float] = 0.1, daemon: _Optional[bool] = None) -> None:
+        """
+        Start playing the playlist if it isn't playing. It stops by itself after the last file ends.
+
+        Parameters
+        ----------
+
+        delay (optional): Longest interval between each check of the current file's position in seconds. It must be shorter than `preload`.
+
+        daemon (optional): Specifies whether the playlist's thread is a daemon thread.
+        """
+        if not isinstance(delay, (int, float)):
+            raise TypeError("Delay must be an integer/a float.")
+        elif delay < 0:
+            raise ValueError("Delay must be non-negative.")
+
+        if self.is_busy:
+            return
+
+        self.exception = None
+        self._terminate = False
+        self._event.clear()
+
+        self._thread = _threading.Thread(target = self.update, args = (delay,), daemon = daemon)
+        self._thread.start()
+
+    def next(self) -> None:
+        """
+        Stop the current file and play the next one.
+        """
+        with self._lock:
+            current, next_source = self._current, self._next
+
+            if next_source:
+                next_source.resume()
+
+        if current:
+            current.stop()
+        self._event.set()
+
+    def pause(self) -> None:
+        """
+        Pause the playlist if it's currently playing and not paused. It can be resumed with `resume()`.
+        """
+        with self._lock:
+            if self._paused_sources:
+                return
+
+            # The preloaded file is already paused while it waits, unless it's fading in.
+            for source in (self._current, self._next):
+                if source and source.is_busy and not source.is_paused:
+                    source.pause()
+                    self._paused_sources.append(source)
+
+    def resume(self) -> None:
+        """
+        Resume the playlist after it has been paused.
+        """
+        with self._lock:
+            sources, self._paused_sources = self._paused_sources, []
+
+        for source in sources:
+            source.resume()
+
+    def stop(self) -> None:
+        """
+        Stop the playlist. The files that haven't started stay in the playlist, except a preloaded one.
+        """
+        self._terminate = True
+        self._event.set()
+
+        if self._thread and self._thread is not _threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+        with self._lock:
+            sources = (self._current, self._next)
+            self._current, self._next, self._paused_sources = None, None, []
+
+        for source in sources:
+            if source:
+                source.stop()
+
+    def clear(self) -> None:
+        """
+        Remove the files that haven't started from the playlist.
+        """
+        with self._lock:
+            self._queue.clear()
+            next_source, self._next = self._next, None
+
+        if next_source:
+            next_source.stop()
+
+    def get_current(self) -> _Optional[_Source]:
+        """
+        Return the `Source` object of the file that is currently playing or paused, otherwise `None`.
+        """
+        return self.current
+
+    def get_queue(self) -> _Tuple[_Tuple[str, int], ...]:
+        """
+        Return a tuple of the paths and streams of the files that haven't started yet.
+        """
+        return self.queue
+
+    def get_pause(self) -> bool:
+        """
+        Return `True` if the playlist is currently paused, otherwise `False`.
+        """
+        return self.is_paused
+
+    def get_busy(self) -> bool:
+        """
+        Return `True` if the playlist is currently playing or paused, otherwise `False`.
+        """
+        return self.is_busy
+
+    def get_exception(self) -> None:
+        """
+        If an exception is found then raise it, otherwise do nothing.
+        """
+        if self.exception:
+            raise self.exception
+
+    def terminate(self) -> None:
+        """
+        Clean up everything. Be sure to call this method for every instance of the `Playlist` class.
+        """
+        self.stop()
+
+        if self._own_mixer:
+            self.mixer.terminate()
+
+    def pop(self) -> _Optional[_Tuple[str, int]]:
+        """
+        Remove and return the path and stream of the next file, or `None` if the playlist is empty. This function is meant for use by the class and not for general use.
+        """
+        with self._lock:
+            return self._queue.pop(0) if self._queue else None
+
+    def update(self, delay: _Union[int, float]) -> None:
+        """
+        Start the next file when needed until the playlist ends or stops. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        delay: Longest interval between each check of the current file's position in seconds.
+        """
+        try:
+            while not self._terminate:
+                with self._lock:
+                    current, next_source = self._current, self._next
+
+                    if current and not current.is_busy:
+                        # The mixer switched to the preloaded file, or the current file stopped before the switch.
+                        if next_source and next_source.is_busy and next_source.is_paused and next_source not in self._paused_sources:
+                            if self._paused_sources:
+                                self._paused_sources.append(next_source)
+                            else:
+                                next_source.resume()
+
+                        current, next_source = next_source, None
+                        self._current, self._next = current, None
+
+                if not current:
+                    item = self.pop()
+                    if not item:
+                        break
+
+                    source = self.mixer.play(*item)
+                    with self._lock:
+                        self._current = source
+                    continue
+
+                remaining = current.get_remaining()
+                if not next_source and (remaining == None or remaining <= self.preload):
+                    item = self.pop()
+
+                    if item:
+                        # Probe and start decoding the next file while the current one plays. The mixer keeps the current file until the next one decoded a chunk, so the switch never plays silence.
+                        next_source = self.mixer.play(*item, paused = True)
+                        self.mixer.chain(current, next_source, self.crossfade)
+
+                        with self._lock:
+                            self._next = next_source
+                        continue
+
+                self._event.wait(delay)
+                self._event.clear()
+        except Exception as exception:
+            self.exception = exception
+
+    def __enter__(self) -> "Playlist":
+        """
+        Return this playlist.
+        """
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Clean up everything.
+        """
+        self.terminate()
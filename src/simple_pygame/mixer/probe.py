@@ -0,0 +1,309 @@
+"""
+A module for reading the information of WAV, FLAC and Ogg files from their headers without `ffprobe`.
+"""
+import struct as _struct, os as _os
+from typing import Optional as _Optional, Union as _Union, BinaryIO as _BinaryIO, Tuple as _Tuple, List as _List, Dict as _Dict, Any as _Any
+
+# Codec name and sample format of each WAV format tag and sample width.
+_WAV_CODECS = {
+    (1, 8): ("pcm_u8", "u8"),
+    (1, 16): ("pcm_s16le", "s16"),
+    (1, 24): ("pcm_s24le", "s32"),
+    (1, 32): ("pcm_s32le", "s32"),
+    (3, 32): ("pcm_f32le", "flt"),
+    (3, 64): ("pcm_f64le", "dbl"),
+    (6, 8): ("pcm_alaw", "s16"),
+    (7, 8): ("pcm_mulaw", "s16")
+}
+_WAVE_FORMAT_EXTENSIBLE = 0xfffe
+# The last page of an Ogg file is at most this many bytes long.
+_OGG_MAX_PAGE_SIZE = 27 + 255 + 255 * 255
+
+def probe(path: _Union[str, _os.PathLike]) -> _Optional[_Dict[str, _Any]]:
+    """
+    Return a dict contains the file's information in the same shape as `ffprobe`'s, read from the headers of a WAV, FLAC or Ogg (Vorbis/Opus) file. Return `None` if the file can't be read or isn't one of these containers, so it can be probed by `ffprobe` instead.
+
+    Parameters
+    ----------
+
+    path: Path to the file to get information.
+    """
+    try:
+        with open(path, "rb") as file:
+            size = _os.fstat(file.fileno()).st_size
+            signature = file.read(12)
+            file.seek(0)
+
+            if signature[:4] == b"RIFF" and signature[8:12] == b"WAVE":
+                format_name, streams = "wav", _probe_wav(file)
+            elif signature[:4] == b"fLaC" or signature[:3] == b"ID3":
+                format_name, streams = "flac", _probe_flac(file)
+            elif signature[:4] == b"OggS":
+                format_name, streams = "ogg", _probe_ogg(file, size)
+            else:
+                return None
+    except (OSError, _struct.error):
+        return None
+
+    if not streams:
+        return None
+
+    information = {"format": {"filename": _os.fspath(path), "nb_streams": len(streams), "nb_programs": 0, "format_name": format_name, "start_time": _format_time(0), "size": str(size)}, "programs": [], "streams": streams, "chapters": []}
+
+    durations = [float(stream["duration"]) for stream in streams if "duration" in stream]
+    if durations:
+        duration = max(durations)
+        information["format"]["duration"] = _format_time(duration)
+
+        if duration > 0:
+            information["format"]["bit_rate"] = str(int(size * 8 / duration))
+
+    return information
+
+def parse_wav_header(file: _BinaryIO) -> _Optional[_Dict[str, int]]:
+    """
+    Return a dict contains the format tag, channels, sample rate, block align, sample width in bits and the offset and size of the samples of a WAV file, or `None` if it isn't a valid WAV file. The file is read from its start.
+
+    Parameters
+    ----------
+
+    file: The WAV file opened in binary mode.
+    """
+    file.seek(0, _os.SEEK_END)
+    size = file.tell()
+    file.seek(0)
+
+    header = file.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    layout = None
+    offset = 12
+    while offset + 8 <= size:
+        file.seek(offset)
+        chunk_id, chunk_size = _struct.unpack("<4sI", file.read(8))
+
+        if chunk_id == b"fmt ":
+            chunk = file.read(chunk_size)
+            if len(chunk) < 16:
+                return None
+
+            format_tag, channels, sample_rate, _, block_align, bits_per_sample = _struct.unpack("<HHIIHH", chunk[:16])
+
+            if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(chunk) >= 40:
+                # The real format tag is the start of the sub format's GUID.
+                format_tag = _struct.unpack("<H", chunk[24:26])[0]
+            layout = {"format_tag": format_tag, "codec_tag": _struct.unpack("<H", chunk[:2])[0], "channels": channels, "sample_rate": sample_rate, "block_align": block_align, "bits_per_sample": bits_per_sample}
+        elif chunk_id == b"data":
+            if layout == None or layout["channels"] == 0 or layout["sample_rate"] == 0 or layout["block_align"] == 0:
+                return None
+
+            # Files written while streaming have a size larger than the file.
+            data_size = min(chunk_size, size - offset - 8)
+            layout.update({"data_offset": offset + 8, "data_size": data_size - data_size % layout["block_align"]})
+            return layout
+
+        # Chunks are aligned to 2 bytes.
+        offset += 8 + chunk_size + chunk_size % 2
+
+    return None
+
+def _probe_wav(file: _BinaryIO) -> _List[_Dict[str, _Any]]:
+    """
+    Return a list contains the stream's information of a WAV file, or an empty list if its format is unknown. This function is meant for use by the module and not for general use.
+
+    Parameters
+    ----------
+
+    file: The file opened in binary mode.
+    """
+    layout = parse_wav_header(file)
+    if layout == None:
+        return []
+
+    codec = _WAV_CODECS.get((layout["format_tag"], layout["bits_per_sample"]), None)
+    if codec == None:
+        return []
+
+    sample_rate, channels, bits_per_sample = layout["sample_rate"], layout["channels"], layout["bits_per_sample"]
+    duration_ts = layout["data_size"] // layout["block_align"]
+
+    stream = _create_stream(codec[0], codec[1], sample_rate, channels, duration_ts, sample_rate, layout["codec_tag"])
+    stream.update({"bits_per_sample": bits_per_sample, "bit_rate": str(sample_rate * channels * bits_per_sample)})
+    return [stream]
+
+def _probe_flac(file: _BinaryIO) -> _List[_Dict[str, _Any]]:
+    """
+    Return a list contains the stream's information of a FLAC file from its STREAMINFO block, or an empty list if it isn't a valid FLAC file. This function is meant for use by the module and not for general use.
+
+    Parameters
+    ----------
+
+    file: The file opened in binary mode.
+    """
+    header = file.read(10)
+    if header[:3] == b"ID3":
+        # Skip an ID3v2 tag, whose size is stored in 7 bits per byte.
+        tag_size = 10 + sum((byte & 0x7f) << (7 * (3 - index)) for index, byte in enumerate(header[6:10]))
+        file.seek(tag_size + (10 if header[5] & 0x10 else 0))
+    else:
+        file.seek(0)
+
+    if file.read(4) != b"fLaC":
+        return []
+
+    block = file.read(38)
+    if len(block) < 38 or block[0] & 0x7f != 0:
+        return []
+
+    # The sample rate (20 bits), channels (3 bits), sample width (5 bits) and total samples (36 bits).
+    value = int.from_bytes(block[14:22], "big")
+    sample_rate, channels, bits_per_sample, total_samples = value >> 44, (value >> 41 & 0x7) + 1, (value >> 36 & 0x1f) + 1, value & 0xfffffffff
+    if sample_rate == 0:
+        return []
+
+    stream = _create_stream("flac", "s16" if bits_per_sample <= 16 else "s32", sample_rate, channels, total_samples if total_samples else None, sample_rate)
+    stream.update({"bits_per_sample": 0, "bits_per_raw_sample": str(bits_per_sample)})
+    return [stream]
+
+def _probe_ogg(file: _BinaryIO, size: int) -> _List[_Dict[str, _Any]]:
+    """
+    Return a list contains the streams' information of an Ogg file from the identification headers of its Vorbis and Opus streams, or an empty list if it contains other codecs. This function is meant for use by the module and not for general use.
+
+    Parameters
+    ----------
+
+    file: The file opened in binary mode.
+
+    size: The file's size in bytes.
+    """
+    streams = {}
+    while True:
+        page = _read_ogg_page(file)
+        # Every stream starts with a page that only contains its identification header.
+        if page == None or not page[0] & 0x2:
+            break
+
+        _, _, serial, packet = page
+        if packet[:7] == b"\x01vorbis" and len(packet) >= 28:
+            channels, sample_rate, _, bit_rate = _struct.unpack("<BIii", packet[11:24])
+            streams[serial] = ("vorbis", sample_rate, channels, sample_rate, 0, bit_rate)
+        elif packet[:8] == b"OpusHead" and len(packet) >= 19:
+            channels, pre_skip = _struct.unpack("<BH", packet[9:12])
+            # Opus is always decoded at 48 kHz.
+            streams[serial] = ("opus", 48000, channels, 48000, pre_skip, 0)
+        else:
+            return []
+
+    if not streams:
+        return []
+
+    # The granule position of the last page of a stream is its length in samples.
+    granules = {}
+    start = max(size - _OGG_MAX_PAGE_SIZE, 0)
+    file.seek(start)
+    tail = file.read()
+
+    index = tail.rfind(b"OggS")
+    while index != -1 and len(granules) < len(streams):
+        if len(tail) - index >= 27:
+            granule, serial = _struct.unpack("<qI", tail[index + 6:index + 18])
+            if serial in streams and serial not in granules and granule >= 0:
+                granules[serial] = granule
+
+        index = tail.rfind(b"OggS", 0, index)
+
+    result = []
+    for serial, (codec_name, sample_rate, channels, time_base, pre_skip, bit_rate) in streams.items():
+        granule = granules.get(serial, None)
+        stream = _create_stream(codec_name, "fltp", sample_rate, channels, max(granule - pre_skip, 0) if granule != None else None, time_base)
+        stream["index"] = len(result)
+
+        if bit_rate > 0:
+            stream["bit_rate"] = str(bit_rate)
+        result.append(stream)
+
+    return result
+
+def _read_ogg_page(file: _BinaryIO) -> _Optional[_Tuple[int, int, int, bytes]]:
+    """
+    Return the header type, granule position and serial number of the next Ogg page and its first packet, or `None` if there's no valid page. This function is meant for use by the module and not for general use.
+
+    Parameters
+    ----------
+
+    file: The file opened in binary mode.
+    """
+    header = file.read(27)
+    if len(header) < 27 or header[:4] != b"OggS":
+        return None
+
+    _, header_type, granule, serial, _, _, segments = _struct.unpack("<BBqIIIB", header[4:27])
+    lacing = file.read(segments)
+    body = file.read(sum(lacing))
+
+    # A packet ends at the first lacing value less than 255.
+    packet_size = 0
+    for value in lacing:
+        packet_size += value
+        if value < 255:
+            break
+
+    return header_type, granule, serial, body[:packet_size]
+
+def _create_stream(codec_name: str, sample_fmt: str, sample_rate: int, channels: int, duration_ts: _Optional[int], time_base: int, codec_tag: int = 0) -> _Dict[str, _Any]:
+    """
+    Return a dict contains an audio stream's information in the same shape as `ffprobe`'s. This function is meant for use by the module and not for general use.
+
+    Parameters
+    ----------
+
+    codec_name: The codec's name used by `ffmpeg`.
+
+    sample_fmt: The decoded sample format used by `ffmpeg`.
+
+    sample_rate: The stream's sample rate.
+
+    channels: The stream's channels.
+
+    duration_ts: The stream's length in `time_base` units, or `None` if it's unknown.
+
+    time_base: Number of `duration_ts` units in a second.
+
+    codec_tag (optional): The codec's tag in the container.
+    """
+    stream = {
+        "index": 0,
+        "codec_name": codec_name,
+        "codec_type": "audio",
+        "codec_tag_string": "".join(f"[{byte}]" for byte in codec_tag.to_bytes(4, "little")),
+        "codec_tag": f"0x{codec_tag:04x}",
+        "sample_fmt": sample_fmt,
+        "sample_rate": str(sample_rate),
+        "channels": channels,
+        "r_frame_rate": "0/0",
+        "avg_frame_rate": "0/0",
+        "time_base": f"1/{time_base}",
+        "start_pts": 0,
+        "start_time": _format_time(0)
+    }
+
+    channel_layout = {1: "mono", 2: "stereo"}.get(channels, None)
+    if channel_layout:
+        stream["channel_layout"] = channel_layout
+
+    if duration_ts != None:
+        stream.update({"duration_ts": duration_ts, "duration": _format_time(duration_ts / time_base)})
+
+    return stream
+
+def _format_time(value: _Union[int, float]) -> str:
+    """
+    Return a time in seconds formatted like `ffprobe`. This function is meant for use by the module and not for general use.
+
+    Parameters
+    ----------
+
+    value: The time in seconds.
+    """
+    return f"{value:.6f}"
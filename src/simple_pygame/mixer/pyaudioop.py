@@ -3,6 +3,9 @@ The built-in `audioop` module but implemented in Python.
 """
 import struct as _struct
 from array import array as _array
+from math import isfinite as _isfinite, isnan as _isnan, inf as _inf, nan as _nan
+from itertools import accumulate as _accumulate
+from operator import mul as _mul, ne as _ne
 from sys import byteorder as _byteorder
 try:
     from math import gcd as _gcd
@@ -12,12 +15,30 @@ try:
     from builtins import min as _min, max as _max
 except ImportError:
     from __builtin__ import min as _min, max as _max
-from typing import Union as _Union, Optional as _Optional, Callable as _Callable, Generator as _Generator, Sized as _Sized, Tuple as _Tuple
+from typing import Union as _Union, Optional as _Optional, Iterable as _Iterable, Sized as _Sized, Tuple as _Tuple, List as _List, Dict as _Dict, Any as _Any
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
 
 AdpcmState = _Tuple[int, int]
 RatecvState = _Tuple[int, _Tuple[_Tuple[int, int], ...]]
 ReadableBuffer = _Union[bytes, bytearray, _array, memoryview]
 
+_ADPCM_INDEX_TABLE = (-1, -1, -1, -1, 2, 4, 6, 8, -1, -1, -1, -1, 2, 4, 6, 8)
+_ADPCM_STEPSIZE_TABLE = (
+    7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+    50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230, 253, 279, 307,
+    337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066,
+    2272, 2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487, 12635, 13899,
+    15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767
+)
+_ULAW_SEGMENT_ENDS = (0x3f, 0x7f, 0xff, 0x1ff, 0x3ff, 0x7ff, 0xfff, 0x1fff)
+_ALAW_SEGMENT_ENDS = (0x1f, 0x3f, 0x7f, 0xff, 0x1ff, 0x3ff, 0x7ff, 0xfff)
+
+_tables = {}
+
 class error(Exception):
     pass
 
@@ -87,6 +108,29 @@ def _unpack_int24(buffer: ReadableBuffer) -> int:
 
     return value - 0x1000000 if value & 0x800000 else value
 
+def _unpack_int24_samples(buffer: ReadableBuffer) -> _List[int]:
+    buffer = memoryview(buffer).cast("B")
+    widened = bytearray(len(buffer) // 3 * 4)
+
+    # Move each sample into the upper 3 bytes of a 32-bit integer, then shift it back down to sign-extend it.
+    if _byteorder == "little":
+        widened[1::4], widened[2::4], widened[3::4] = buffer[0::3], buffer[1::3], buffer[2::3]
+    else:
+        widened[0::4], widened[1::4], widened[2::4] = buffer[0::3], buffer[1::3], buffer[2::3]
+
+    return [sample >> 8 for sample in memoryview(widened).cast("i").tolist()]
+
+def _pack_int24_samples(samples: _List[int]) -> bytes:
+    widened = memoryview(_array("i", [sample << 8 for sample in samples])).cast("B")
+    result = bytearray(len(samples) * 3)
+
+    if _byteorder == "little":
+        result[0::3], result[1::3], result[2::3] = widened[1::4], widened[2::4], widened[3::4]
+    else:
+        result[0::3], result[1::3], result[2::3] = widened[0::4], widened[1::4], widened[2::4]
+
+    return bytes(result)
+
 def _sample_count(buffer: _Sized, size: int) -> int:
     return len(buffer) // size
 
@@ -97,28 +141,273 @@ def _get_sample(buffer: ReadableBuffer, size: int, index: int, signed: bool = Tr
 
     return _unpack_int24(buffer) if size == 3 else _struct.unpack_from(_struct_format(size, signed), buffer)[0]
 
-def _get_samples(buffer: ReadableBuffer, size: int, signed: bool = True) -> _Generator[int, None, None]:
-    for index in range(_sample_count(buffer, size)):
-        yield _get_sample(buffer, size, index, signed)
+def _get_samples(buffer: ReadableBuffer, size: int, signed: bool = True) -> _List[int]:
+    if size == 3:
+        return _unpack_int24_samples(buffer)
+
+    return memoryview(buffer).cast("B").cast(_struct_format(size, signed)).tolist()
 
 def _put_sample(buffer: ReadableBuffer, size: int, index: int, value: int, signed: bool = True) -> None:
     _pack_int24(buffer, index * size, value) if size == 3 else _struct.pack_into(_struct_format(size, signed), buffer, index * size, value)
 
-def _get_clipfn(size: int, signed: bool = True) -> _Callable[[int], int]:
-    return lambda value: _min(_max(value, _get_minval(size, signed)), _get_maxval(size, signed))
+def _put_samples(samples: _List[int], size: int, signed: bool = True, out: _Optional[ReadableBuffer] = None) -> _Union[bytes, ReadableBuffer]:
+    result = _pack_int24_samples(samples) if size == 3 else _array(_struct_format(size, signed), samples).tobytes()
+    if out is None:
+        return result
+
+    memoryview(out).cast("B")[:] = result
+    return out
+
+def _clip_samples(samples: _Iterable[int], size: int, signed: bool = True) -> _List[int]:
+    minval, maxval = _get_minval(size, signed), _get_maxval(size, signed)
+    return [minval if sample < minval else maxval if sample > maxval else sample for sample in samples]
+
+def _np_get_samples(buffer: ReadableBuffer, size: int) -> _Any:
+    if size == 3:
+        raw = _np.frombuffer(buffer, _np.uint8).reshape(-1, 3).astype(_np.int64)
+
+        if _byteorder == "little":
+            value = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        else:
+            value = raw[:, 2] | (raw[:, 1] << 8) | (raw[:, 0] << 16)
+
+        return (value ^ 0x800000) - 0x800000
+
+    return _np.frombuffer(buffer, "i" + str(size)).astype(_np.int64)
+
+def _np_put_samples(samples: _Any, size: int, out: _Optional[ReadableBuffer] = None) -> _Union[bytes, ReadableBuffer]:
+    if size == 3:
+        raw = samples.astype("i4").view(_np.uint8).reshape(-1, 4)
+        raw = raw[:, :3] if _byteorder == "little" else raw[:, 1:]
+    else:
+        raw = samples.astype("i" + str(size))
+
+    if out is None:
+        return raw.tobytes()
+
+    _np.frombuffer(out, raw.dtype).reshape(raw.shape)[...] = raw
+    return out
+
+def _np_supports_factors(*factors: _Any) -> bool:
+    try:
+        return _np is not None and all(isinstance(factor, (int, float)) and _isfinite(factor) for factor in factors)
+    except OverflowError:
+        return False
+
+def _np_extremes(samples: _Any, previous_difference: int = 0) -> _Tuple[_Any, int]:
+    differences = _np.sign(_np.diff(samples))
+
+    # Look up the last nonzero difference before each one, starting with the one carried over from the previous fragment.
+    all_differences = _np.concatenate(((_np.sign(previous_difference),), differences))
+    last_nonzero = _np.maximum.accumulate(_np.where(all_differences != 0, _np.arange(len(all_differences)), -1))
+    previous_differences = all_differences[_np.maximum(last_nonzero[:-1], 0)]
+
+    return samples[:-1][differences * previous_differences < 0], int(all_differences[_max(int(last_nonzero[-1]), 0)])
+
+def _np_energy(samples: _Any) -> int:
+    high, low = samples >> 16, samples & 0xffff
+
+    # Split the samples so the sums of squares can't overflow 64-bit integers.
+    return (int(_np.dot(high, high)) << 32) + (int(_np.dot(high, low)) << 17) + int(_np.dot(low, low))
+
+def _extremes(samples: _List[int], previous_difference: int = 0) -> _Tuple[_List[int], int]:
+    extremes = []
+    previous_value = samples[0]
+
+    for value in samples[1:]:
+        difference = value - previous_value
+
+        if difference * previous_difference < 0:
+            extremes.append(previous_value)
+
+        previous_value = value
+        if difference != 0:
+            previous_difference = difference
+
+    return extremes, previous_difference
+
+def _search_segment(value: int, segment_ends: _Tuple[int, ...]) -> int:
+    for segment, segment_end in enumerate(segment_ends):
+        if value <= segment_end:
+            return segment
+
+    return len(segment_ends)
+
+def _ulaw2linear(ulaw: int) -> int:
+    ulaw = ~ulaw & 0xff
+    value = (((ulaw & 0x0f) << 3) + 0x84) << ((ulaw >> 4) & 0x07)
+
+    return 0x84 - value if ulaw & 0x80 else value - 0x84
+
+def _alaw2linear(alaw: int) -> int:
+    alaw ^= 0x55
+    segment = (alaw & 0x70) >> 4
+    value = (alaw & 0x0f) << 4
+
+    if segment == 0:
+        value += 8
+    else:
+        value = (value + 0x108) << (segment - 1)
+
+    return value if alaw & 0x80 else -value
+
+def _linear2ulaw(value: int) -> int:
+    # The value is 14-bit.
+    if value < 0:
+        value, mask = -value, 0x7f
+    else:
+        mask = 0xff
+
+    value = _min(value, 8159) + (0x84 >> 2)
+    segment = _search_segment(value, _ULAW_SEGMENT_ENDS)
+
+    if segment >= 8:
+        return 0x7f ^ mask
+    return ((segment << 4) | ((value >> (segment + 1)) & 0x0f)) ^ mask
+
+def _linear2alaw(value: int) -> int:
+    # The value is 13-bit.
+    if value >= 0:
+        mask = 0xd5
+    else:
+        value, mask = -value - 1, 0x55
+
+    segment = _search_segment(value, _ALAW_SEGMENT_ENDS)
+
+    if segment >= 8:
+        return 0x7f ^ mask
+    return ((segment << 4) | ((value >> (1 if segment < 2 else segment)) & 0x0f)) ^ mask
+
+def _get_decode_table(name: str, width: int) -> _Any:
+    key = (name, width, _np is not None)
+    if key not in _tables:
+        decode = _ulaw2linear if name == "ulaw" else _alaw2linear
+        samples = [(decode(value) << 16) >> (32 - width * 8) for value in range(256)]
+
+        if _np is not None:
+            _tables[key] = _np.array(samples, _np.int64)
+        elif width == 1:
+            _tables[key] = bytes(sample & 0xff for sample in samples)
+        else:
+            _tables[key] = [_put_samples([sample], width) for sample in samples]
+
+    return _tables[key]
+
+def _get_encode_table(name: str) -> bytes:
+    # Indexed by the unsigned 16-bit representation of the sample's upper 16 bits.
+    if name not in _tables:
+        if name == "ulaw":
+            table = bytes(_linear2ulaw(value - 0x4000 if value & 0x2000 else value) for value in range(0x4000))
+            _tables[name] = bytes(table[value >> 2] for value in range(0x10000))
+        else:
+            table = bytes(_linear2alaw(value - 0x2000 if value & 0x1000 else value) for value in range(0x2000))
+            _tables[name] = bytes(table[value >> 3] for value in range(0x10000))
+
+    return _tables[name]
+
+def _decode_law(fragment: ReadableBuffer, width: int, name: str) -> bytes:
+    _check_size(width)
+
+    table = _get_decode_table(name, width)
+    fragment = memoryview(fragment).cast("B")
+
+    if _np is not None:
+        return _np_put_samples(table[_np.frombuffer(fragment, _np.uint8)], width)
+    elif width == 1:
+        return bytes(fragment).translate(table)
+
+    return b"".join(map(table.__getitem__, fragment))
+
+def _encode_law(fragment: ReadableBuffer, width: int, name: str) -> bytes:
+    _check_params(len(fragment), width)
+
+    table = _get_encode_table(name)
+
+    if _np is not None:
+        samples = ((_np_get_samples(fragment, width) << (32 - width * 8)) >> 16) & 0xffff
+        return _np.frombuffer(table, _np.uint8)[samples].tobytes()
+    elif width == 1:
+        return bytes(memoryview(fragment).cast("B")).translate(bytes(table[value << 8] for value in range(256)))
+    elif width == 2:
+        return bytes(map(table.__getitem__, memoryview(fragment).cast("B").cast("H")))
+
+    shift = width * 8 - 16
+    return bytes(map(table.__getitem__, [(sample >> shift) & 0xffff for sample in _get_samples(fragment, width)]))
+
+def _get_adpcm_tables() -> _Tuple[_List[int], _List[int]]:
+    # Indexed by index * 16 + delta: the signed difference to add to the predicted value and the next index.
+    if "adpcm" not in _tables:
+        differences, indexes = [], []
+
+        for index, step in enumerate(_ADPCM_STEPSIZE_TABLE):
+            for delta in range(16):
+                difference = step >> 3
+                if delta & 4:
+                    difference += step
+                if delta & 2:
+                    difference += step >> 1
+                if delta & 1:
+                    difference += step >> 2
 
-def _overflow(value: int, size: int, signed: bool = True) -> int:
-    if _get_minval(size, signed) <= value <= _get_maxval(size, signed):
-        return value
+                differences.append(-difference if delta & 8 else difference)
+                indexes.append(_min(_max(index + _ADPCM_INDEX_TABLE[delta], 0), 88))
 
-    bits = size * 8
-    if signed:
-        offset = 2 ** (bits - 1)
-        return ((value + offset) % (2 ** bits)) - offset
-    return value % (2 ** bits)
+        _tables["adpcm"] = differences, indexes
 
-def _sum2(fragment_1: bytes, fragment_2: bytes, length: int) -> int:
-    return sum(getsample(fragment_1, 2, index) * getsample(fragment_2, 2, index) for index in range(length))
+    return _tables["adpcm"]
+
+def _check_adpcm_state(state: _Optional[AdpcmState]) -> AdpcmState:
+    if state is None:
+        return 0, 0
+    elif not isinstance(state, tuple):
+        raise TypeError("state must be a tuple or None")
+
+    if len(state) != 2 or not all(isinstance(value, int) for value in state):
+        raise TypeError("illegal state argument")
+
+    predicted_value, index = state
+
+    if predicted_value >= 0x8000 or predicted_value < -0x8000 or not 0 <= index < len(_ADPCM_STEPSIZE_TABLE):
+        raise ValueError("bad state")
+
+    return predicted_value, index
+
+def _sum2(samples_1: _List[int], samples_2: _List[int]) -> int:
+    return sum(map(_mul, samples_1, samples_2))
+
+def _sums_of_squares(samples: _List[int]) -> _List[int]:
+    # Prefix sums, so the energy of samples[start:end] is result[end] - result[start].
+    return [0] + list(_accumulate(sample * sample for sample in samples))
+
+def _divide(numerator: float, denominator: float) -> float:
+    # Divide like C doubles do instead of raising ZeroDivisionError.
+    if denominator != 0:
+        return numerator / denominator
+    elif numerator == 0 or _isnan(numerator):
+        return _nan
+
+    return _inf if numerator > 0 else -_inf
+
+def _np_sums_of_squares(samples: _Any) -> _Any:
+    return _np.concatenate(((0,), _np.cumsum(samples * samples)))
+
+def _np_correlate(samples: _Any, reference: _Any) -> _Any:
+    # Return sum(samples[index + offset] * reference[offset]) for every index where reference fits in samples.
+    if len(reference) == 0:
+        return _np.zeros(len(samples) + 1, _np.int64)
+    elif len(reference) * (len(samples) - len(reference) + 1) <= 0x100000:
+        return _np.correlate(samples, reference, "valid")
+
+    # Split the samples into 8-bit halves so that each FFT product stays small enough to be rounded back to the exact integer.
+    size = 1 << (len(samples) + len(reference) - 1).bit_length()
+    samples_high, samples_low = _np.fft.rfft(samples >> 8, size), _np.fft.rfft(samples & 0xff, size)
+    reference_high, reference_low = _np.fft.rfft(reference[::-1] >> 8, size), _np.fft.rfft(reference[::-1] & 0xff, size)
+
+    result = 0
+    for shift, spectrum in ((16, samples_high * reference_high), (8, samples_high * reference_low + samples_low * reference_high), (0, samples_low * reference_low)):
+        result = result + (_np.rint(_np.fft.irfft(spectrum, size)[len(reference) - 1:len(samples)]).astype(_np.int64) << shift)
+
+    return result
 
 def add(fragment_1: bytes, fragment_2: bytes, width: int) -> bytes:
     """
@@ -129,18 +418,175 @@ def add(fragment_1: bytes, fragment_2: bytes, width: int) -> bytes:
     if len(fragment_1) != len(fragment_2):
         raise error("Lengths should be the same")
 
-    sample_count = _sample_count(fragment_1, width)
-    clip = _get_clipfn(width)
-    result = bytearray(len(fragment_1))
-
-    for index in range(sample_count):
-        sample1 = getsample(fragment_1, width, index)
-        sample2 = getsample(fragment_2, width, index)
-        sample = clip(sample1 + sample2)
+    if _np is not None:
+        samples = _np_get_samples(fragment_1, width) + _np_get_samples(fragment_2, width)
+        return _np_put_samples(_np.clip(samples, _get_minval(width), _get_maxval(width)), width)
+
+    samples = [sample1 + sample2 for sample1, sample2 in zip(_get_samples(fragment_1, width), _get_samples(fragment_2, width))]
+    return _put_samples(_clip_samples(samples, width), width)
+
+class _Statistics:
+    def __init__(self) -> None:
+        # The last sample, difference, sign and extreme of the previous fragment, so statistics continue across fragments.
+        self.previous_value = None
+        self.previous_difference = 0
+        self.previous_sign = None
+        self.previous_extreme = None
+        self.clear()
+
+    def clear(self) -> None:
+        self.sample_count = 0
+        self.total = 0
+        self.energy = 0
+        self.minimum = 0x7fffffff
+        self.maximum = -0x80000000
+        self.crossings = 0
+        self.peak_to_peak_count = 0
+        self.peak_to_peak_total = 0
+        self.peak_to_peak_maximum = 0
+
+    def update(self, samples: _Any) -> None:
+        if len(samples) == 0:
+            return
+
+        if self.previous_sign is not None:
+            self.crossings += (samples[0] < 0) != self.previous_sign
+        self.previous_sign = bool(samples[-1] < 0)
+        self.sample_count += len(samples)
+
+        if _np is not None:
+            self.total += int(samples.sum())
+            self.energy += _np_energy(samples)
+            self.minimum = _min(self.minimum, int(samples.min()))
+            self.maximum = _max(self.maximum, int(samples.max()))
+
+            signs = samples < 0
+            self.crossings += int(_np.count_nonzero(signs[1:] != signs[:-1]))
+
+            if self.previous_value is not None:
+                samples = _np.concatenate(((self.previous_value,), samples))
+            extremes, self.previous_difference = _np_extremes(samples, self.previous_difference)
+
+            if self.previous_extreme is not None:
+                extremes = _np.concatenate(((self.previous_extreme,), extremes))
+            differences = _np.abs(_np.diff(extremes))
+
+            if len(differences) != 0:
+                self.peak_to_peak_total += int(differences.sum())
+                self.peak_to_peak_maximum = _max(self.peak_to_peak_maximum, int(differences.max()))
+        else:
+            self.total += sum(samples)
+            self.energy += sum(map(_mul, samples, samples))
+            self.minimum = _min(self.minimum, _min(samples))
+            self.maximum = _max(self.maximum, _max(samples))
+
+            signs = [sample < 0 for sample in samples]
+            self.crossings += sum(map(_ne, signs[1:], signs[:-1]))
+
+            if self.previous_value is not None:
+                samples = [self.previous_value] + samples
+            extremes, self.previous_difference = _extremes(samples, self.previous_difference)
+
+            if self.previous_extreme is not None:
+                extremes = [self.previous_extreme] + extremes
+            differences = [abs(extreme - previous_extreme) for previous_extreme, extreme in zip(extremes, extremes[1:])]
+
+            if len(differences) != 0:
+                self.peak_to_peak_total += sum(differences)
+                self.peak_to_peak_maximum = _max(self.peak_to_peak_maximum, _max(differences))
+
+        self.peak_to_peak_count += len(differences)
+        self.previous_value = int(samples[-1])
+        if len(extremes) != 0:
+            self.previous_extreme = int(extremes[-1])
+
+    def get_result(self) -> _Dict[str, int]:
+        if self.sample_count == 0:
+            return {"minimum": self.minimum, "maximum": self.maximum, "peak": 0, "average": 0, "rms": 0, "maxpp": 0, "avgpp": 0, "crossings": -1}
+
+        return {
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "peak": _max(abs(self.minimum), abs(self.maximum)),
+            "average": self.total // self.sample_count,
+            "rms": int((self.energy // self.sample_count) ** 0.5),
+            "maxpp": self.peak_to_peak_maximum,
+            "avgpp": 0 if self.peak_to_peak_count == 0 else self.peak_to_peak_total // self.peak_to_peak_count,
+            "crossings": self.crossings
+        }
+
+class Analyzer:
+    def __init__(self, width: int, channels: int = 1) -> None:
+        """
+        An accumulator that computes the statistics of `analyze()` over a stream which is fed fragment by fragment, e.g. for level meters during playback. The result is the same as analyzing all fed fragments at once.
+
+        Parameters
+        ----------
+
+        width: Sample width in bytes (1, 2, 3 or 4).
+
+        channels (optional): Number of interleaved channels.
+        """
+        _check_size(width)
+
+        if channels < 1:
+            raise error("# of channels should be >= 1")
+
+        self.width = width
+        self.channels = channels
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every fragment fed so far.
+        """
+        self._statistics = [_Statistics() for _ in range(self.channels + 1 if self.channels > 1 else 1)]
+
+    def update(self, fragment: bytes) -> None:
+        """
+        Add a fragment to the statistics.
+
+        Parameters
+        ----------
+
+        fragment: Interleaved PCM frames, which continue the previously fed fragments.
+        """
+        _check_params(len(fragment), self.width)
+
+        if len(fragment) % (self.width * self.channels) != 0:
+            raise error("not a whole number of frames")
+
+        samples = _np_get_samples(fragment, self.width) if _np is not None else _get_samples(fragment, self.width)
+
+        self._statistics[0].update(samples)
+        for channel, statistics in enumerate(self._statistics[1:]):
+            statistics.update(samples[channel::self.channels])
+
+    def get_result(self, reset: bool = False) -> _Dict[str, _Any]:
+        """
+        Return the statistics of the fragments fed so far. The keys are the same as in `analyze()`.
+
+        Parameters
+        ----------
+
+        reset (optional): Start a new measurement after returning the result, e.g. for the next update of a level meter. Unlike `reset()`, zero crossings and peaks between the last fed fragment and the next one are still counted.
+        """
+        result = self._statistics[0].get_result()
+        result["channels"] = [statistics.get_result() for statistics in self._statistics[1:]] if self.channels > 1 else [result.copy()]
+
+        if reset:
+            for statistics in self._statistics:
+                statistics.clear()
 
-        _put_sample(result, width, index, sample)
+        return result
 
-    return bytes(result)
+def analyze(fragment: bytes, width: int, channels: int = 1) -> _Dict[str, _Any]:
+    """
+    Return a dictionary of the statistics of all samples in the fragment, computed in a single pass: `minimum` and `maximum` like `minmax()`, `peak` like `max()`, `average` like `avg()`, `rms` like `rms()`, `maxpp` like `maxpp()`, `avgpp` like `avgpp()` and `crossings` like `cross()`. The `channels` key holds a list with a dictionary of the same statistics for each channel.
+    """
+    analyzer = Analyzer(width, channels)
+    analyzer.update(fragment)
+    return analyzer.get_result()
 
 def avg(fragment: bytes, width: int) -> int:
     """
@@ -149,7 +595,13 @@ def avg(fragment: bytes, width: int) -> int:
     _check_params(len(fragment), width)
 
     sample_count = _sample_count(fragment, width)
-    return 0 if sample_count == 0 else sum(_get_samples(fragment, width)) // sample_count
+    if sample_count == 0:
+        return 0
+
+    if _np is not None:
+        return int(_np_get_samples(fragment, width).sum()) // sample_count
+
+    return sum(_get_samples(fragment, width)) // sample_count
 
 def avgpp(fragment: bytes, width: int) -> int:
     """
@@ -161,32 +613,12 @@ def avgpp(fragment: bytes, width: int) -> int:
     if sample_count <= 2:
         return 0
 
-    previous_extreme_valid = False
-    previous_extreme = None
-    average = 0
-    number_of_extremes = 0
-
-    previous_value = getsample(fragment, width, 0)
-    value = getsample(fragment, width, 1)
-    previous_difference = value - previous_value
-
-    for index in range(1, sample_count):
-        value = getsample(fragment, width, index)
-        difference = value - previous_value
-
-        if difference * previous_difference < 0:
-            if previous_extreme_valid:
-                average += abs(previous_value - previous_extreme)
-                number_of_extremes += 1
-
-            previous_extreme_valid = True
-            previous_extreme = previous_value
+    if _np is not None:
+        differences = _np.abs(_np.diff(_np_extremes(_np_get_samples(fragment, width))[0]))
+        return 0 if len(differences) == 0 else int(differences.sum()) // len(differences)
 
-        previous_value = value
-        if difference != 0:
-            previous_difference = difference
-
-    return 0 if number_of_extremes == 0 else average // number_of_extremes
+    extremes = _extremes(_get_samples(fragment, width))[0]
+    return 0 if len(extremes) <= 1 else sum(abs(extreme - previous_extreme) for previous_extreme, extreme in zip(extremes, extremes[1:])) // (len(extremes) - 1)
 
 def bias(fragment: bytes, width: int, bias: int) -> bytes:
     """
@@ -194,13 +626,18 @@ def bias(fragment: bytes, width: int, bias: int) -> bytes:
     """
     _check_params(len(fragment), width)
 
-    result = bytearray(len(fragment))
+    if _np is not None and isinstance(bias, int):
+        modulus = 1 << (width * 8)
+        offset = modulus >> 1
 
-    for index, sample in enumerate(_get_samples(fragment, width)):
-        sample = _overflow(sample + bias, width)
-        _put_sample(result, width, index, sample)
+        samples = (_np_get_samples(fragment, width) + (bias % modulus + offset)) % modulus - offset
+        return _np_put_samples(samples, width)
 
-    return bytes(result)
+    modulus = 1 << (width * 8)
+    offset = modulus >> 1
+    bias = bias % modulus + offset
+
+    return _put_samples([(sample + bias) % modulus - offset for sample in _get_samples(fragment, width)], width)
 
 def byteswap(fragment: bytes, width: int) -> bytes:
     """
@@ -208,18 +645,14 @@ def byteswap(fragment: bytes, width: int) -> bytes:
     """
     _check_params(len(fragment), width)
 
-    result = bytearray(len(fragment))
-    base = width
-    next_bump = 0
-    bump = 2 * width
+    if _np is not None:
+        return _np.frombuffer(fragment, _np.uint8).reshape(-1, width)[:, ::-1].tobytes()
 
-    for index in range(len(fragment)):
-        base -= 1
-        result[index] = fragment[base]
+    fragment = memoryview(fragment).cast("B")
+    result = bytearray(len(fragment))
 
-        if base == next_bump:
-            base += bump
-            next_bump += width
+    for index in range(width):
+        result[index::width] = fragment[width - index - 1::width]
 
     return bytes(result)
 
@@ -229,6 +662,13 @@ def cross(fragment: bytes, width: int) -> int:
     """
     _check_params(len(fragment), width)
 
+    if _np is not None:
+        if len(fragment) == 0:
+            return -1
+
+        signs = _np_get_samples(fragment, width) < 0
+        return int(_np.count_nonzero(signs[1:] != signs[:-1]))
+
     crossings = -1
     last_sample = 17
     for sample in _get_samples(fragment, width):
@@ -249,8 +689,12 @@ def findfactor(fragment: bytes, reference: bytes) -> float:
     if len(fragment) != len(reference):
         raise error("Samples should be same size")
 
-    sample_count = _sample_count(fragment, 2)
-    return _sum2(fragment, reference, sample_count) / _sum2(reference, reference, sample_count)
+    if _np is not None:
+        fragment, reference = _np_get_samples(fragment, 2), _np_get_samples(reference, 2)
+        return _divide(float(_np.dot(fragment, reference)), float(_np.dot(reference, reference)))
+
+    fragment, reference = _get_samples(fragment, 2), _get_samples(reference, 2)
+    return _divide(float(_sum2(fragment, reference)), float(_sum2(reference, reference)))
 
 def findfit(fragment: bytes, reference: bytes) -> _Tuple[int, float]:
     """
@@ -262,33 +706,42 @@ def findfit(fragment: bytes, reference: bytes) -> _Tuple[int, float]:
     if len(fragment) < len(reference):
         raise error("First sample should be longer")
 
-    len_fragment = _sample_count(fragment, 2)
     len_reference = _sample_count(reference, 2)
 
-    sum_ri_2 = _sum2(reference, reference, len_reference)
-    sum_aij_2 = _sum2(fragment, fragment, len_reference)
-    sum_aij_ri = _sum2(fragment, reference, len_reference)
+    # For every offset, minimize (sum(R^2) * sum(A^2) - sum(A * R) ^ 2) / sum(A^2) over the window A of the fragment, with the same double arithmetic as audioop.
+    if _np is not None:
+        fragment, reference = _np_get_samples(fragment, 2), _np_get_samples(reference, 2)
 
-    result = (sum_ri_2 * sum_aij_2 - sum_aij_ri * sum_aij_ri) / sum_aij_2
+        sum_ri_2 = float(_np.dot(reference, reference))
+        sums_of_squares = _np_sums_of_squares(fragment)
+        sum_aij_2 = (sums_of_squares[len_reference:] - sums_of_squares[:len(sums_of_squares) - len_reference]).astype(_np.float64)
+        sum_aij_ri = _np_correlate(fragment, reference)
 
-    best_result = result
-    best_index = 0
+        with _np.errstate(divide = "ignore", invalid = "ignore"):
+            results = (sum_ri_2 * sum_aij_2 - sum_aij_ri.astype(_np.float64) ** 2) / sum_aij_2
+
+        best_index = 0 if _np.isnan(results[0]) else int(_np.argmin(_np.where(_np.isnan(results), _inf, results)))
+        return best_index, _divide(float(sum_aij_ri[best_index]), sum_ri_2)
 
-    for index in range(1, len_fragment - len_reference + 1):
-        aj_m1 = _get_sample(fragment, 2, index - 1)
-        aj_lm1 = _get_sample(fragment, 2, index + len_reference - 1)
+    fragment, reference = _get_samples(fragment, 2), _get_samples(reference, 2)
 
-        sum_aij_2 += aj_lm1 ** 2 - aj_m1 ** 2
-        sum_aij_ri = _sum2(memoryview(fragment)[index * 2:], reference, len_reference)
+    sum_ri_2 = float(_sum2(reference, reference))
+    sums_of_squares = _sums_of_squares(fragment)
 
-        result = (sum_ri_2 * sum_aij_2 - sum_aij_ri * sum_aij_ri) / sum_aij_2
+    best_result = None
+    best_index = 0
+
+    for index in range(len(fragment) - len_reference + 1):
+        sum_aij_2 = float(sums_of_squares[index + len_reference] - sums_of_squares[index])
+        sum_aij_ri = float(_sum2(fragment[index:index + len_reference], reference))
+
+        result = _divide(sum_ri_2 * sum_aij_2 - sum_aij_ri * sum_aij_ri, sum_aij_2)
 
-        if result < best_result:
+        if best_result is None or result < best_result:
             best_result = result
             best_index = index
 
-    factor = _sum2(memoryview(fragment)[best_index * 2:], reference, len_reference) / sum_ri_2
-    return best_index, factor
+    return best_index, _divide(float(_sum2(fragment[best_index:best_index + len_reference], reference)), sum_ri_2)
 
 def findmax(fragment: bytes, length: int) -> int:
     """
@@ -305,22 +758,13 @@ def findmax(fragment: bytes, length: int) -> int:
     if sample_count == 0:
         return 0
 
-    result = _sum2(fragment, fragment, length)
-    best_result = result
-    best_index = 0
-
-    for index in range(1, sample_count - length + 1):
-        sample_leaving_window = getsample(fragment, 2, index - 1)
-        sample_entering_window = getsample(fragment, 2, index + length - 1)
-
-        result -= sample_leaving_window ** 2
-        result += sample_entering_window ** 2
+    if _np is not None:
+        sums_of_squares = _np_sums_of_squares(_np_get_samples(fragment, 2))
+        return int(_np.argmax(sums_of_squares[length:] - sums_of_squares[:len(sums_of_squares) - length]))
 
-        if result > best_result:
-            best_result = result
-            best_index = index
-
-    return best_index
+    sums_of_squares = _sums_of_squares(_get_samples(fragment, 2))
+    energies = [end - start for start, end in zip(sums_of_squares, sums_of_squares[length:])]
+    return _max(range(len(energies)), key = energies.__getitem__)
 
 def getsample(fragment: bytes, width: int, index: int) -> int:
     """
@@ -343,28 +787,19 @@ def lin2lin(fragment: bytes, width: int, new_width: int) -> bytes:
     if width == new_width:
         return fragment
 
-    new_len = (len(fragment) // width) * new_width
-    result = bytearray(new_len)
-
-    for index in range(_sample_count(fragment, width)):
-        sample = _get_sample(fragment, width, index)
-        if width == 1:
-            sample <<= 24
-        elif width == 2:
-            sample <<= 16
-        elif width == 3:
-            sample <<= 8
-        if new_width == 1:
-            sample >>= 24
-        elif new_width == 2:
-            sample >>= 16
-        elif new_width == 3:
-            sample >>= 8
-
-        sample = _overflow(sample, new_width)
-        _put_sample(result, new_width, index, sample)
+    if _np is not None:
+        samples = (_np_get_samples(fragment, width) << ((4 - width) * 8)) >> ((4 - new_width) * 8)
+        return _np_put_samples(samples, new_width)
 
-    return bytes(result)
+    samples = _get_samples(fragment, width)
+    if width < new_width:
+        shift = (new_width - width) * 8
+        samples = [sample << shift for sample in samples]
+    else:
+        shift = (width - new_width) * 8
+        samples = [sample >> shift for sample in samples]
+
+    return _put_samples(samples, new_width)
 
 def max(fragment: bytes, width: int) -> int:
     """
@@ -372,7 +807,13 @@ def max(fragment: bytes, width: int) -> int:
     """
     _check_params(len(fragment), width)
 
-    return 0 if len(fragment) == 0 else _max(abs(sample) for sample in _get_samples(fragment, width))
+    if len(fragment) == 0:
+        return 0
+
+    if _np is not None:
+        return int(_np.abs(_np_get_samples(fragment, width)).max())
+
+    return _max(abs(sample) for sample in _get_samples(fragment, width))
 
 def maxpp(fragment: bytes, width: int) -> int:
     """
@@ -384,60 +825,212 @@ def maxpp(fragment: bytes, width: int) -> int:
     if sample_count <= 1:
         return 0
 
-    previous_extreme_valid = False
-    previous_extreme = None
-    maximum = 0
+    if _np is not None:
+        differences = _np.abs(_np.diff(_np_extremes(_np_get_samples(fragment, width))[0]))
+        return 0 if len(differences) == 0 else int(differences.max())
 
-    previous_value = getsample(fragment, width, 0)
-    value = getsample(fragment, width, 1)
-    previous_difference = value - previous_value
+    extremes = _extremes(_get_samples(fragment, width))[0]
+    return _max((abs(extreme - previous_extreme) for previous_extreme, extreme in zip(extremes, extremes[1:])), default = 0)
 
-    for index in range(1, sample_count):
-        value = getsample(fragment, width, index)
-        difference = value - previous_value
+def minmax(fragment: bytes, width: int) -> _Tuple[int, int]:
+    """
+    Return the minimum and maximum values of all samples in the sound fragment.
+    """
+    _check_params(len(fragment), width)
 
-        if difference * previous_difference < 0:
-            if previous_extreme_valid:
-                extreme_difference = abs(previous_value - previous_extreme)
-                if extreme_difference > maximum:
-                    maximum = extreme_difference
+    min_sample, max_sample = 0x7fffffff, -0x80000000
+    if _np is not None:
+        if len(fragment) == 0:
+            return min_sample, max_sample
 
-            previous_extreme_valid = True
-            previous_extreme = previous_value
+        samples = _np_get_samples(fragment, width)
+        return int(samples.min()), int(samples.max())
 
-        previous_value = value
-        if difference != 0:
-            previous_difference = difference
+    samples = _get_samples(fragment, width)
+    if len(samples) == 0:
+        return min_sample, max_sample
 
-    return maximum
+    return _min(samples), _max(samples)
 
-def minmax(fragment: bytes, width: int) -> _Tuple[int, int]:
+def mix(fragments: _Iterable[bytes], width: int, gains: _Optional[_Iterable[_Any]] = None, channels: int = 1, out: _Optional[ReadableBuffer] = None) -> _Union[bytes, ReadableBuffer]:
     """
-    Return the minimum and maximum values of all samples in the sound fragment.
+    Return a fragment which is the sum of all fragments, each one multiplied by its gain. A gain is either a factor for every sample or a sequence with a factor for each channel, e.g. `(left_factor, right_factor)` for stereo fragments. Unlike chaining `mul()` and `add()`, samples are only clipped once at the end. If `out` is given, the result is written into it instead and `out` is returned.
     """
-    _check_params(len(fragment), width)
+    fragments = list(fragments)
+    gains = [1] * len(fragments) if gains is None else list(gains)
 
-    min_sample, max_sample = 0x7fffffff, -0x80000000
-    for sample in _get_samples(fragment, width):
-        min_sample = _min(sample, min_sample)
-        max_sample = _max(sample, max_sample)
+    if len(gains) != len(fragments):
+        raise error("Every fragment should have a gain")
+
+    if channels < 1:
+        raise error("Number of channels should be at least 1")
+
+    length = len(fragments[0]) if fragments else 0 if out is None else memoryview(out).nbytes
+    for fragment in fragments:
+        _check_params(len(fragment), width)
+
+        if len(fragment) != length:
+            raise error("Lengths should be the same")
+
+    if length % (width * channels) != 0:
+        raise error("not a whole number of frames")
+
+    if out is not None and memoryview(out).nbytes != length:
+        raise error("Lengths should be the same")
+
+    gains = [(gain,) * channels if isinstance(gain, (int, float)) else tuple(gain) for gain in gains]
+    if any(len(gain) != channels for gain in gains):
+        raise error("Every gain should have a factor for each channel")
+
+    if _np_supports_factors(*(factor for gain in gains for factor in gain)):
+        samples = _np.zeros(length // width, _np.float64)
+        frames = samples.reshape(-1, channels)
+
+        for fragment, gain in zip(fragments, gains):
+            if any(gain):
+                frames += _np_get_samples(fragment, width).reshape(-1, channels) * _np.array(gain, _np.float64)
+
+        return _np_put_samples(_np.clip(_np.trunc(samples), _get_minval(width), _get_maxval(width)), width, out)
 
-    return min_sample, max_sample
+    samples = [0] * (length // width)
+    for fragment, gain in zip(fragments, gains):
+        if not any(gain):
+            continue
 
-def mul(fragment: bytes, width: int, factor: _Union[int, float]) -> bytes:
+        fragment_samples = _get_samples(fragment, width)
+        for channel, factor in enumerate(gain):
+            samples[channel::channels] = [total + sample * factor for total, sample in zip(samples[channel::channels], fragment_samples[channel::channels])]
+
+    return _put_samples(_clip_samples([int(sample) for sample in samples], width), width, out = out)
+
+def mul(fragment: bytes, width: int, factor: _Union[int, float], out: _Optional[ReadableBuffer] = None) -> _Union[bytes, ReadableBuffer]:
     """
-    Return a fragment that has all samples in the original fragment multiplied by the floating-point value factor.
+    Return a fragment that has all samples in the original fragment multiplied by the floating-point value factor. If `out` is given, the result is written into it instead (it may be the fragment itself) and `out` is returned.
     """
     _check_params(len(fragment), width)
 
-    clip = _get_clipfn(width)
-    result = bytearray(len(fragment))
-
-    for index, sample in enumerate(_get_samples(fragment, width)):
-        sample = clip(int(sample * factor))
-        _put_sample(result, width, index, sample)
+    if out is not None and memoryview(out).nbytes != len(fragment):
+        raise error("Lengths should be the same")
 
-    return bytes(result)
+    if _np_supports_factors(factor):
+        samples = _np.trunc(_np_get_samples(fragment, width) * float(factor))
+        return _np_put_samples(_np.clip(samples, _get_minval(width), _get_maxval(width)), width, out)
+
+    samples = [int(sample * factor) for sample in _get_samples(fragment, width)]
+    return _put_samples(_clip_samples(samples, width), width, out = out)
+
+class Pipeline:
+    def __init__(self, width: int, operations: _Iterable[_Tuple[_Any, ...]]) -> None:
+        """
+        A chain of operations that runs as one fused function: a fragment is decoded once, every operation is applied to its samples, then they are clipped and encoded once. Unlike chaining the functions, intermediate samples are neither clipped nor wrapped around, so the result only differs from the chained functions where those would have clipped in between.
+
+        Parameters
+        ----------
+
+        width: Sample width in bytes of the input fragments.
+
+        operations: Operations to apply in order. Each one is a tuple of the function name and its arguments without the fragment and width, e.g. `[("bias", 128), ("mul", 0.5), ("tomono", 0.5, 0.5), ("lin2lin", 1)]`. The supported functions are `bias`, `lin2lin`, `mul`, `reverse`, `tomono` and `tostereo`.
+        """
+        _check_size(width)
+
+        argument_counts = {"bias": 1, "lin2lin": 1, "mul": 1, "reverse": 0, "tomono": 2, "tostereo": 2}
+        self.operations = tuple(tuple(operation) for operation in operations)
+        self.width = width
+        self._factors = []
+
+        for operation in self.operations:
+            if len(operation) == 0 or operation[0] not in argument_counts:
+                raise error("unsupported operation {}".format(operation[0] if operation else None))
+            elif len(operation) - 1 != argument_counts[operation[0]]:
+                raise error("{}() takes {} argument(s) besides the fragment and width".format(operation[0], argument_counts[operation[0]]))
+
+            if operation[0] == "lin2lin":
+                _check_size(operation[1])
+                width = operation[1]
+            elif operation[0] in ("mul", "tomono", "tostereo"):
+                self._factors.extend(operation[1:])
+
+        self.out_width = width
+
+    def process(self, fragment: bytes, out: _Optional[ReadableBuffer] = None) -> _Union[bytes, ReadableBuffer]:
+        """
+        Return the fragment after all operations. If `out` is given, the result is written into it instead (it may be the fragment itself) and `out` is returned.
+
+        Parameters
+        ----------
+
+        fragment: Fragment of samples with the input width.
+
+        out (optional): Writable buffer with the size of the result.
+        """
+        _check_params(len(fragment), self.width)
+
+        width = self.width
+        use_numpy = _np_supports_factors(*self._factors)
+        samples = _np_get_samples(fragment, width).astype(_np.float64) if use_numpy else _get_samples(fragment, width)
+
+        for name, *arguments in self.operations:
+            if name == "tomono" and len(samples) % 2 != 0:
+                raise error("Index out of range")
+
+            if use_numpy:
+                samples = self._np_apply(samples, width, name, arguments)
+            else:
+                samples = self._apply(samples, width, name, arguments)
+
+            if name == "lin2lin":
+                width = arguments[0]
+
+        if out is not None and memoryview(out).nbytes != len(samples) * width:
+            raise error("Lengths should be the same")
+
+        if use_numpy:
+            return _np_put_samples(_np.clip(samples, _get_minval(width), _get_maxval(width)), width, out)
+
+        return _put_samples(_clip_samples(samples, width), width, out = out)
+
+    @staticmethod
+    def _np_apply(samples: _Any, width: int, name: str, arguments: _List[_Any]) -> _Any:
+        """
+        Apply an operation to float64 samples that hold integers. This function is meant for use by the class and not for general use.
+        """
+        if name == "bias":
+            return samples + float(arguments[0])
+        elif name == "lin2lin":
+            return _np.floor(samples * 2.0 ** ((arguments[0] - width) * 8))
+        elif name == "mul":
+            return _np.trunc(samples * float(arguments[0]))
+        elif name == "reverse":
+            return samples[::-1]
+        elif name == "tomono":
+            return _np.trunc(samples[0::2] * float(arguments[0]) + samples[1::2] * float(arguments[1]))
+
+        result = _np.empty(len(samples) * 2, _np.float64)
+        result[0::2] = _np.trunc(samples * float(arguments[0]))
+        result[1::2] = _np.trunc(samples * float(arguments[1]))
+        return result
+
+    @staticmethod
+    def _apply(samples: _List[int], width: int, name: str, arguments: _List[_Any]) -> _List[int]:
+        """
+        Apply an operation to integer samples. This function is meant for use by the class and not for general use.
+        """
+        if name == "bias":
+            return [sample + arguments[0] for sample in samples]
+        elif name == "lin2lin":
+            shift = (arguments[0] - width) * 8
+            return [sample << shift for sample in samples] if shift >= 0 else [sample >> -shift for sample in samples]
+        elif name == "mul":
+            return [int(sample * arguments[0]) for sample in samples]
+        elif name == "reverse":
+            return samples[::-1]
+        elif name == "tomono":
+            return [int(l_sample * arguments[0] + r_sample * arguments[1]) for l_sample, r_sample in zip(samples[0::2], samples[1::2])]
+
+        result = [0] * (len(samples) * 2)
+        result[0::2] = [int(sample * arguments[0]) for sample in samples]
+        result[1::2] = [int(sample * arguments[1]) for sample in samples]
+        return result
 
 def ratecv(fragment: bytes, width: int, number_of_channels: int, in_rate: int, out_rate: int, state: _Optional[RatecvState], weight_A: int = 1, weight_B: int = 0) -> _Tuple[bytes, RatecvState]:
     """
@@ -467,48 +1060,73 @@ def ratecv(fragment: bytes, width: int, number_of_channels: int, in_rate: int, o
     in_rate //= d
     out_rate //= d
 
+    d = _gcd(weight_A, weight_B)
+    weight_A //= d
+    weight_B //= d
+
     if state is None:
         d = -out_rate
-        previous_index = [0] * number_of_channels
-        current_index = [0] * number_of_channels
+        previous_samples = [0] * number_of_channels
+        current_samples = [0] * number_of_channels
     else:
-        d, samples = state
+        try:
+            d, samples = state
+            samples = [(int(previous_sample), int(current_sample)) for previous_sample, current_sample in samples]
+        except (TypeError, ValueError):
+            raise TypeError("ratecv(): illegal state argument") from None
 
         if len(samples) != number_of_channels:
             raise error("illegal state argument")
 
-        previous_index, current_index = zip(*samples)
-        previous_index, current_index = list(previous_index), list(current_index)
+        previous_samples = [previous_sample for previous_sample, _ in samples]
+        current_samples = [current_sample for _, current_sample in samples]
 
-    result = bytearray((frame_count // in_rate + 1) * out_rate * bytes_per_frame)
+    # Every input frame is consumed before the output frames that follow it, so output frame m interpolates between filtered input frames j and j + 1 (counting the two frames kept in the state) with j = ceil((m * in_rate - d) / out_rate).
+    shift = 32 - width * 8
+    output_count = _max(0, (d + frame_count * out_rate) // in_rate + 1)
+    new_d = d + frame_count * out_rate - output_count * in_rate
 
-    samples = _get_samples(fragment, width)
-    out_index = 0
-    while True:
-        while d < 0:
-            if frame_count == 0:
-                samples = zip(previous_index, current_index)
-                return_value = bytes(result)
+    if _np is not None:
+        frames = (_np_get_samples(fragment, width) << shift).reshape(-1, number_of_channels)
+        if weight_B != 0:
+            frames = _np.array([_ratecv_filter(channel, previous_sample, weight_A, weight_B) for channel, previous_sample in zip(frames.T.tolist(), current_samples)], _np.int64).reshape(number_of_channels, -1).T
+
+        frames = _np.concatenate(([previous_samples, current_samples], frames)).astype(_np.float64)
+
+        output_indexes = _np.arange(output_count, dtype = _np.int64)
+        input_indexes = _np.maximum(0, -((d - output_indexes * in_rate) // out_rate))
+        weights = (d + input_indexes * out_rate - output_indexes * in_rate)[:, None]
+
+        samples = _np.trunc((frames[input_indexes] * weights + frames[input_indexes + 1] * (out_rate - weights)) / out_rate).astype(_np.int64) >> shift
+        frames = frames[-2:].astype(_np.int64).tolist()
+        return _np_put_samples(samples.ravel(), width), (new_d, tuple((previous_sample, current_sample) for previous_sample, current_sample in zip(*frames)))
+
+    samples = [sample << shift for sample in _get_samples(fragment, width)]
+    channels = []
+    for channel in range(number_of_channels):
+        channel_samples = samples[channel::number_of_channels]
+        if weight_B != 0:
+            channel_samples = _ratecv_filter(channel_samples, current_samples[channel], weight_A, weight_B)
 
-                trim_index = out_index * bytes_per_frame - len(return_value)
-                return_value = bytearray(return_value)[:trim_index * width]
+        channels.append([float(previous_samples[channel]), float(current_samples[channel])] + [float(sample) for sample in channel_samples])
 
-                return (bytes(return_value), (d, tuple(samples)))
+    result = []
+    for output_index in range(output_count):
+        input_index = _max(0, -((d - output_index * in_rate) // out_rate))
+        weight = d + input_index * out_rate - output_index * in_rate
 
-            for channel in range(number_of_channels):
-                previous_index[channel] = current_index[channel]
-                current_index[channel] = ((weight_A * next(samples) + weight_B * previous_index[channel]) / (weight_A + weight_B))
+        for channel in channels:
+            result.append(int((channel[input_index] * weight + channel[input_index + 1] * (out_rate - weight)) / out_rate) >> shift)
 
-            frame_count -= 1
-            d += out_rate
+    return _put_samples(result, width), (new_d, tuple((int(channel[-2]), int(channel[-1])) for channel in channels))
 
-        while d >= 0:
-            for channel in range(number_of_channels):
-                current_out = int((previous_index[channel] * d + current_index[channel] * (out_rate - d)) / out_rate)
-                _put_sample(result, width, out_index, _overflow(current_out, width))
-                out_index += 1
+def _ratecv_filter(samples: _List[int], previous_sample: int, weight_A: int, weight_B: int) -> _List[int]:
+    result = []
+    for sample in samples:
+        previous_sample = int((float(weight_A) * sample + float(weight_B) * previous_sample) / (float(weight_A) + float(weight_B)))
+        result.append(previous_sample)
 
-            d -= in_rate
+    return result
 
 def reverse(fragment: bytes, width: int) -> bytes:
     """
@@ -516,13 +1134,10 @@ def reverse(fragment: bytes, width: int) -> bytes:
     """
     _check_params(len(fragment), width)
 
-    sample_count = _sample_count(fragment, width)
-    result = bytearray(len(fragment))
+    if _np is not None:
+        return _np.frombuffer(fragment, _np.uint8).reshape(-1, width)[::-1].tobytes()
 
-    for index, sample in enumerate(_get_samples(fragment, width)):
-        _put_sample(result, width, sample_count - index - 1, sample)
-
-    return bytes(result)
+    return _put_samples(_get_samples(fragment, width)[::-1], width)
 
 def rms(fragment: bytes, width: int) -> int:
     """
@@ -531,7 +1146,13 @@ def rms(fragment: bytes, width: int) -> int:
     _check_params(len(fragment), width)
 
     sample_count = _sample_count(fragment, width)
-    return 0 if sample_count == 0 else int((sum(sample ** 2 for sample in _get_samples(fragment, width)) // sample_count) ** 0.5)
+    if sample_count == 0:
+        return 0
+
+    if _np is not None:
+        return int((_np_energy(_np_get_samples(fragment, width)) // sample_count) ** 0.5)
+
+    return int((sum([sample * sample for sample in _get_samples(fragment, width)]) // sample_count) ** 0.5)
 
 def tomono(fragment: bytes, width: int, left_factor: float, right_factor: float) -> bytes:
     """
@@ -540,18 +1161,18 @@ def tomono(fragment: bytes, width: int, left_factor: float, right_factor: float)
     _check_params(len(fragment), width)
 
     sample_count = _sample_count(fragment, width)
-    clip = _get_clipfn(width)
-    result = bytearray(len(fragment) // 2)
 
-    for index in range(0, sample_count, 2):
-        l_sample = getsample(fragment, width, index)
-        r_sample = getsample(fragment, width, index + 1)
-        sample = (l_sample * left_factor) + (r_sample * right_factor)
-        sample = int(clip(sample))
+    if sample_count % 2 != 0:
+        raise error("Index out of range")
 
-        _put_sample(result, width, index // 2, sample)
+    if _np_supports_factors(left_factor, right_factor):
+        samples = _np_get_samples(fragment, width)
+        samples = samples[0::2] * float(left_factor) + samples[1::2] * float(right_factor)
+        return _np_put_samples(_np.trunc(_np.clip(samples, _get_minval(width), _get_maxval(width))), width)
 
-    return bytes(result)
+    samples = _get_samples(fragment, width)
+    samples = [(l_sample * left_factor) + (r_sample * right_factor) for l_sample, r_sample in zip(samples[0::2], samples[1::2])]
+    return _put_samples([int(sample) for sample in _clip_samples(samples, width)], width)
 
 def tostereo(fragment: bytes, width: int, left_factor: float, right_factor: float) -> bytes:
     """
@@ -559,52 +1180,129 @@ def tostereo(fragment: bytes, width: int, left_factor: float, right_factor: floa
     """
     _check_params(len(fragment), width)
 
-    sample_count = _sample_count(fragment, width)
-    clip = _get_clipfn(width)
-    result = bytearray(len(fragment) * 2)
+    if _np_supports_factors(left_factor, right_factor):
+        samples = _np_get_samples(fragment, width)
+        minval, maxval = _get_minval(width), _get_maxval(width)
 
-    for index in range(sample_count):
-        sample = _get_sample(fragment, width, index)
-        l_sample = clip(sample * left_factor)
-        r_sample = clip(sample * right_factor)
+        result = _np.empty(len(samples) * 2, _np.float64)
+        result[0::2] = _np.clip(samples * float(left_factor), minval, maxval)
+        result[1::2] = _np.clip(samples * float(right_factor), minval, maxval)
+        return _np_put_samples(_np.trunc(result), width)
 
-        _put_sample(result, width, index * 2, l_sample)
-        _put_sample(result, width, index * 2 + 1, r_sample)
+    samples = _get_samples(fragment, width)
 
-    return bytes(result)
+    result = [0] * (len(samples) * 2)
+    result[0::2] = [int(sample) for sample in _clip_samples([sample * left_factor for sample in samples], width)]
+    result[1::2] = [int(sample) for sample in _clip_samples([sample * right_factor for sample in samples], width)]
+    return _put_samples(result, width)
 
 def adpcm2lin(fragment: bytes, width: int, state: _Optional[AdpcmState]) -> _Tuple[bytes, AdpcmState]:
     """
     Decode an Intel/DVI ADPCM coded fragment to a linear fragment.
     """
-    raise NotImplementedError("adpcm2lin() hasn't been implemented.")
+    _check_size(width)
+
+    predicted_value, index = _check_adpcm_state(state)
+    differences, indexes = _get_adpcm_tables()
+
+    samples = []
+    for byte in memoryview(fragment).cast("B"):
+        for delta in (byte >> 4, byte & 0x0f):
+            key = (index << 4) | delta
+            predicted_value += differences[key]
+
+            if predicted_value > 32767:
+                predicted_value = 32767
+            elif predicted_value < -32768:
+                predicted_value = -32768
+
+            index = indexes[key]
+            samples.append(predicted_value)
+
+    if width != 2:
+        shift = 16 - width * 8
+        samples = [sample >> shift for sample in samples] if shift > 0 else [sample << -shift for sample in samples]
+
+    return _put_samples(samples, width), (predicted_value, index)
 
 def alaw2lin(fragment: bytes, width: int) -> bytes:
     """
     Convert sound fragments in a-LAW encoding to linearly encoded sound fragments.
     """
-    raise NotImplementedError("alaw2lin() hasn't been implemented.")
+    return _decode_law(fragment, width, "alaw")
 
 def lin2adpcm(fragment: bytes, width: int, state: _Optional[AdpcmState]) -> _Tuple[bytes, AdpcmState]:
     """
     Convert samples to 4 bit Intel/DVI ADPCM encoding.
     """
-    raise NotImplementedError("lin2adpcm() hasn't been implemented.")
+    _check_params(len(fragment), width)
+
+    predicted_value, index = _check_adpcm_state(state)
+    shift = width * 8 - 16
+    step = _ADPCM_STEPSIZE_TABLE[index]
+
+    result = bytearray(len(fragment) // (width * 2))
+    output_index = 0
+    high_nibble = None
+
+    for sample in _get_samples(fragment, width):
+        sample = sample >> shift if shift >= 0 else sample << -shift
+
+        if sample < predicted_value:
+            difference, sign = predicted_value - sample, 8
+        else:
+            difference, sign = sample - predicted_value, 0
+
+        delta = 0
+        predicted_difference = step >> 3
+
+        if difference >= step:
+            delta = 4
+            difference -= step
+            predicted_difference += step
+        step >>= 1
+        if difference >= step:
+            delta |= 2
+            difference -= step
+            predicted_difference += step
+        step >>= 1
+        if difference >= step:
+            delta |= 1
+            predicted_difference += step
+
+        predicted_value = predicted_value - predicted_difference if sign else predicted_value + predicted_difference
+        if predicted_value > 32767:
+            predicted_value = 32767
+        elif predicted_value < -32768:
+            predicted_value = -32768
+
+        delta |= sign
+        index = _min(_max(index + _ADPCM_INDEX_TABLE[delta], 0), 88)
+        step = _ADPCM_STEPSIZE_TABLE[index]
+
+        if high_nibble is None:
+            high_nibble = (delta << 4) & 0xf0
+        else:
+            result[output_index] = high_nibble | delta
+            output_index += 1
+            high_nibble = None
+
+    return bytes(result), (predicted_value, index)
 
 def lin2alaw(fragment: bytes, width: int) -> bytes:
     """
     Convert samples in the audio fragment to a-LAW encoding.
     """
-    raise NotImplementedError("lin2alaw() hasn't been implemented.")
+    return _encode_law(fragment, width, "alaw")
 
 def lin2ulaw(fragment: bytes, width: int) -> bytes:
     """
     Convert samples in the audio fragment to u-LAW encoding.
     """
-    raise NotImplementedError("lin2ulaw() hasn't been implemented.")
+    return _encode_law(fragment, width, "ulaw")
 
 def ulaw2lin(fragment: bytes, width: int) -> bytes:
     """
     Convert sound fragments in u-LAW encoding to linearly encoded sound fragments.
     """
-    raise NotImplementedError("ulaw2lin() hasn't been implemented.")
+    return _decode_law(fragment, width, "ulaw")
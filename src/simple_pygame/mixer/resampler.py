@@ -0,0 +1,239 @@
+"""
+A module for resampling streamed PCM audio.
+"""
+from math import ceil as _ceil, cos as _cos, sin as _sin, pi as _pi
+from operator import mul as _mul
+try:
+    from math import gcd as _gcd
+except ImportError:
+    from fractions import gcd as _gcd
+from typing import Optional as _Optional, List as _List, Any as _Any
+
+from ..constants import LinearInterpolation, SincInterpolation
+from .pyaudioop import ratecv as _ratecv, RatecvState, ReadableBuffer, _np, _get_minval, _get_maxval, _get_samples, _put_samples, _clip_samples, _np_get_samples, _np_put_samples
+
+class Resampler:
+    def __init__(self, in_rate: int, out_rate: int, channels: int = 2, width: int = 2, quality: _Any = LinearInterpolation, zero_crossings: int = 16) -> None:
+        """
+        A resampler that converts the frame rate of streamed PCM audio chunk by chunk. Its filter state is kept between chunks, so feeding a stream in pieces gives the same result as converting it all at once.
+
+        Parameters
+        ----------
+
+        in_rate: Frame rate of the input fragments.
+
+        out_rate: Frame rate of the output fragments.
+
+        channels (optional): Number of interleaved channels.
+
+        width (optional): Sample width in bytes (1, 2, 3 or 4).
+
+        quality (optional): `simple_pygame.LinearInterpolation` gives the same result as `pyaudioop.ratecv()`. `simple_pygame.SincInterpolation` uses a windowed-sinc polyphase filter, which is slower but doesn't alias; it holds back `zero_crossings` frames (at the lower rate) until more input or `flush()` arrives. Defaults to `simple_pygame.LinearInterpolation`.
+
+        zero_crossings (optional): Number of zero crossings on each side of the sinc filter. Only used by `simple_pygame.SincInterpolation`.
+        """
+        if not isinstance(in_rate, int) or not isinstance(out_rate, int):
+            raise TypeError("Frame rates must be integers.")
+        elif in_rate <= 0 or out_rate <= 0:
+            raise ValueError("Frame rates must be greater than 0.")
+
+        if not isinstance(channels, int):
+            raise TypeError("Channels must be an integer.")
+        elif channels <= 0:
+            raise ValueError("Channels must be greater than 0.")
+
+        if not isinstance(width, int):
+            raise TypeError("Width must be an integer.")
+        elif width < 1 or width > 4:
+            raise ValueError("Width must be 1, 2, 3 or 4.")
+
+        if quality not in (LinearInterpolation, SincInterpolation):
+            raise ValueError("Invalid quality.")
+
+        if not isinstance(zero_crossings, int):
+            raise TypeError("Zero crossings must be an integer.")
+        elif zero_crossings <= 0:
+            raise ValueError("Zero crossings must be greater than 0.")
+
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.channels = channels
+        self.width = width
+        self.quality = quality
+        self.zero_crossings = zero_crossings
+
+        divisor = _gcd(in_rate, out_rate)
+        self._in_step = in_rate // divisor
+        self._out_step = out_rate // divisor
+
+        if quality == SincInterpolation:
+            self._half_length, self._phases, self._table = self.create_table(self._in_step, self._out_step, zero_crossings)
+
+        self.reset()
+
+    @staticmethod
+    def create_table(in_step: int, out_step: int, zero_crossings: int = 16, max_phases: int = 1024) -> _Any:
+        """
+        Return the half length of the filter in input frames, the number of phases and the polyphase table of a Blackman-windowed sinc filter. Each row of the table holds the normalized coefficients of one phase. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        in_step: Input frame rate divided by the greatest common divisor of both frame rates.
+
+        out_step: Output frame rate divided by the greatest common divisor of both frame rates.
+
+        zero_crossings (optional): Number of zero crossings on each side of the sinc filter.
+
+        max_phases (optional): Maximum number of phases. Output frames between two phases use the nearest lower phase.
+        """
+        cutoff = min(1.0, out_step / in_step) * 0.97
+        half_length = _ceil(zero_crossings / cutoff)
+        phases = min(out_step, max_phases)
+
+        table = []
+        for phase in range(phases):
+            row = []
+            for tap in range(2 * half_length):
+                x = tap - half_length + 1 - phase / phases
+                window = 0.42 + 0.5 * _cos(_pi * x / half_length) + 0.08 * _cos(2 * _pi * x / half_length) if abs(x) < half_length else 0.0
+                row.append(window * (cutoff if x == 0 else _sin(_pi * cutoff * x) / (_pi * x)))
+
+            total = sum(row)
+            table.append([coefficient / total for coefficient in row])
+
+        return half_length, phases, _np.array(table) if _np is not None else table
+
+    def reset(self) -> None:
+        """
+        Forget all buffered input and filter state, as if the resampler had just been created.
+        """
+        self._state = None
+
+        if self.quality == SincInterpolation:
+            # The first output frame is centered on the first input frame, so the filter starts with silence before it.
+            self._position = 0
+            self._frames = _np.zeros((self._half_length - 1, self.channels)) if _np is not None else [[0.0] * (self._half_length - 1) for _ in range(self.channels)]
+
+    @property
+    def state(self) -> _Optional[RatecvState]:
+        """
+        A read-only attribute whose value is the `pyaudioop.ratecv()` compatible state of a `simple_pygame.LinearInterpolation` resampler, otherwise `None`.
+        """
+        return self._state
+
+    def process(self, fragment: ReadableBuffer) -> bytes:
+        """
+        Resample a fragment and return as many output frames as are available.
+
+        Parameters
+        ----------
+
+        fragment: Interleaved PCM frames at the input frame rate.
+        """
+        if len(fragment) % (self.width * self.channels) != 0:
+            raise ValueError("Fragment must contain a whole number of frames.")
+
+        if self.quality == LinearInterpolation:
+            result, self._state = _ratecv(fragment, self.width, self.channels, self.in_rate, self.out_rate, self._state)
+            return result
+
+        if self._in_step == self._out_step:
+            return bytes(fragment)
+
+        if _np is not None:
+            self._frames = _np.concatenate((self._frames, _np_get_samples(fragment, self.width).reshape(-1, self.channels)))
+        else:
+            samples = _get_samples(fragment, self.width)
+            for channel, frames in enumerate(self._frames):
+                frames.extend(samples[channel::self.channels])
+
+        return self.convolve(self.frame_count - 2 * self._half_length + 1)
+
+    def flush(self) -> bytes:
+        """
+        Return the output frames that are still held back by the filter and reset the resampler.
+        """
+        result = b""
+        if self.quality == SincInterpolation and self._in_step != self._out_step:
+            limit = self.frame_count - self._half_length + 1
+
+            if _np is not None:
+                self._frames = _np.concatenate((self._frames, _np.zeros((self._half_length, self.channels))))
+            else:
+                for frames in self._frames:
+                    frames.extend([0.0] * self._half_length)
+
+            result = self.convolve(limit)
+
+        self.reset()
+        return result
+
+    @property
+    def frame_count(self) -> int:
+        """
+        A read-only attribute whose value is the number of input frames buffered by a `simple_pygame.SincInterpolation` resampler.
+        """
+        if self.quality == LinearInterpolation:
+            return 0
+
+        return len(self._frames) if _np is not None else len(self._frames[0])
+
+    def convolve(self, limit: int, batch: int = 4096) -> bytes:
+        """
+        Filter the buffered input frames and return every output frame whose first tap lies before `limit`. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        limit: Index of the first buffered input frame that mustn't be the first tap of an output frame.
+
+        batch (optional): Maximum number of output frames to compute at once.
+        """
+        in_step, out_step, taps = self._in_step, self._out_step, 2 * self._half_length
+        count = max(0, -((self._position - limit * out_step) // in_step))
+
+        if _np is not None:
+            result = []
+            minval, maxval = _get_minval(self.width), _get_maxval(self.width)
+
+            for start in range(0, count, batch):
+                positions = self._position + _np.arange(start, min(start + batch, count), dtype = _np.int64) * in_step
+                first_taps = positions // out_step
+                coefficients = self._table[(positions % out_step) * self._phases // out_step]
+
+                frames = self._frames[first_taps[:, None] + _np.arange(taps)]
+                result.append(_np.clip(_np.rint(_np.einsum("ik,ikc->ic", coefficients, frames)), minval, maxval).ravel())
+
+            self.advance(count)
+            return _np_put_samples(_np.concatenate(result), self.width) if result else b""
+
+        result = []
+        for index in range(count):
+            position = self._position + index * in_step
+            first_tap = position // out_step
+            coefficients = self._table[(position % out_step) * self._phases // out_step]
+
+            for frames in self._frames:
+                result.append(round(sum(map(_mul, frames[first_tap:first_tap + taps], coefficients))))
+
+        self.advance(count)
+        return _put_samples(_clip_samples(result, self.width), self.width)
+
+    def advance(self, count: int) -> None:
+        """
+        Move past `count` output frames and drop the input frames that no later output frame needs. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        count: Number of output frames that have been computed.
+        """
+        self._position += count * self._in_step
+        dropped = self._position // self._out_step
+        self._position -= dropped * self._out_step
+
+        if _np is not None:
+            self._frames = self._frames[dropped:]
+        else:
+            self._frames = [frames[dropped:] for frames in self._frames]
@@ -0,0 +1,282 @@
+"""
+A module for playing short sounds that are decoded once and kept in memory.
+"""
+import threading as _threading, os as _os
+from typing import Optional as _Optional, Union as _Union, Tuple as _Tuple, Dict as _Dict, Any as _Any
+
+from ..exceptions import FFmpegError
+from .mixer import Mixer as _Mixer, Source as _Source
+
+class Voice(_Source):
+    def __init__(self, sound: "Sound", loop: int, volume: _Union[int, float], pan: _Union[int, float]) -> None:
+        """
+        One playing instance of a `Sound` object. Many voices of the same sound read the same decoded audio. Use `Sound.play()` to create one instead of creating it directly.
+
+        Parameters
+        ----------
+
+        sound: The `Sound` object.
+
+        loop: How many times to repeat the sound. If the given loop is `-1` repeats indefinitely.
+
+        volume: The voice's volume.
+
+        pan: The voice's pan from `-1` (left) to `1` (right).
+        """
+        super().__init__(sound.mixer, sound.path, sound.stream, loop, volume, pan, False)
+
+        self.sound = sound
+        self._start_offset = 0
+        self._duration = sound.length
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        A read-only attribute whose value is `True` if the voice played to its end, otherwise `False`.
+        """
+        size = len(self.sound.data)
+        return size == 0 or self.loop != -1 and self._start_offset + self._frames * self.mixer.frame_size >= (self.loop + 1) * size
+
+    def seek(self, position: _Union[int, float]) -> None:
+        """
+        Continue playing the voice from a position. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        position: The position in seconds.
+        """
+        frame_count = len(self.sound.data) // self.mixer.frame_size
+
+        with self._lock:
+            self._start_offset = min(int(position * self.mixer.sample_rate), frame_count) * self.mixer.frame_size
+            self._start_position = self._start_offset / self.mixer.frame_size / self.mixer.sample_rate
+            self._frames = 0
+
+    def is_ready(self, size: int) -> bool:
+        """
+        Return `True` because the sound is always in memory. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        size: Number of bytes.
+        """
+        return True
+
+    def read(self, size: int) -> bytearray:
+        """
+        Return the next `size` bytes of the sound, padded with silence at the end of the voice. This function is meant for use by the class and not for general use.
+
+        Parameters
+        ----------
+
+        size: Number of bytes.
+        """
+        data = self.sound._data
+        result = bytearray(size)
+        if len(data) == 0:
+            return result
+
+        with self._lock:
+            # The offset counts every byte played since the start offset, as if the loops were one after another.
+            offset = self._start_offset + self._frames * self.mixer.frame_size
+            count = size if self.loop == -1 else max(min(size, (self.loop + 1) * len(data) - offset), 0)
+
+            index = 0
+            while index < count:
+                start = (offset + index) % len(data)
+                end = min(len(data), start + count - index)
+
+                result[index:index + end - start] = data[start:end]
+                index += end - start
+
+            self._frames += count // self.mixer.frame_size
+            self._read_size = count
+
+        return result
+
+class Sound:
+    default_mixer = None
+
+    def __init__(self, path: _Union[str, _os.PathLike], stream: int = 0, max_voices: int = 8, steal: bool = True, mixer: _Optional[_Mixer] = None, encoding: _Optional[str] = None, use_ffmpeg: bool = False, loglevel: str = "quiet", ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe") -> None:
+        """
+        A short sound that is decoded once into memory, so playing it only reads memory instead of starting `ffmpeg`. Many voices of the sound can play at the same time through a `simple_pygame.mixer.mixer.Mixer` object.
+
+        Requirements
+        ------------
+
+        - Pyaudio library.
+
+        - FFmpeg.
+
+        - FFprobe (optional).
+
+        Parameters
+        ----------
+
+        path: Path to the file contains audio.
+
+        stream (optional): Which stream to use if the file has more than 1 audio streams. Use the default stream if the given stream is invalid.
+
+        max_voices (optional): Maximum number of voices of the sound that play at the same time.
+
+        steal (optional): Specifies whether playing the sound when `max_voices` voices are playing stops the oldest voice. If it's `False`, the sound isn't played instead.
+
+        mixer (optional): The `Mixer` object that plays the sound. The sound is decoded to its sample rate, channels and format. Use a shared mixer, which is created the first time it's needed, if the given mixer is `None`.
+
+        encoding (optional): Encoding for decoding. Defaults to `None`.
+
+        use_ffmpeg (optional): Specifies whether to use `ffmpeg` or `ffprobe` to get the file's information.
+
+        loglevel (optional): Logging level and flags used by `ffmpeg`.
+
+        ffmpeg_path (optional): Path to `ffmpeg`.
+
+        ffprobe_path (optional): Path to `ffprobe`.
+        """
+        try:
+            path = _os.fspath(path)
+        except TypeError:
+            pass
+
+        if not isinstance(path, str):
+            raise TypeError("Path must be a string/a path-like object.")
+
+        if not isinstance(stream, int):
+            raise TypeError("Stream must be an integer.")
+
+        if not isinstance(max_voices, int):
+            raise TypeError("Max voices must be an integer.")
+        elif max_voices <= 0:
+            raise ValueError("Max voices must be greater than 0.")
+
+        if not isinstance(steal, bool):
+            raise TypeError("Steal must be a boolean.")
+
+        if mixer != None and not isinstance(mixer, _Mixer):
+            raise TypeError("Mixer must be None/a Mixer object.")
+
+        self.path = path
+        self.stream = stream
+        self.max_voices = max_voices
+        self.steal = steal
+        self.mixer = mixer if mixer != None else self.get_default_mixer()
+
+        decoder = self.mixer._decoder
+        output_options = [*decoder.output_options, "-ar", str(self.mixer.sample_rate), "-ac", str(self.mixer.channels)]
+        pipe, self.information, self.stream_information = decoder.create_pipe(path, 0, stream, encoding, decoder.ffmpeg_format, use_ffmpeg, loglevel, ffmpeg_path, ffprobe_path, decoder.input_options, output_options)
+
+        data, stderr = pipe.communicate()
+        if pipe.returncode != 0:
+            raise FFmpegError(stderr.decode(errors = "replace").strip() or f"FFmpeg exited with code {pipe.returncode}.")
+
+        frame_size = self.mixer.frame_size
+        self.data = data[:len(data) - len(data) % frame_size]
+        self.length = len(self.data) / frame_size / self.mixer.sample_rate
+
+        self._data = memoryview(self.data)
+        self._voices = []
+        self._lock = _threading.Lock()
+
+    @classmethod
+    def get_default_mixer(self) -> _Mixer:
+        """
+        Return the mixer shared by sounds that weren't given one, creating it with the default arguments if it doesn't exist. Its threads are daemon threads, so they don't keep the program running.
+        """
+        if Sound.default_mixer == None:
+            Sound.default_mixer = _Mixer()
+            Sound.default_mixer.start(daemon = True)
+
+        return Sound.default_mixer
+
+    @property
+    def voices(self) -> _Tuple[Voice, ...]:
+        """
+        A read-only attribute whose value is a tuple of the voices that are currently playing or paused, from the oldest to the newest.
+        """
+        with self._lock:
+            self._voices = [voice for voice in self._voices if voice.is_busy]
+            return (*self._voices,)
+
+    def play(self, loop: int = 0, start: _Union[int, float] = 0, volume: _Union[int, float] = 1, pan: _Union[int, float] = 0) -> _Optional[Voice]:
+        """
+        Start a new voice of the sound and return it. If `max_voices` voices are playing, stop the oldest one first, or return `None` without playing if `steal` is `False`.
+
+        Parameters
+        ----------
+
+        loop (optional): How many times to repeat the sound. If the given loop is `-1` repeats indefinitely.
+
+        start (optional): Where the voice starts playing in seconds.
+
+        volume (optional): The voice's volume.
+
+        pan (optional): The voice's pan from `-1` (left) to `1` (right).
+        """
+        if not isinstance(loop, int):
+            raise TypeError("Loop must be an integer.")
+        elif loop < -1:
+            raise ValueError("Loop must be -1 or greater.")
+
+        if not isinstance(start, (int, float)):
+            raise TypeError("Start position must be an integer/a float.")
+
+        voice = Voice(self, loop, volume, pan)
+        voice.seek(0 if start < 0 else start)
+
+        voices = self.voices
+        if len(voices) >= self.max_voices:
+            if not self.steal:
+                return None
+
+            for stolen_voice in voices[:len(voices) - self.max_voices + 1]:
+                stolen_voice.stop()
+
+        with self._lock:
+            self._voices.append(voice)
+
+        return self.mixer.add(voice)
+
+    def stop(self) -> None:
+        """
+        Stop every voice of the sound.
+        """
+        for voice in self.voices:
+            voice.stop()
+
+    def set_volume(self, volume: _Union[int, float]) -> None:
+        """
+        Set the volume of every voice of the sound.
+
+        Parameters
+        ----------
+
+        volume: The voices' volume (`1` is the original volume).
+        """
+        for voice in self.voices:
+            voice.set_volume(volume)
+
+    def get_voices(self) -> _Tuple[Voice, ...]:
+        """
+        Return a tuple of the voices that are currently playing or paused, from the oldest to the newest.
+        """
+        return self.voices
+
+    def get_length(self) -> float:
+        """
+        Return the length of the sound in seconds.
+        """
+        return self.length
+
+    def get_raw(self) -> bytes:
+        """
+        Return the decoded audio in the mixer's format.
+        """
+        return self.data
+
+    def get_information(self) -> _Dict[str, _Any]:
+        """
+        Return the file's information.
+        """
+        return self.information
@@ -1,4 +1,5 @@
-import simple_pygame, unittest, time, subprocess, pathlib, sys, os
+import simple_pygame, unittest, asyncio, time, subprocess, pathlib, sys, os
+from unittest import mock
 
 class TestAudio(unittest.TestCase):
     @classmethod
@@ -50,6 +51,68 @@ class TestAudio(unittest.TestCase):
         except simple_pygame.FFmpegError:
             self.skipTest("No ffmpeg found.")
 
+    def test_get_information_many(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            self.audio.get_information_many([self.audio.path], max_workers = 0)
+
+        missing_path = os.path.join(os.path.dirname(self.audio.path), "Missing.mp3")
+        results = dict(self.audio.get_information_many([self.audio.path, missing_path], max_workers = 2))
+
+        if isinstance(results[self.audio.path], simple_pygame.FFprobeError):
+            self.skipTest("No ffprobe found.")
+
+        self.assertEqual(type(results[self.audio.path]), dict, "The information must be a dict.")
+        self.assertIsInstance(results[missing_path], Exception, "Expected an exception for a missing file.")
+
+    def test_aget_information(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
+
+        self.audio.invalidate_information(self.audio.path)
+        try:
+            information = asyncio.run(self.audio.aget_information(self.audio.path))
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+        self.assertEqual(information, self.audio.get_information(self.audio.path), "Expected the same information as get_information().")
+
+        try:
+            self.assertEqual(type(asyncio.run(self.audio.aget_information(self.audio.path, "utf-8", True, "ffmpeg"))), dict, "The return value must be a dict.")
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+
+    def test_aplay(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
+        elif not self.has_default_output_device():
+            self.skipTest("No default output device found.")
+
+        async def play() -> list:
+            await self.audio.aplay()
+            self.assertTrue(self.audio.get_busy(), "Play audio failed.")
+
+            events = []
+            self.audio.set_position(self.audio._duration - 0.1 if self.audio._duration else 0)
+
+            async for event in self.audio.events():
+                events.append(event)
+
+            await self.audio.wait_finished()
+            return events
+
+        try:
+            events = asyncio.run(play())
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+        self.assertEqual(events[-1], "end", "Expected the end event.")
+        self.assertFalse(self.audio.get_busy(), "Wait for audio failed.")
+
     def test_create_pipe(self) -> None:
         if not self.is_initialized():
             self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
@@ -188,6 +251,122 @@ class TestAudio(unittest.TestCase):
         self.assertFalse(self.audio.get_busy(), "Join audio failed..")
         self.assertEqual(self.audio.get_position(), simple_pygame.AudioEnded, "Invalid audio position.")
 
+    def test_loop(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
+        elif not self.has_default_output_device():
+            self.skipTest("No default output device found.")
+
+        with self.assertRaises(TypeError, msg = "Expected TypeError."):
+            self.audio.play(seamless_loop = 1)
+
+        self.audio.play(loop = -1)
+        while self.audio.get_position() == simple_pygame.AudioIsLoading:
+            time.sleep(0.1)
+
+        try:
+            self.audio.get_exception()
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+        length = self.audio._duration
+        if length == None:
+            self.audio.stop()
+            self.skipTest("Unknown audio length.")
+
+        self.audio.set_position(length - 0.1)
+        while self.audio._reposition:
+            time.sleep(0.1)
+
+        time.sleep(0.5)
+        self.assertTrue(self.audio.get_busy(), "Loop audio failed.")
+        self.assertLess(self.audio.get_position(), length - 0.1, "Invalid audio position after looping.")
+
+        self.audio.stop()
+        self.assertFalse(self.audio.get_busy(), "Stop audio failed.")
+
+    def test_scrub(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
+        elif not self.has_default_output_device():
+            self.skipTest("No default output device found.")
+
+        self.audio.play()
+        while self.audio.get_position() == simple_pygame.AudioIsLoading:
+            time.sleep(0.1)
+
+        try:
+            self.audio.get_exception()
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            self.audio.scrub(1, 0)
+
+        for position in (1, 1.1, 1.2):
+            self.audio.scrub(position)
+        self.assertTrue(self.audio.is_scrubbing, "Enter scrub mode failed.")
+
+        time.sleep(0.5)
+        self.assertLessEqual(1.2, self.audio.get_position(), "Invalid audio position.")
+
+        self.audio.end_scrub(2)
+        self.assertFalse(self.audio.is_scrubbing, "Leave scrub mode failed.")
+
+        while self.audio._reposition:
+            time.sleep(0.1)
+        self.assertLessEqual(2, self.audio.get_position(), "Invalid audio position.")
+
+        self.audio.stop()
+
+    def test_commands(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
+        elif not self.has_default_output_device():
+            self.skipTest("No default output device found.")
+
+        # Commands wake the audio thread up, so none of them waits for the delay.
+        self.audio.play(delay = 10)
+        while self.audio.get_position() == simple_pygame.AudioIsLoading:
+            time.sleep(0.1)
+
+        try:
+            self.audio.get_exception()
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+        with mock.patch.object(self.audio, "emit", wraps = self.audio.emit) as emit:
+            for position in (1, 1.5, 2):
+                self.audio.set_position(position)
+
+            while self.audio._reposition:
+                time.sleep(0.1)
+            time.sleep(0.2)
+
+        self.assertEqual([call.args for call in emit.call_args_list].count(("seek",)), 1, "Expected only the last seek to take effect.")
+        self.assertLessEqual(2, self.audio.get_position(), "Invalid audio position.")
+
+        self.audio.pause()
+        while self.audio._pause_offset == None:
+            time.sleep(0.1)
+        before_position = self.audio.get_position()
+
+        self.audio.resume()
+        time.sleep(0.5)
+        self.assertLess(before_position + 0.25, self.audio.get_position(), "Expected the audio to resume without waiting for the delay.")
+
+        start = time.monotonic()
+        self.audio.stop()
+        self.assertLess(time.monotonic() - start, 5, "Expected the audio to stop without waiting for the delay.")
+        self.assertFalse(self.audio.get_busy(), "Stop audio failed.")
+        self.assertEqual(self.audio.get_position(), simple_pygame.AudioEnded, "Invalid audio position.")
+
     def test_volume(self) -> None:
         if not self.is_initialized():
             self.skipTest("Initialize simple_pygame.mixer.Audio failed.")
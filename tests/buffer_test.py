@@ -0,0 +1,101 @@
+import simple_pygame.mixer.buffer as buffer, unittest, threading, io
+
+class TestRingBuffer(unittest.TestCase):
+    def test_wrap_around(self) -> None:
+        ring_buffer = buffer.RingBuffer(10)
+        data = bytearray(4)
+
+        for index in range(10):
+            self.assertTrue(ring_buffer.write(bytes(range(index, index + 4))), "Invalid write result.")
+            self.assertEqual(ring_buffer.fill, 0.4, "Invalid fill level.")
+
+            self.assertEqual(ring_buffer.readinto(data), 4, "Invalid read size.")
+            self.assertEqual(data, bytes(range(index, index + 4)), "Invalid read data.")
+
+    def test_blocking(self) -> None:
+        ring_buffer = buffer.RingBuffer(8)
+        data = bytes(range(100))
+
+        writer = threading.Thread(target = lambda: (ring_buffer.write(data), ring_buffer.finish()))
+        writer.start()
+
+        result = bytearray()
+        chunk = bytearray(6)
+        while True:
+            size = ring_buffer.readinto(chunk)
+            if size == 0:
+                break
+            result += chunk[:size]
+
+        writer.join()
+        self.assertEqual(result, data, "Invalid data after blocking reads and writes.")
+
+    def test_close(self) -> None:
+        ring_buffer = buffer.RingBuffer(4)
+        result = []
+
+        writer = threading.Thread(target = lambda: result.append(ring_buffer.write(bytes(8))))
+        writer.start()
+        ring_buffer.close()
+        writer.join()
+
+        self.assertEqual(result, [False], "Expected an unfinished write after closing.")
+
+        ring_buffer.clear()
+        self.assertEqual(ring_buffer.size, 0, "Invalid size after clearing.")
+
+    def test_non_blocking(self) -> None:
+        ring_buffer = buffer.RingBuffer(8)
+        data = bytearray(6)
+
+        self.assertEqual(ring_buffer.readinto(data, False), 0, "Invalid read size of an empty buffer.")
+        self.assertFalse(ring_buffer.wait(4, 0.01), "Expected the wait to time out.")
+
+        ring_buffer.write(b"abc")
+        self.assertEqual(ring_buffer.readinto(data, False), 3, "Invalid read size of a partly filled buffer.")
+        self.assertEqual(data[:3], b"abc", "Invalid read data.")
+
+        writer = threading.Thread(target = lambda: ring_buffer.write(b"defgh"))
+        writer.start()
+        self.assertTrue(ring_buffer.wait(4, 5), "Expected the wait to succeed.")
+        writer.join()
+
+        ring_buffer.finish()
+        self.assertEqual(ring_buffer.readinto(data), 5, "Invalid read size of a finished buffer.")
+        self.assertTrue(ring_buffer.is_finished, "Expected the buffer to be finished.")
+
+class TestReadAhead(unittest.TestCase):
+    def test_read(self) -> None:
+        source = io.BytesIO(bytes(range(256)) * 10)
+        read_ahead = buffer.ReadAhead(source.readinto, 100, 32)
+
+        result = bytearray()
+        chunk = bytearray(64)
+        while True:
+            size = read_ahead.readinto(chunk)
+            if size == 0:
+                break
+            result += chunk[:size]
+
+        read_ahead.join()
+        self.assertEqual(result, bytes(range(256)) * 10, "Invalid read-ahead data.")
+        self.assertTrue(read_ahead.is_finished, "Expected the source to be finished.")
+
+    def test_stop(self) -> None:
+        read_ahead = buffer.ReadAhead(lambda data: len(data), 100, 32)
+        read_ahead.stop()
+        read_ahead.join(5)
+
+        self.assertFalse(read_ahead.is_finished, "Expected the source not to be finished.")
+        self.assertFalse(read_ahead._thread.is_alive(), "Expected the thread to end.")
+
+    def test_exception(self) -> None:
+        def read(data: memoryview) -> int:
+            raise OSError("Broken source.")
+
+        read_ahead = buffer.ReadAhead(read, 100, 32)
+        with self.assertRaises(OSError, msg = "Expected OSError."):
+            read_ahead.readinto(bytearray(10))
+
+if __name__ == "__main__":
+    unittest.main()
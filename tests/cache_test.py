@@ -0,0 +1,163 @@
+import simple_pygame.mixer.cache as cache, unittest, tempfile, os
+
+class TestPCMCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = cache.PCMCache(os.path.join(self.directory.name, "cache"), 100)
+
+        self.file_path = os.path.join(self.directory.name, "Sound.mp3")
+        with open(self.file_path, "wb") as file:
+            file.write(b"compressed audio")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def fill(self, key: str, data: bytes) -> cache.CacheReader:
+        writer = self.cache.create_writer(key)
+        for index in range(0, len(data), 7):
+            writer.write(data[index:index + 7])
+
+        return writer.commit({"format": {}}, {"sample_rate": 44100, "channels": 2})
+
+    def test_key(self) -> None:
+        key = self.cache.get_key(self.file_path, 0, "s16le")
+        self.assertEqual(key, self.cache.get_key(self.file_path, 0, "s16le"), "Invalid key.")
+        self.assertNotEqual(key, self.cache.get_key(self.file_path, 1, "s16le"), "Invalid key for another stream.")
+        self.assertNotEqual(key, self.cache.get_key(self.file_path, 0, "s32le"), "Invalid key for another format.")
+        self.assertIsNone(self.cache.get_key(os.path.join(self.directory.name, "Missing.mp3"), 0, "s16le"), "Invalid key for a missing file.")
+
+        with open(self.file_path, "ab") as file:
+            file.write(b"!")
+        self.assertNotEqual(key, self.cache.get_key(self.file_path, 0, "s16le"), "Invalid key for a modified file.")
+
+    def test_read(self) -> None:
+        key = self.cache.get_key(self.file_path, 0, "s16le")
+        self.assertIsNone(self.cache.open(key), "Expected a miss.")
+
+        reader = self.fill(key, bytes(range(40)))
+        self.assertIsNone(self.cache.create_writer(key), "Expected no writer for a cached entry.")
+        self.assertEqual(reader.stream_information, {"sample_rate": 44100, "channels": 2}, "Invalid stream information.")
+
+        buffer = memoryview(bytearray(16))
+        self.assertEqual(reader.readinto(buffer), 16, "Invalid read size.")
+        self.assertEqual(bytes(buffer), bytes(range(16)), "Invalid read data.")
+
+        reader.seek(32)
+        self.assertEqual(reader.readinto(buffer), 8, "Invalid read size at the end.")
+        self.assertEqual(bytes(buffer[:8]), bytes(range(32, 40)), "Invalid read data at the end.")
+        self.assertEqual(reader.readinto(buffer), 0, "Invalid read size after the end.")
+        reader.close()
+
+        reader = self.cache.open(key)
+        self.assertEqual(self.cache.get_stats(), {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "size": 40, "max_size": 100}, "Invalid statistics.")
+        reader.close()
+
+        # The cache is kept between runs.
+        reader = cache.PCMCache(self.cache.directory).open(key)
+        self.assertIsNotNone(reader, "Expected a hit in a new cache object.")
+        reader.close()
+
+    def test_discard(self) -> None:
+        key = self.cache.get_key(self.file_path, 0, "s16le")
+
+        writer = self.cache.create_writer(key)
+        self.assertIsNone(self.cache.create_writer(key), "Expected no writer for an entry being written.")
+        writer.write(b"data")
+        writer.discard()
+
+        self.assertIsNone(self.cache.open(key), "Expected a miss for a discarded entry.")
+        self.assertEqual(os.listdir(self.cache.directory), [], "Expected no files for a discarded entry.")
+
+    def test_eviction(self) -> None:
+        keys = [self.cache.get_key(self.file_path, stream, "s16le") for stream in range(4)]
+
+        for key in keys[:2]:
+            self.fill(key, bytes(40)).close()
+        self.cache.open(keys[0]).close()
+
+        # The second entry is the least recently used one.
+        reader = self.fill(keys[2], bytes(40))
+        self.assertEqual(self.cache.size, 80, "Invalid size after an eviction.")
+        self.assertIsNone(self.cache.open(keys[1]), "Expected the least recently used entry to be evicted.")
+
+        # Entries that are being read aren't evicted, so a new entry that doesn't fit is evicted instead.
+        self.assertIsNone(self.fill(keys[3], bytes(90)), "Expected an entry that doesn't fit to be evicted.")
+        self.assertEqual(self.cache.get_stats()["evictions"], 3, "Invalid number of evictions.")
+        self.assertEqual(self.cache.size, 40, "Expected an entry being read to be kept.")
+        reader.close()
+
+class TestInformationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.directory.name, "information.json")
+        self.information = {"format": {"duration": 1.5}, "streams": [{"codec_type": "audio", "sample_rate": "44100", "channels": 2}]}
+
+        self.file_paths = []
+        for index in range(3):
+            self.file_paths.append(os.path.join(self.directory.name, f"Sound{index}.mp3"))
+            with open(self.file_paths[-1], "wb") as file:
+                file.write(b"compressed audio")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_get(self) -> None:
+        information_cache = cache.InformationCache(2)
+        key = information_cache.get_key(self.file_paths[0], None, False)
+
+        self.assertIsNone(information_cache.get(key), "Expected a miss.")
+        information_cache.put(key, self.information)
+
+        information = information_cache.get(key)
+        self.assertEqual(information, self.information, "Invalid information.")
+
+        # Changing the returned information doesn't change the cache.
+        information["streams"].clear()
+        self.assertEqual(information_cache.get(key), self.information, "Expected a copy of the information.")
+
+        with open(self.file_paths[0], "ab") as file:
+            file.write(b"!")
+        self.assertIsNone(information_cache.get(information_cache.get_key(self.file_paths[0], None, False)), "Expected a miss for a modified file.")
+        self.assertEqual(information_cache.get_stats(), {"hits": 2, "misses": 2, "entries": 1, "max_size": 2}, "Invalid statistics.")
+
+    def test_eviction(self) -> None:
+        information_cache = cache.InformationCache(2)
+        keys = [information_cache.get_key(file_path, None, False) for file_path in self.file_paths]
+
+        for key in keys:
+            information_cache.put(key, self.information)
+        self.assertIsNone(information_cache.get(keys[0]), "Expected the least recently used entry to be evicted.")
+        self.assertIsNotNone(information_cache.get(keys[2]), "Expected the newest entry to be kept.")
+
+    def test_invalidate(self) -> None:
+        information_cache = cache.InformationCache(path = self.store_path)
+        keys = [information_cache.get_key(file_path, None, False) for file_path in self.file_paths]
+
+        for key in keys:
+            information_cache.put(key, self.information)
+        information_cache.invalidate(self.file_paths[1])
+        information_cache.flush()
+
+        # The entries are kept between runs.
+        information_cache = cache.InformationCache(path = self.store_path)
+        self.assertEqual(information_cache.get(keys[0]), self.information, "Expected a stored entry.")
+        self.assertIsNone(information_cache.get(keys[1]), "Expected an invalidated entry to be forgotten.")
+
+        information_cache.invalidate()
+        information_cache.flush()
+        self.assertEqual(cache.InformationCache(path = self.store_path).get_stats()["entries"], 0, "Expected no entries after invalidating every file.")
+
+    def test_save_delay(self) -> None:
+        information_cache = cache.InformationCache(path = self.store_path, save_delay = 60)
+        key = information_cache.get_key(self.file_paths[0], None, False, "ffprobe")
+        self.assertNotEqual(key, information_cache.get_key(self.file_paths[0], None, False, "/usr/bin/ffprobe"), "Invalid key for another executable.")
+
+        for file_path in self.file_paths:
+            information_cache.put(information_cache.get_key(file_path, None, False, "ffprobe"), self.information)
+        self.assertFalse(os.path.exists(self.store_path), "Expected the entries to be stored later.")
+
+        information_cache.flush()
+        self.assertEqual(cache.InformationCache(path = self.store_path).get(key), self.information, "Expected the entries to be stored at once.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import simple_pygame, unittest, threading, time, os
+from unittest import mock
+
+class TestMixer(unittest.TestCase):
+    @classmethod
+    def setUpClass(self) -> None:
+        self.file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "Sound.mp3")
+        self.successfully_initialized = simple_pygame.mixer.init((simple_pygame.MixerClass,))
+
+        if self.is_initialized(self):
+            self.mixer = simple_pygame.mixer.Mixer()
+
+    @classmethod
+    def tearDownClass(self) -> None:
+        if self.is_initialized(self):
+            self.mixer.terminate()
+            simple_pygame.mixer.quit((simple_pygame.MixerClass,))
+
+    def is_initialized(self) -> bool:
+        return simple_pygame.MixerClass in self.successfully_initialized
+
+    def has_default_output_device(self) -> bool:
+        if not self.is_initialized():
+            return False
+
+        try:
+            self.mixer._decoder.get_device_info()
+        except:
+            return False
+
+        return True
+
+    def play(self, *args, **kwargs) -> "simple_pygame.mixer.mixer.Source":
+        try:
+            return self.mixer.play(*args, **kwargs)
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+    def test_attributes(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Mixer failed.")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            simple_pygame.mixer.Mixer(chunk = 4095)
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            self.mixer.set_volume(-1)
+
+    def test_play(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Mixer failed.")
+        elif not self.has_default_output_device():
+            self.skipTest("No default output device found.")
+
+        sources = [self.play(self.file_path, volume = 0.5, pan = pan) for pan in (-1, 0, 1)]
+        self.assertEqual(self.mixer.get_sources(), (*sources,), "Invalid sources.")
+        self.assertTrue(self.mixer.get_busy(), "Start mixer failed.")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            sources[0].set_pan(2)
+
+        sources[0].pause()
+        self.assertTrue(sources[0].get_pause(), "Pause source failed.")
+
+        time.sleep(0.2)
+        before_position = sources[0].get_position()
+        time.sleep(0.1)
+        self.assertEqual(before_position, sources[0].get_position(), "Invalid source position.")
+
+        sources[1].set_position(1)
+        self.assertLessEqual(1, sources[1].get_position(), "Invalid source position.")
+
+        sources[2].stop()
+        self.assertFalse(sources[2].get_busy(), "Stop source failed.")
+        self.assertEqual(sources[2].get_position(), simple_pygame.AudioEnded, "Invalid source position.")
+
+        self.mixer.stop()
+        self.assertFalse(self.mixer.get_busy(), "Stop mixer failed.")
+        self.assertEqual(self.mixer.get_sources(), (), "Invalid sources after stopping.")
+        self.mixer.get_exception()
+
+    def test_chain(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Mixer failed.")
+
+        writes = []
+        stream = mock.Mock()
+        stream.write.side_effect = lambda data: writes.append(bytes(data))
+
+        mixer = simple_pygame.mixer.Mixer()
+        context = mixer._decoder._pyaudio_context
+        with mock.patch.object(context, "open", return_value = stream), mock.patch.object(context, "close"):
+            # The sources are filled by hand, so the next one isn't decoded when the first one ends.
+            data, next_data = bytes(range(1, 201)) * 10, bytes(range(56, 256)) * 30
+            source = simple_pygame.mixer.mixer.Source(mixer, self.file_path, 0, 0, 1, 0)
+            source._buffer.write(data)
+            source._buffer.finish()
+            next_source = simple_pygame.mixer.mixer.Source(mixer, self.file_path, 0, 0, 1, 0)
+
+            mixer.chain(source, next_source)
+            mixer.add(next_source)
+            mixer.add(source)
+
+            time.sleep(0.2)
+            self.assertTrue(source.get_busy(), "Expected the source to be kept until the next source is decoded.")
+            self.assertTrue(next_source.get_pause(), "Expected the next source to wait until it's decoded.")
+
+            next_source._buffer.write(next_data)
+            next_source._buffer.finish()
+
+            deadline = time.monotonic() + 10
+            while next_source.get_busy() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            mixer.terminate()
+
+        output = b"".join(writes)
+        self.assertFalse(source.get_busy(), "Expected the source to be removed.")
+        self.assertEqual(output[:len(data)], data, "Invalid source output.")
+        self.assertEqual(output[output.index(next_data[:mixer.chunk]):].rstrip(b"\0"), next_data, "Expected the next source to start with its decoded audio.")
+        self.assertEqual(output.index(next_data[:mixer.chunk]) % mixer.chunk, 0, "Expected the next source to start at a chunk.")
+
+    def test_exception(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Mixer failed.")
+
+        mixer = simple_pygame.mixer.Mixer()
+        context = mixer._decoder._pyaudio_context
+        with mock.patch.object(context, "open", side_effect = OSError("No output stream.")), mock.patch.object(context, "close"):
+            mixer.add(simple_pygame.mixer.mixer.Source(mixer, self.file_path, 0, 0, 1, 0))
+            decode_thread = mixer._decode_thread
+
+            deadline = time.monotonic() + 10
+            while mixer.exception == None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertIsInstance(mixer.exception, OSError, "Expected the exception to be recorded.")
+
+            # Adding a source restarts the mixer only after the stale decode thread stopped.
+            mixer.add(simple_pygame.mixer.mixer.Source(mixer, self.file_path, 0, 0, 1, 0))
+            self.assertFalse(decode_thread.is_alive(), "Expected the stale decode thread to stop.")
+            self.assertLessEqual(len([thread for thread in threading.enumerate() if getattr(thread, "_target", None) == mixer.decode]), 1, "Expected only one decode thread.")
+
+            mixer._output_thread.join(10)
+            mixer._decode_thread.join(10)
+            self.assertFalse(mixer.get_busy(), "Expected the decode thread to stop with the output thread.")
+            mixer.terminate()
+
+if __name__ == "__main__":
+    unittest.main()
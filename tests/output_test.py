@@ -0,0 +1,55 @@
+import unittest
+
+try:
+    import simple_pygame.mixer.output as output
+except ImportError:
+    output = None
+
+@unittest.skipIf(output == None, "PyAudio isn't installed.")
+class TestPyAudioContext(unittest.TestCase):
+    def has_default_output_device(self, pa) -> bool:
+        try:
+            pa.get_default_output_device_info()
+        except:
+            return False
+
+        return True
+
+    def test_reference_count(self) -> None:
+        context = output.PyAudioContext()
+
+        pa = context.acquire()
+        self.assertIs(context.acquire(), pa, "Expected a shared PyAudio object.")
+        self.assertEqual(context.count, 2, "Invalid number of references.")
+
+        context.release()
+        context.release()
+        context.release()
+        self.assertEqual(context.count, 0, "Invalid number of references after releasing.")
+
+        with self.assertRaises(RuntimeError, msg = "Expected RuntimeError for a released context."):
+            context.open(44100, 2, output._pyaudio.paInt16)
+
+    def test_pool(self) -> None:
+        context = output.PyAudioContext(1)
+        pa = context.acquire()
+
+        try:
+            if not self.has_default_output_device(pa):
+                self.skipTest("No default output device.")
+
+            stream = context.open(44100, 2, output._pyaudio.paInt16)
+            context.close(stream)
+            self.assertIs(context.open(44100, 2, output._pyaudio.paInt16), stream, "Expected the idle stream to be reused.")
+
+            other_stream = context.open(44100, 2, output._pyaudio.paInt16)
+            self.assertIsNot(other_stream, stream, "Expected a new stream while the idle one is in use.")
+
+            context.close(stream)
+            context.close(other_stream)
+            self.assertEqual(context.get_stats(), {"hits": 1, "misses": 2, "idle": 1, "references": 1}, "Invalid statistics.")
+        finally:
+            context.release()
+
+if __name__ == "__main__":
+    unittest.main()
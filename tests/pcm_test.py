@@ -0,0 +1,59 @@
+import simple_pygame.mixer.pcm as pcm, unittest, tempfile, struct, wave, os
+
+class TestPCMReader(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.frames = bytes(range(256)) * 16
+
+        self.file_path = os.path.join(self.directory.name, "audio.wav")
+        with wave.open(self.file_path, "wb") as file:
+            file.setnchannels(2)
+            file.setsampwidth(2)
+            file.setframerate(8000)
+            file.writeframes(self.frames)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_read(self) -> None:
+        reader = pcm.PCMReader.open_wav(self.file_path, "s16le")
+        self.assertEqual(reader.size, len(self.frames), "Invalid size.")
+
+        buffer = bytearray(1000)
+        self.assertEqual(reader.readinto(buffer), 1000, "Invalid read size.")
+        self.assertEqual(buffer, self.frames[:1000], "Invalid samples.")
+
+        reader.seek(len(self.frames) - 100)
+        self.assertEqual(reader.readinto(buffer), 100, "Expected a read until the end.")
+        self.assertEqual(buffer[:100], self.frames[-100:], "Invalid samples after seeking.")
+        self.assertEqual(reader.readinto(buffer), 0, "Expected no samples after the end.")
+
+        reader.close()
+        reader.close()
+
+    def test_raw(self) -> None:
+        path = os.path.join(self.directory.name, "audio.raw")
+        with open(path, "wb") as file:
+            file.write(self.frames)
+
+        reader = pcm.PCMReader(path, 4, 8)
+        buffer = bytearray(16)
+        self.assertEqual(buffer[:reader.readinto(buffer)], self.frames[4:12], "Invalid samples.")
+        reader.close()
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            pcm.PCMReader(path, -1)
+
+    def test_format_mismatch(self) -> None:
+        self.assertIsNone(pcm.PCMReader.open_wav(self.file_path, "s32le"), "Expected None for another data format.")
+        self.assertIsNone(pcm.PCMReader.open_wav(self.file_path, "s16be"), "Expected None for another byte order.")
+        self.assertIsNone(pcm.PCMReader.open_wav(os.path.join(self.directory.name, "missing.wav"), "s16le"), "Expected None for a missing file.")
+
+        # A truncated fmt chunk is read as an invalid WAV file, so it's played by ffmpeg instead.
+        path = os.path.join(self.directory.name, "truncated.wav")
+        with open(path, "wb") as file:
+            file.write(b"RIFF" + struct.pack("<I", 24) + b"WAVE" + b"fmt " + struct.pack("<I", 16) + struct.pack("<HH", 1, 2))
+        self.assertIsNone(pcm.PCMReader.open_wav(path, "s16le"), "Expected None for a truncated file.")
+
+if __name__ == "__main__":
+    unittest.main()
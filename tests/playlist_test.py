@@ -0,0 +1,66 @@
+import simple_pygame, unittest, time, os
+
+class TestPlaylist(unittest.TestCase):
+    @classmethod
+    def setUpClass(self) -> None:
+        self.file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "Sound.mp3")
+        self.successfully_initialized = simple_pygame.mixer.init((simple_pygame.MixerClass, simple_pygame.PlaylistClass))
+
+        if self.is_initialized(self):
+            self.mixer = simple_pygame.mixer.Mixer()
+
+    @classmethod
+    def tearDownClass(self) -> None:
+        if self.is_initialized(self):
+            self.mixer.terminate()
+            simple_pygame.mixer.quit((simple_pygame.MixerClass, simple_pygame.PlaylistClass))
+
+    def is_initialized(self) -> bool:
+        return simple_pygame.PlaylistClass in self.successfully_initialized
+
+    def test_attributes(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Playlist failed.")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            simple_pygame.mixer.Playlist(mixer = self.mixer, crossfade = -1)
+
+        playlist = simple_pygame.mixer.Playlist([self.file_path, self.file_path], mixer = self.mixer)
+        self.assertEqual(playlist.get_queue(), ((self.file_path, 0), (self.file_path, 0)), "Invalid queue.")
+
+        playlist.clear()
+        self.assertEqual(playlist.get_queue(), (), "Invalid queue after clearing.")
+
+    def test_play(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Playlist failed.")
+
+        try:
+            self.mixer._decoder.get_device_info()
+        except:
+            self.skipTest("No default output device found.")
+
+        playlist = simple_pygame.mixer.Playlist([self.file_path, self.file_path], mixer = self.mixer, preload = 1000)
+        playlist.play()
+
+        # The next file is preloaded right away because the preload time is longer than the file.
+        time.sleep(0.5)
+        if playlist.exception or not playlist.get_current():
+            playlist.stop()
+            self.skipTest("No ffmpeg found.")
+
+        self.assertEqual(len(self.mixer.get_sources()), 2, "Expected the next file to be preloaded.")
+        self.assertEqual(playlist.get_queue(), ((self.file_path, 0),), "Invalid queue.")
+
+        current = playlist.get_current()
+        playlist.next()
+        time.sleep(0.1)
+        self.assertIsNot(playlist.get_current(), current, "Play the next file failed.")
+        self.assertFalse(current.get_busy(), "Stop the current file failed.")
+
+        playlist.stop()
+        self.assertFalse(playlist.get_busy(), "Stop playlist failed.")
+        self.assertEqual(self.mixer.get_sources(), (), "Invalid sources after stopping.")
+
+if __name__ == "__main__":
+    unittest.main()
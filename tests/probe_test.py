@@ -0,0 +1,71 @@
+import simple_pygame.mixer.probe as probe, unittest, tempfile, struct, wave, os
+
+class TestProbe(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "wb") as file:
+            file.write(data)
+
+        return path
+
+    def create_ogg_page(self, header_type: int, granule: int, serial: int, sequence: int, packet: bytes) -> bytes:
+        return b"OggS" + struct.pack("<BBqIIIB", 0, header_type, granule, serial, sequence, 0, 1) + bytes((len(packet),)) + packet
+
+    def test_wav(self) -> None:
+        path = os.path.join(self.directory.name, "audio.wav")
+        with wave.open(path, "wb") as file:
+            file.setnchannels(2)
+            file.setsampwidth(2)
+            file.setframerate(8000)
+            file.writeframes(bytes(4000 * 4))
+
+        information = probe.probe(path)
+        stream = information["streams"][0]
+        self.assertEqual(information["format"]["format_name"], "wav", "Invalid format name.")
+        self.assertEqual((stream["codec_type"], stream["codec_name"], stream["sample_rate"], stream["channels"]), ("audio", "pcm_s16le", "8000", 2), "Invalid stream information.")
+        self.assertAlmostEqual(float(stream["duration"]), 0.5, msg = "Invalid duration.")
+        self.assertAlmostEqual(float(information["format"]["duration"]), 0.5, msg = "Invalid duration.")
+
+        with open(path, "rb") as file:
+            layout = probe.parse_wav_header(file)
+        self.assertEqual((layout["data_offset"], layout["data_size"], layout["block_align"]), (44, 16000, 4), "Invalid WAV layout.")
+
+    def test_flac(self) -> None:
+        # 44100 Hz, 2 channels, 16 bits and 88200 samples.
+        value = 44100 << 44 | (2 - 1) << 41 | (16 - 1) << 36 | 88200
+        streaminfo = bytes(10) + value.to_bytes(8, "big") + bytes(16)
+        path = self.write("audio.flac", b"ID3\x04\x00\x00\x00\x00\x00\x02" + bytes(2) + b"fLaC" + b"\x80" + len(streaminfo).to_bytes(3, "big") + streaminfo)
+
+        stream = probe.probe(path)["streams"][0]
+        self.assertEqual((stream["codec_name"], stream["sample_rate"], stream["channels"], stream["bits_per_raw_sample"]), ("flac", "44100", 2, "16"), "Invalid stream information.")
+        self.assertAlmostEqual(float(stream["duration"]), 2, msg = "Invalid duration.")
+
+    def test_ogg(self) -> None:
+        vorbis = b"\x01vorbis" + struct.pack("<IBIiiiBB", 0, 1, 22050, 0, 64000, 0, 0xb8, 1)
+        opus = b"OpusHead" + struct.pack("<BBHIhB", 1, 2, 312, 44100, 0, 0)
+        data = self.create_ogg_page(0x2, 0, 1, 0, vorbis) + self.create_ogg_page(0x2, 0, 2, 0, opus) + self.create_ogg_page(0, 22050, 1, 1, b"") + self.create_ogg_page(0x4, 48000 + 312, 2, 1, b"")
+        path = self.write("audio.ogg", data)
+
+        information = probe.probe(path)
+        self.assertEqual(information["format"]["nb_streams"], 2, "Invalid number of streams.")
+
+        vorbis_stream, opus_stream = information["streams"]
+        self.assertEqual((vorbis_stream["codec_name"], vorbis_stream["sample_rate"], vorbis_stream["channels"], vorbis_stream["bit_rate"]), ("vorbis", "22050", 1, "64000"), "Invalid Vorbis stream information.")
+        self.assertEqual((opus_stream["index"], opus_stream["codec_name"], opus_stream["sample_rate"], opus_stream["channels"]), (1, "opus", "48000", 2), "Invalid Opus stream information.")
+        self.assertAlmostEqual(float(vorbis_stream["duration"]), 1, msg = "Invalid Vorbis duration.")
+        self.assertAlmostEqual(float(opus_stream["duration"]), 1, msg = "Invalid Opus duration.")
+
+    def test_unknown(self) -> None:
+        self.assertIsNone(probe.probe(self.write("audio.mp3", b"ID3\x04\x00\x00\x00\x00\x00\x00\xff\xfb" + bytes(64))), "Expected None for an unknown container.")
+        self.assertIsNone(probe.probe(self.write("audio.ogg", self.create_ogg_page(0x2, 0, 1, 0, b"\x80theora" + bytes(34)))), "Expected None for an unknown codec.")
+        self.assertIsNone(probe.probe(self.write("audio.wav", b"RIFF" + bytes(4) + b"WAVE")), "Expected None for a WAV file without samples.")
+        self.assertIsNone(probe.probe(os.path.join(self.directory.name, "missing.wav")), "Expected None for a missing file.")
+
+if __name__ == "__main__":
+    unittest.main()
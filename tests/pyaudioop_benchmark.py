@@ -0,0 +1,148 @@
+"""
+Benchmark every `simple_pygame.mixer.pyaudioop` function against the built-in `audioop` module and print the results as JSON.
+
+Usage: python tests/pyaudioop_benchmark.py [--backend {auto,numpy,python}] [--sizes 256 4096 ...] [--widths 1 2 ...] [--functions mul rms ...] [--output results.json]
+"""
+import simple_pygame.mixer.pyaudioop as pyaudioop, argparse, json, platform, random, sys, time, warnings
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:
+    audioop = None
+
+SIZES = (256, 4096, 65536, 1048576, 4194304)
+WIDTHS = (1, 2, 3, 4)
+
+def get_cases(fragment: bytes, width: int) -> dict:
+    """
+    Return the arguments of each benchmarked function for a fragment, keyed by the function name and the number of channels. Functions that don't care about channels are only benchmarked as mono.
+    """
+    reference = fragment[len(fragment) // 2:len(fragment) // 2 + 128]
+
+    cases = {
+        ("add", 1): (fragment, fragment, width),
+        ("adpcm2lin", 1): (fragment, width, None),
+        ("alaw2lin", 1): (fragment, width),
+        ("analyze", 1): (fragment, width, 1),
+        ("analyze", 2): (fragment, width, 2),
+        ("avg", 1): (fragment, width),
+        ("avgpp", 1): (fragment, width),
+        ("bias", 1): (fragment, width, 12345),
+        ("byteswap", 1): (fragment, width),
+        ("cross", 1): (fragment, width),
+        ("getsample", 1): (fragment, width, len(fragment) // width // 2),
+        ("lin2adpcm", 1): (fragment, width, None),
+        ("lin2alaw", 1): (fragment, width),
+        ("lin2lin", 1): (fragment, width, width % 4 + 1),
+        ("lin2ulaw", 1): (fragment, width),
+        ("max", 1): (fragment, width),
+        ("maxpp", 1): (fragment, width),
+        ("minmax", 1): (fragment, width),
+        ("mul", 1): (fragment, width, 0.5),
+        ("ratecv", 1): (fragment, width, 1, 44100, 48000, None),
+        ("ratecv", 2): (fragment, width, 2, 44100, 48000, None),
+        ("reverse", 1): (fragment, width),
+        ("rms", 1): (fragment, width),
+        ("tomono", 2): (fragment, width, 0.5, 0.5),
+        ("tostereo", 1): (fragment, width, 0.5, 0.5),
+        ("ulaw2lin", 1): (fragment, width)
+    }
+
+    # These only support 16-bit samples.
+    if width == 2:
+        cases[("findfactor", 1)] = (fragment, fragment[::-1])
+        cases[("findfit", 1)] = (fragment, reference)
+        cases[("findmax", 1)] = (fragment, len(reference) // 2)
+
+    return cases
+
+def measure(function, args: tuple, min_time: float, repeat: int) -> float:
+    """
+    Return the best time in seconds of one call, out of `repeat` batches that each run for at least `min_time` seconds.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function(*args)
+        elapsed = time.perf_counter() - start
+
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9)) + 1)
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function(*args)
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    return best
+
+def get_throughput(size: int, seconds: float) -> float:
+    return size / seconds / 1e6 if seconds > 0 else float("inf")
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description = "Benchmark pyaudioop against the built-in audioop module.")
+    parser.add_argument("--backend", choices = ("auto", "numpy", "python"), default = "auto", help = "pyaudioop backend to benchmark (default: numpy if it's installed)")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = SIZES, help = "fragment sizes in bytes")
+    parser.add_argument("--widths", type = int, nargs = "+", default = WIDTHS, choices = WIDTHS, help = "sample widths in bytes")
+    parser.add_argument("--functions", nargs = "+", help = "only benchmark these functions")
+    parser.add_argument("--min-time", type = float, default = 0.05, help = "minimum time in seconds of each timed batch")
+    parser.add_argument("--repeat", type = int, default = 3, help = "number of timed batches, the best one is reported")
+    parser.add_argument("--output", help = "write the JSON results to this file instead of stdout")
+    arguments = parser.parse_args(argv)
+
+    if arguments.backend == "numpy" and pyaudioop._np is None:
+        parser.error("numpy isn't installed")
+    elif arguments.backend == "python":
+        pyaudioop._np = None
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": "python" if pyaudioop._np is None else "numpy",
+        "numpy": None if pyaudioop._np is None else pyaudioop._np.__version__,
+        "audioop": audioop is not None,
+        "results": []
+    }
+
+    generator = random.Random(0)
+    for size in arguments.sizes:
+        fragment = bytes(generator.getrandbits(8) for _ in range(size))
+
+        for width in arguments.widths:
+            if size % (width * 2) != 0:
+                continue
+
+            for (function_name, channels), args in sorted(get_cases(fragment, width).items()):
+                if arguments.functions and function_name not in arguments.functions:
+                    continue
+
+                print(f"{function_name} width={width} channels={channels} size={size}", file = sys.stderr)
+
+                seconds = measure(getattr(pyaudioop, function_name), args, arguments.min_time, arguments.repeat)
+                result = {"function": function_name, "width": width, "channels": channels, "size": size, "seconds": seconds, "mb_per_s": get_throughput(size, seconds), "audioop_seconds": None, "audioop_mb_per_s": None, "ratio": None}
+
+                if audioop is not None and hasattr(audioop, function_name):
+                    audioop_seconds = measure(getattr(audioop, function_name), args, arguments.min_time, arguments.repeat)
+
+                    # The ratio is the pyaudioop throughput relative to audioop, so values below 1 mean pyaudioop is slower.
+                    result.update(audioop_seconds = audioop_seconds, audioop_mb_per_s = get_throughput(size, audioop_seconds), ratio = audioop_seconds / seconds if seconds > 0 else None)
+
+                report["results"].append(result)
+
+    output = json.dumps(report, indent = 4)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    return report
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+import simple_pygame.mixer.pyaudioop as pyaudioop, unittest, warnings, random
+from unittest import mock
+
+try:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+except ImportError:
+    audioop = None
+
+class TestPyaudioop(unittest.TestCase):
+    @classmethod
+    def setUpClass(self) -> None:
+        generator = random.Random(0)
+        self.fragments = {width: bytes(generator.getrandbits(8) for _ in range(width * 512)) for width in range(1, 5)}
+
+    def has_numpy(self) -> bool:
+        return pyaudioop._np != None
+
+    def assertSameAsAudioop(self, function_name, *args) -> None:
+        with mock.patch.object(pyaudioop, "_np", None):
+            result = getattr(pyaudioop, function_name)(*args)
+
+        self.assertEqual(result, getattr(audioop, function_name)(*args), f"Invalid {function_name}() result.")
+
+    def assertSameResults(self, function, *args) -> None:
+        result = function(*args)
+        with mock.patch.object(pyaudioop, "_np", None):
+            expected_result = function(*args)
+
+        self.assertEqual(result, expected_result, f"Invalid {function.__name__}() result.")
+
+    def test_numpy_backend(self) -> None:
+        if not self.has_numpy():
+            self.skipTest("No numpy found.")
+
+        for width, fragment in self.fragments.items():
+            for function in (pyaudioop.avg, pyaudioop.avgpp, pyaudioop.byteswap, pyaudioop.cross, pyaudioop.max, pyaudioop.maxpp, pyaudioop.minmax, pyaudioop.reverse, pyaudioop.rms):
+                self.assertSameResults(function, fragment, width)
+                self.assertSameResults(function, b"", width)
+
+            self.assertSameResults(pyaudioop.add, fragment, pyaudioop.reverse(fragment, width), width)
+            self.assertSameResults(pyaudioop.bias, fragment, width, 12345)
+            self.assertSameResults(pyaudioop.bias, fragment, width, -(1 << 40))
+            self.assertSameResults(pyaudioop.mul, fragment, width, 0.37)
+            self.assertSameResults(pyaudioop.mul, fragment, width, -2)
+            self.assertSameResults(pyaudioop.tomono, fragment, width, 0.6, 0.9)
+            self.assertSameResults(pyaudioop.tostereo, fragment, width, 1.5, -0.25)
+
+            for new_width in range(1, 5):
+                self.assertSameResults(pyaudioop.lin2lin, fragment, width, new_width)
+
+            for function in (pyaudioop.alaw2lin, pyaudioop.lin2alaw, pyaudioop.lin2ulaw, pyaudioop.ulaw2lin):
+                self.assertSameResults(function, fragment, width)
+
+    def test_mul_out(self) -> None:
+        for width, fragment in self.fragments.items():
+            buffer = bytearray(fragment)
+            self.assertIs(pyaudioop.mul(buffer, width, 0.37, buffer), buffer, "Invalid mul() return value.")
+            self.assertEqual(buffer, pyaudioop.mul(fragment, width, 0.37), "Invalid mul() result.")
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.mul(fragment, 1, 0.5, bytearray(1))
+
+    def test_int24(self) -> None:
+        def pack(samples):
+            buffer = bytearray(len(samples) * 3)
+            for index, sample in enumerate(samples):
+                pyaudioop._pack_int24(buffer, index * 3, sample)
+            return bytes(buffer)
+
+        def unpack(fragment):
+            return [pyaudioop._unpack_int24(fragment[index:index + 3]) for index in range(0, len(fragment), 3)]
+
+        def clip(samples):
+            return [min(max(sample, -0x800000), 0x7fffff) for sample in samples]
+
+        samples = [0, 1, -1, 0x7fffff, -0x800000, 0x7ffffe, -0x7fffff, 0x400000, -0x400001, 12345, -12345, 0x800000 - 256]
+        fragment = pack(samples)
+        other_fragment = pack(samples[::-1])
+
+        self.assertEqual(pyaudioop._unpack_int24_samples(fragment), samples, "Invalid 24-bit samples.")
+        self.assertEqual(pyaudioop._pack_int24_samples(samples), fragment, "Invalid 24-bit fragment.")
+        self.assertEqual(unpack(self.fragments[3]), pyaudioop._unpack_int24_samples(self.fragments[3]), "Invalid 24-bit samples.")
+        self.assertEqual(pyaudioop._pack_int24_samples(unpack(self.fragments[3])), self.fragments[3], "Invalid 24-bit round trip.")
+
+        for numpy in (True, False):
+            if numpy and not self.has_numpy():
+                continue
+
+            with mock.patch.object(pyaudioop, "_np", pyaudioop._np if numpy else None):
+                for factor in (0.5, -1, 2, -0.37):
+                    self.assertEqual(pyaudioop.mul(fragment, 3, factor), pack(clip([int(sample * factor) for sample in samples])), "Invalid mul() result.")
+
+                self.assertEqual(pyaudioop.add(fragment, other_fragment, 3), pack(clip([sample_1 + sample_2 for sample_1, sample_2 in zip(samples, samples[::-1])])), "Invalid add() result.")
+                self.assertEqual(pyaudioop.add(fragment, fragment, 3), pack(clip([sample * 2 for sample in samples])), "Invalid add() result.")
+
+                self.assertEqual(pyaudioop.lin2lin(fragment, 3, 4), b"".join((sample << 8).to_bytes(4, pyaudioop._byteorder, signed = True) for sample in samples), "Invalid lin2lin() result.")
+                self.assertEqual(pyaudioop.lin2lin(fragment, 3, 2), b"".join((sample >> 8).to_bytes(2, pyaudioop._byteorder, signed = True) for sample in samples), "Invalid lin2lin() result.")
+                self.assertEqual(unpack(pyaudioop.lin2lin(pyaudioop.lin2lin(fragment, 3, 4), 4, 3)), samples, "Invalid lin2lin() round trip.")
+
+    def test_audioop_compatibility(self) -> None:
+        if audioop == None:
+            self.skipTest("No audioop found.")
+
+        for width, fragment in self.fragments.items():
+            for function_name in ("avg", "avgpp", "byteswap", "cross", "max", "maxpp", "minmax", "reverse", "rms"):
+                self.assertSameAsAudioop(function_name, fragment, width)
+
+            self.assertSameAsAudioop("add", fragment, audioop.reverse(fragment, width), width)
+            self.assertSameAsAudioop("bias", fragment, width, -12345)
+            self.assertSameAsAudioop("mul", fragment, width, 3)
+            self.assertSameAsAudioop("tostereo", fragment, width, 2, -1)
+
+            for new_width in range(1, 5):
+                self.assertSameAsAudioop("lin2lin", fragment, width, new_width)
+
+    def test_codecs(self) -> None:
+        if audioop == None:
+            self.skipTest("No audioop found.")
+
+        for width, fragment in self.fragments.items():
+            for function_name in ("lin2alaw", "lin2ulaw"):
+                self.assertSameAsAudioop(function_name, fragment, width)
+
+            for function_name in ("alaw2lin", "ulaw2lin"):
+                self.assertSameAsAudioop(function_name, bytes(range(256)), width)
+
+            state = None
+            for _ in range(2):
+                self.assertSameAsAudioop("lin2adpcm", fragment, width, state)
+                encoded_fragment, state = audioop.lin2adpcm(fragment, width, state)
+                self.assertSameAsAudioop("adpcm2lin", encoded_fragment, width, state)
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            pyaudioop.adpcm2lin(b"", 2, (0, 89))
+
+    def test_analyze(self) -> None:
+        def get_statistics(fragment, width):
+            minimum, maximum = pyaudioop.minmax(fragment, width)
+            return {"minimum": minimum, "maximum": maximum, "peak": pyaudioop.max(fragment, width), "average": pyaudioop.avg(fragment, width), "rms": pyaudioop.rms(fragment, width), "maxpp": pyaudioop.maxpp(fragment, width), "avgpp": pyaudioop.avgpp(fragment, width), "crossings": pyaudioop.cross(fragment, width)}
+
+        for width, fragment in self.fragments.items():
+            for channels in (1, 2, 4):
+                frames = [fragment[index:index + width] for index in range(0, len(fragment), width)]
+                expected_result = get_statistics(fragment, width)
+                expected_result["channels"] = [get_statistics(b"".join(frames[channel::channels]), width) for channel in range(channels)]
+
+                self.assertEqual(pyaudioop.analyze(fragment, width, channels), expected_result, "Invalid analyze() result.")
+
+                analyzer = pyaudioop.Analyzer(width, channels)
+                for start, end in ((0, 0), (0, width * channels), (width * channels, width * channels * 7), (width * channels * 7, len(fragment))):
+                    analyzer.update(fragment[start:end])
+                self.assertEqual(analyzer.get_result(True), expected_result, "Invalid Analyzer result.")
+
+                analyzer.update(fragment)
+                self.assertEqual(analyzer.get_result()["crossings"], pyaudioop.cross(fragment + fragment, width) - pyaudioop.cross(fragment, width), "Invalid Analyzer result after a reset.")
+
+            if self.has_numpy():
+                self.assertSameResults(pyaudioop.analyze, fragment, width, 2)
+
+        self.assertEqual(pyaudioop.analyze(b"", 2)["crossings"], -1, "Invalid analyze() result.")
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.analyze(bytes(6), 2, 2)
+
+    def test_find(self) -> None:
+        if audioop == None:
+            self.skipTest("No audioop found.")
+
+        fragment = self.fragments[2]
+        for reference in (fragment[200:400], pyaudioop.mul(fragment[600:640], 2, 0.5)):
+            for function in (self.assertSameAsAudioop, self.assertSameResults):
+                function("findfit" if function == self.assertSameAsAudioop else pyaudioop.findfit, fragment, reference)
+                function("findfit" if function == self.assertSameAsAudioop else pyaudioop.findfit, bytes(len(fragment)), reference)
+
+        for reference in (fragment, pyaudioop.reverse(fragment, 2)):
+            self.assertSameAsAudioop("findfactor", fragment, reference)
+            self.assertSameResults(pyaudioop.findfactor, fragment, reference)
+
+        for length in (0, 1, 100, len(fragment) // 2):
+            self.assertSameAsAudioop("findmax", fragment, length)
+            self.assertSameResults(pyaudioop.findmax, fragment, length)
+
+        if self.has_numpy():
+            # Long enough to use the FFT cross-correlation.
+            fragment = bytes(random.Random(1).getrandbits(8) for _ in range(2 * 8192))
+            self.assertEqual(pyaudioop.findfit(fragment, fragment[4000:6000]), audioop.findfit(fragment, fragment[4000:6000]), "Invalid findfit() result.")
+
+    def test_pipeline(self) -> None:
+        for width, fragment in self.fragments.items():
+            for operations in ([("mul", 0.25), ("bias", 1 << (width * 8 - 4)), ("mul", 1.7), ("tomono", 0.5, 0.5), ("lin2lin", 1)], [("mul", 0.3), ("tostereo", 1, -1), ("reverse",), ("lin2lin", 4), ("bias", -5)], []):
+                expected_result, new_width = fragment, width
+                for name, *arguments in operations:
+                    expected_result = getattr(pyaudioop, name)(expected_result, new_width, *arguments)
+                    new_width = arguments[0] if name == "lin2lin" else new_width
+
+                pipeline = pyaudioop.Pipeline(width, operations)
+                self.assertEqual(pipeline.out_width, new_width, "Invalid Pipeline output width.")
+                self.assertEqual(pipeline.process(fragment), expected_result, "Invalid Pipeline result.")
+
+                if self.has_numpy():
+                    self.assertSameResults(pipeline.process, fragment)
+
+            # Intermediate samples are only clipped at the end.
+            self.assertEqual(pyaudioop.Pipeline(width, [("mul", 4), ("mul", 0.25)]).process(fragment), fragment, "Invalid Pipeline result.")
+
+        buffer = bytearray(self.fragments[2])
+        self.assertIs(pyaudioop.Pipeline(2, [("mul", 0.5)]).process(buffer, buffer), buffer, "Invalid Pipeline return value.")
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.Pipeline(2, [("add", b"")])
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.Pipeline(2, [("mul",)])
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.Pipeline(2, [("tomono", 1, 1)]).process(bytes(2))
+
+    def test_mix(self) -> None:
+        for width, fragment in self.fragments.items():
+            other_fragment = pyaudioop.reverse(fragment, width)
+
+            samples = [int(pyaudioop.getsample(fragment, width, index) * 0.5 + pyaudioop.getsample(other_fragment, width, index) * 0.25) for index in range(len(fragment) // width)]
+            expected_result = pyaudioop._put_samples(pyaudioop._clip_samples(samples, width), width)
+            self.assertEqual(pyaudioop.mix([fragment, other_fragment], width, [0.5, 0.25]), expected_result, "Invalid mix result.")
+
+            left = pyaudioop.tomono(fragment, width, 0.5, 0)
+            right = pyaudioop.tomono(fragment, width, 0, 2)
+            expected_result = pyaudioop.add(pyaudioop.tostereo(left, width, 1, 0), pyaudioop.tostereo(right, width, 0, 1), width)
+            self.assertEqual(pyaudioop.mix([fragment], width, [(0.5, 2)], 2), expected_result, "Invalid stereo mix result.")
+
+            # Samples are only clipped at the end.
+            self.assertEqual(pyaudioop.mix([fragment, fragment, fragment], width, [1, 1, -1]), fragment, "Invalid mix result.")
+
+            if self.has_numpy():
+                self.assertSameResults(pyaudioop.mix, [fragment, other_fragment], width, [(0.3, -0.7), 1.5], 2)
+
+        self.assertEqual(pyaudioop.mix([], 2, out = bytearray(4)), bytes(4), "Invalid mix of no fragments.")
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.mix([bytes(4), bytes(2)], 2)
+
+        with self.assertRaises(pyaudioop.error, msg = "Expected pyaudioop.error."):
+            pyaudioop.mix([bytes(4)], 2, [(1, 1, 1)], 2)
+
+    def test_ratecv(self) -> None:
+        if audioop == None:
+            self.skipTest("No audioop found.")
+
+        for width, fragment in self.fragments.items():
+            for in_rate, out_rate, weight_A, weight_B in ((44100, 48000, 1, 0), (48000, 22050, 1, 0), (8000, 44100, 2, 1)):
+                state, expected_state = None, None
+                for start in range(0, len(fragment), width * 2 * 100):
+                    result, state = pyaudioop.ratecv(fragment[start:start + width * 2 * 100], width, 2, in_rate, out_rate, state, weight_A, weight_B)
+                    expected_result, expected_state = audioop.ratecv(fragment[start:start + width * 2 * 100], width, 2, in_rate, out_rate, expected_state, weight_A, weight_B)
+
+                    self.assertEqual(result, expected_result, "Invalid ratecv() result.")
+                    self.assertEqual(state, expected_state, "Invalid ratecv() state.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import simple_pygame, unittest, struct, random, math
+from simple_pygame.mixer import pyaudioop
+from simple_pygame.mixer.resampler import Resampler
+
+class TestResampler(unittest.TestCase):
+    @classmethod
+    def setUpClass(self) -> None:
+        self.in_rate, self.out_rate, self.frame_count = 44100, 48000, 4410
+        samples = [int(10000 * math.sin(2 * math.pi * 1000 * index / self.in_rate)) for index in range(self.frame_count)]
+        self.fragment = struct.pack(f"{self.frame_count * 2}h", *(sample for sample in samples for _ in range(2)))
+
+    def process_in_chunks(self, resampler: Resampler) -> bytes:
+        generator = random.Random(0)
+        result, start = [], 0
+
+        while start < len(self.fragment):
+            end = start + generator.randint(0, 500) * 4
+            result.append(resampler.process(self.fragment[start:end]))
+            start = end
+
+        result.append(resampler.flush())
+        return b"".join(result)
+
+    def test_linear(self) -> None:
+        resampler = Resampler(self.in_rate, self.out_rate)
+        self.assertEqual(self.process_in_chunks(resampler), pyaudioop.ratecv(self.fragment, 2, 2, self.in_rate, self.out_rate, None)[0], "Invalid resampled fragment.")
+        self.assertEqual(resampler.state, None, "Invalid state.")
+
+    def test_sinc(self) -> None:
+        resampler = Resampler(self.in_rate, self.out_rate, quality = simple_pygame.SincInterpolation)
+        result = resampler.process(self.fragment) + resampler.flush()
+
+        self.assertEqual(len(result) // 4, math.ceil(self.frame_count * self.out_rate / self.in_rate), "Invalid number of frames.")
+        self.assertEqual(self.process_in_chunks(resampler), result, "Resampling in chunks must give the same result.")
+
+        samples = struct.unpack(f"{len(result) // 2}h", result)[0::2]
+        for index in range(100, len(samples) - 100):
+            self.assertAlmostEqual(samples[index], 10000 * math.sin(2 * math.pi * 1000 * index / self.out_rate), delta = 5, msg = "Invalid resampled sample.")
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            Resampler(0, self.out_rate)
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            Resampler(self.in_rate, self.out_rate, width = 5)
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            Resampler(self.in_rate, self.out_rate, quality = "quality")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            Resampler(self.in_rate, self.out_rate).process(b"\x00")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import simple_pygame, unittest, time, os
+from unittest import mock
+
+class TestSound(unittest.TestCase):
+    @classmethod
+    def setUpClass(self) -> None:
+        self.file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "Sound.mp3")
+        self.successfully_initialized = simple_pygame.mixer.init((simple_pygame.MixerClass, simple_pygame.SoundClass))
+
+        if self.is_initialized(self):
+            self.mixer = simple_pygame.mixer.Mixer()
+
+    @classmethod
+    def tearDownClass(self) -> None:
+        if self.is_initialized(self):
+            self.mixer.terminate()
+            simple_pygame.mixer.quit((simple_pygame.MixerClass, simple_pygame.SoundClass))
+
+    def is_initialized(self) -> bool:
+        return simple_pygame.SoundClass in self.successfully_initialized
+
+    def create_sound(self, *args, **kwargs) -> "simple_pygame.mixer.Sound":
+        try:
+            return simple_pygame.mixer.Sound(*args, mixer = self.mixer, **kwargs)
+        except simple_pygame.FFmpegError:
+            self.skipTest("No ffmpeg found.")
+        except simple_pygame.FFprobeError:
+            self.skipTest("No ffprobe found.")
+
+    def test_decode(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Sound failed.")
+
+        with self.assertRaises(ValueError, msg = "Expected ValueError."):
+            simple_pygame.mixer.Sound(self.file_path, max_voices = 0, mixer = self.mixer)
+
+        with self.assertRaises(TypeError, msg = "Expected TypeError."):
+            simple_pygame.mixer.Sound(self.file_path, steal = 1, mixer = self.mixer)
+
+        sound = self.create_sound(self.file_path)
+        self.assertEqual(len(sound.get_raw()) % self.mixer.frame_size, 0, "The decoded audio must contain whole frames.")
+        self.assertAlmostEqual(sound.get_length(), len(sound.get_raw()) / self.mixer.frame_size / self.mixer.sample_rate, msg = "Invalid length.")
+
+    def test_voices(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Sound failed.")
+
+        try:
+            self.mixer._decoder.get_device_info()
+        except:
+            self.skipTest("No default output device found.")
+
+        sound = self.create_sound(self.file_path, max_voices = 2)
+        voices = [sound.play(volume = 0.1) for _ in range(3)]
+
+        self.assertFalse(voices[0].get_busy(), "Expected the oldest voice to be stolen.")
+        self.assertEqual(sound.get_voices(), (*voices[1:],), "Invalid voices.")
+
+        sound.steal = False
+        self.assertIsNone(sound.play(), "Expected no voice when stealing is disabled.")
+
+        voices[1].set_position(1)
+        self.assertEqual(voices[1].get_position(), 1, "Invalid voice position.")
+
+        sound.stop()
+        self.assertEqual(sound.get_voices(), (), "Invalid voices after stopping.")
+
+    def test_chain(self) -> None:
+        if not self.is_initialized():
+            self.skipTest("Initialize simple_pygame.mixer.Sound failed.")
+
+        writes = []
+        stream = mock.Mock()
+        stream.write.side_effect = lambda data: writes.append(bytes(data))
+
+        mixer = simple_pygame.mixer.Mixer()
+        context = mixer._decoder._pyaudio_context
+        with mock.patch.object(context, "open", return_value = stream), mock.patch.object(context, "close"):
+            try:
+                sound = simple_pygame.mixer.Sound(self.file_path, mixer = mixer)
+            except (simple_pygame.FFmpegError, simple_pygame.FFprobeError):
+                mixer.terminate()
+                self.skipTest("No ffmpeg/ffprobe found.")
+
+            data = sound.get_raw()
+            tail = data[-(mixer.chunk // 2 - mixer.chunk // 2 % mixer.frame_size):]
+
+            # The first voice only plays a part of a chunk, so the second one must start inside that chunk.
+            voice = simple_pygame.mixer.sound.Voice(sound, 0, 1, 0)
+            voice.seek(sound.get_length() - len(tail) / mixer.frame_size / mixer.sample_rate)
+            next_voice = simple_pygame.mixer.sound.Voice(sound, 0, 1, 0)
+            next_voice.seek(0)
+
+            mixer.chain(voice, next_voice)
+            mixer.add(next_voice)
+            mixer.add(voice)
+
+            deadline = time.monotonic() + 10
+            while next_voice.get_busy() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            mixer.terminate()
+
+        self.assertEqual(voice._read_size, len(tail), "Invalid size of the last read.")
+        self.assertEqual(b"".join(writes)[:len(tail) + len(data)], tail + data, "Expected the next voice to start right after the first one.")
+
+if __name__ == "__main__":
+    unittest.main()